@@ -3,15 +3,29 @@
 import sqlite3
 import random
 
+# 성능 설정(PERFORMANCE_PRAGMAS, fast=True 일 때 적용)과 한 트랜잭션에 넣을 행 수(CHUNK_SIZE)는
+# 다른 제품 DB 프로그램과 같은 값을 사용 (product_repository.py)
+from product_repository import CHUNK_SIZE, PERFORMANCE_PRAGMAS, chunks
+
 # 제품 데이터베이스 관리 클래스
 class ProductDB:
-    def __init__(self, db_name="MyProduct.db"):
+    def __init__(self, db_name="MyProduct.db", fast=False):
         """
         데이터베이스 연결 및 테이블 생성
+        fast=True 이면 PERFORMANCE_PRAGMAS 적용
         """
         self.conn = sqlite3.connect(db_name)  # DB 파일 연결
+        if fast:
+            self.apply_pragmas(PERFORMANCE_PRAGMAS)
         self.create_table()  # 테이블 생성
 
+    def apply_pragmas(self, pragmas):
+        """
+        PRAGMA 설정 적용
+        """
+        for name, value in pragmas.items():
+            self.conn.execute(f"PRAGMA {name}={value};")
+
     def create_table(self):
         """
         Products 테이블 생성 (productID: 자동 증가, productName, productPrice)
@@ -58,6 +72,43 @@ class ProductDB:
         self.conn.execute(query, (productID,))
         self.conn.commit()
 
+    def execute_chunked(self, query, rows, chunk_size=CHUNK_SIZE):
+        """
+        rows 를 chunk_size 개씩 executemany 로 실행하고 chunk 마다 한 번만 커밋
+        반환값: 바뀐 행 수
+        """
+        count = 0
+        for chunk in chunks(rows, chunk_size):
+            with self.conn:  # chunk 하나 = 트랜잭션 하나 (오류 시 그 chunk 만 롤백)
+                count += self.conn.executemany(query, chunk).rowcount
+        return count
+
+    def insert_many(self, products, chunk_size=CHUNK_SIZE):
+        """
+        제품 여러 개 삽입
+        products: (productName, productPrice) 를 내는 iterable (제너레이터 가능)
+        """
+        query = "INSERT INTO Products (productName, productPrice) VALUES (?, ?);"
+        return self.execute_chunked(query, products, chunk_size)
+
+    def update_many(self, products, chunk_size=CHUNK_SIZE):
+        """
+        제품 여러 개 수정
+        products: (productID, productName, productPrice) 를 내는 iterable
+        update_product 처럼 None 인 값은 바꾸지 않음
+        """
+        query = ("UPDATE Products SET productName=COALESCE(?, productName), "
+                 "productPrice=COALESCE(?, productPrice) WHERE productID=?;")
+        rows = ((name, price, pid) for pid, name, price in products)
+        return self.execute_chunked(query, rows, chunk_size)
+
+    def delete_many(self, productIDs, chunk_size=CHUNK_SIZE):
+        """
+        제품 여러 개 삭제
+        """
+        query = "DELETE FROM Products WHERE productID=?;"
+        return self.execute_chunked(query, ((pid,) for pid in productIDs), chunk_size)
+
     def select_products(self, limit=10):
         """
         제품 데이터 조회 (limit 개수만큼 반환)
@@ -74,17 +125,17 @@ class ProductDB:
 
 # 메인 실행부
 if __name__ == "__main__":
-    db = ProductDB()  # DB 객체 생성
+    db = ProductDB(fast=True)  # DB 객체 생성 (성능 설정 적용)
 
-    # 샘플 데이터 10만개 삽입
+    # 샘플 데이터 10만개 삽입 (1만개씩 한 트랜잭션)
     sample_count = 100_000
+    chunk_size = 10_000
     print("샘플 데이터 삽입 중...")
-    for i in range(sample_count):
-        name = f"전자제품_{i+1}"  # 제품명 생성
-        price = random.randint(10000, 500000)  # 가격 랜덤 생성
-        db.insert_product(name, price)  # DB에 삽입
-        if (i+1) % 10000 == 0:
-            print(f"{i+1}개 삽입 완료")  # 진행상황 출력
+    for start in range(0, sample_count, chunk_size):
+        rows = ((f"전자제품_{i+1}", random.randint(10000, 500000))  # 제품명, 가격 랜덤 생성
+                for i in range(start, start + chunk_size))
+        db.insert_many(rows, chunk_size)  # DB에 삽입
+        print(f"{start + chunk_size}개 삽입 완료")  # 진행상황 출력
 
     print("샘플 데이터 삽입 완료!")
 
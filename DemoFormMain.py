@@ -3,9 +3,8 @@
 import sys
 from PyQt5 import uic
 from PyQt5.QtWidgets import *
-from bs4 import BeautifulSoup
-#웹서버 요청
-import urllib.request
+#웹서버 요청 (board_sites.py 참고)
+from board_sites import fetch_clien_titles
 
 
 #UI파일 연결
@@ -22,19 +21,10 @@ class DemoForm(QMainWindow, form_class):
         #파일로 저장
         f = open("clien.txt", "wt", encoding="utf-8")
 
-        #10개 페이지 처리:페이지 처리
-        for i in range(0,10):
-            url = "https://www.clien.net/service/board/sold?&od=T31&category=0&po=" + str(i) #i는 정수값
-            print(url)
-            page = urllib.request.urlopen(url)
-            soup = BeautifulSoup(page, "html.parser")
-
-            #검색
-            list = soup.find_all("span", attrs={"data-role":"list-title-text"})
-            for tag in list:
-                title = tag.text.strip()
-                print(title)
-                f.write(title + "\n")
+        #10개 페이지 처리:페이지 처리 (동시에 요청, 결과는 페이지 순서대로)
+        for title in fetch_clien_titles(range(0,10)):
+            print(title)
+            f.write(title + "\n")
 
             #원하는 데이터 추출
 
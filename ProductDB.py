@@ -1,57 +1,173 @@
 import sqlite3
 
+from memory_db import SNAPSHOT_INTERVAL, MemoryDatabase
+from product_import import import_file
+from product_repository import CHUNK_SIZE, PERFORMANCE_PRAGMAS, PRODUCT_DB, ProductRepository
+from product_search import ProductSearch
+
+# page_products 의 범위 조회용 커버링 인덱스 (처음 쓸 때 만듦)
+# (정렬 컬럼, productID) 순서라 정렬 없이 인덱스 순서대로 이어 읽고, 나머지 컬럼까지 들어 있어 테이블을 읽지 않음
+INDEXES = {
+    'price': 'CREATE INDEX IF NOT EXISTS idx_products_price ON Products (productPrice, productID, productName);',
+    'name': 'CREATE INDEX IF NOT EXISTS idx_products_name ON Products (productName, productID, productPrice);',
+}
+
+
 class ProductDB:
-    def __init__(self, db_name='MyProduct.db'):
-        self.conn = sqlite3.connect(db_name)
+    def __init__(self, db_name='MyProduct.db', fast=False, memory=False,
+                 snapshot_interval=SNAPSHOT_INTERVAL):
+        """memory=True : 파일을 메모리로 올려서 쓰고 snapshot_interval 초마다, 닫을 때,
+        snapshot() 을 부를 때 파일로 저장 (memory_db.py 참고, None 이면 주기 저장 안 함)"""
+        self.memory = None
+        if memory:
+            self.memory = MemoryDatabase(db_name)
+            self.conn = self.memory.conn
+        else:
+            self.conn = sqlite3.connect(db_name, isolation_level=None)
+        if fast:
+            self.apply_pragmas(PERFORMANCE_PRAGMAS)
+        # 실제 SQL 은 공용 저장소(product_repository.py)에서 처리
+        self.repo = ProductRepository(self.conn, PRODUCT_DB,
+                                      lock=self.memory.lock if memory else None)
+        if memory:
+            self.repo.subscribe(self.memory.mark_dirty)
+            if snapshot_interval:
+                self.memory.start_snapshots(snapshot_interval)
+        self._indexes = set()
         self.create_table()
 
+    def apply_pragmas(self, pragmas):
+        for name, value in pragmas.items():
+            self.conn.execute(f'PRAGMA {name}={value};')
+
     def create_table(self):
-        query = '''
-        CREATE TABLE IF NOT EXISTS Products (
-            productID INTEGER PRIMARY KEY AUTOINCREMENT,
-            productName TEXT NOT NULL,
-            productPrice INTEGER NOT NULL
-        );
-        '''
-        self.conn.execute(query)
-        self.conn.commit()
+        self.repo.create_table()
 
     def insert_product(self, productName, productPrice):
-        query = 'INSERT INTO Products (productName, productPrice) VALUES (?, ?);'
-        self.conn.execute(query, (productName, productPrice))
-        self.conn.commit()
+        return self.repo.add(productName, productPrice)
 
     def update_product(self, productID, productName=None, productPrice=None):
-        if productName is not None and productPrice is not None:
-            query = 'UPDATE Products SET productName=?, productPrice=? WHERE productID=?;'
-            self.conn.execute(query, (productName, productPrice, productID))
-        elif productName is not None:
-            query = 'UPDATE Products SET productName=? WHERE productID=?;'
-            self.conn.execute(query, (productName, productID))
-        elif productPrice is not None:
-            query = 'UPDATE Products SET productPrice=? WHERE productID=?;'
-            self.conn.execute(query, (productPrice, productID))
-        self.conn.commit()
+        if productName is None and productPrice is None:
+            return
+        self.repo.update(productID, productName, productPrice)
 
     def delete_product(self, productID):
-        query = 'DELETE FROM Products WHERE productID=?;'
-        self.conn.execute(query, (productID,))
-        self.conn.commit()
+        self.repo.delete(productID)
+
+    def get_product(self, productID):
+        return self.repo.get(productID)
+
+    def insert_many(self, products, chunk_size=CHUNK_SIZE):
+        """products : (productName, productPrice) 를 내는 iterable
+        chunk_size 개씩 executemany 하고 chunk 마다 한 번 커밋"""
+        return self.repo.add_many(products, chunk_size)
+
+    def update_many(self, products, chunk_size=CHUNK_SIZE):
+        """products : (productID, productName, productPrice) 를 내는 iterable
+        update_product 처럼 None 인 값은 바꾸지 않음"""
+        return self.repo.update_many(products, chunk_size)
+
+    def delete_many(self, productIDs, chunk_size=CHUNK_SIZE):
+        return self.repo.delete_many(productIDs, chunk_size)
+
+    def import_products(self, path, **kwargs):
+        """CSV / xlsx 파일에서 제품 가져오기 (product_import.import_file 참고)"""
+        return import_file(self.repo, path, **kwargs)
+
+    def search_products(self, term, limit=100):
+        """제품명에 term 이 들어간 제품 (관련도 순). 처음 부를 때 검색 색인을 만듦"""
+        search = ProductSearch(self.conn, 'Products', 'productID', 'productName',
+                               ['productID', 'productName', 'productPrice'])
+        search.ensure_index()
+        return search.search(term, limit)
+
+    def ensure_index(self, name):
+        """INDEXES 의 인덱스를 (없으면) 만든다"""
+        if name not in self._indexes:
+            with self.repo.transaction() as conn:
+                conn.execute(INDEXES[name])
+            self._indexes.add(name)
+
+    def page_query(self, after=None, page_size=100, min_price=None, max_price=None, name_prefix=None):
+        """page_products 가 실행할 (SQL, 인자). 필요한 인덱스도 여기서 만든다"""
+        conditions, params = [], []
+        if name_prefix:
+            # 이름 앞부분 범위 : prefix <= 이름 < prefix 의 마지막 글자 + 1
+            self.ensure_index('name')
+            order = ('productName', 1)
+            conditions.append('productName >= ? AND productName < ?')
+            params += [name_prefix, name_prefix[:-1] + chr(ord(name_prefix[-1]) + 1)]
+        elif min_price is not None or max_price is not None:
+            self.ensure_index('price')
+            order = ('productPrice', 2)
+        else:
+            order = None
+        if min_price is not None:
+            conditions.append('productPrice >= ?')
+            params.append(min_price)
+        if max_price is not None:
+            conditions.append('productPrice <= ?')
+            params.append(max_price)
+
+        # 앞 페이지의 마지막 행 다음부터 (OFFSET 없이 인덱스에서 바로 이어 읽음)
+        if after is not None:
+            if order is None:
+                conditions.append('productID > ?')
+                params.append(after if isinstance(after, int) else after[0])
+            else:
+                conditions.append(f'({order[0]}, productID) > (?, ?)')
+                params += [after[order[1]], after[0]]
+        order_by = 'productID' if order is None else f'{order[0]}, productID'
+        where = ' WHERE ' + ' AND '.join(conditions) if conditions else ''
+        sql = (f'SELECT productID, productName, productPrice FROM Products{where} '
+               f'ORDER BY {order_by} LIMIT ?;')
+        return sql, params + [page_size]
+
+    def page_products(self, after=None, page_size=100, min_price=None, max_price=None, name_prefix=None):
+        """한 페이지씩 조회 (몇 번째 페이지든 page_size 만큼만 읽음)
+
+        after       : 앞 페이지의 마지막 행 (첫 페이지는 None, 필터가 없으면 productID 만 줘도 됨)
+        min_price, max_price : 가격 범위 → 가격 순
+        name_prefix : 이름 앞부분 → 이름 순
+        필터가 없으면 productID 순
+
+        rows = db.page_products(min_price=10000)
+        rows = db.page_products(after=rows[-1], min_price=10000)
+        """
+        sql, params = self.page_query(after, page_size, min_price, max_price, name_prefix)
+        return self.conn.execute(sql, params).fetchall()
+
+    def explain(self, sql, params=()):
+        """쿼리 실행 계획 (EXPLAIN QUERY PLAN) 을 줄 목록으로"""
+        rows = self.conn.execute('EXPLAIN QUERY PLAN ' + sql, params).fetchall()
+        return [detail for _, _, _, detail in rows]
 
     def select_products(self, limit=100):
         query = 'SELECT * FROM Products LIMIT ?;'
         cursor = self.conn.execute(query, (limit,))
         return cursor.fetchall()
 
+    def snapshot(self):
+        """메모리 모드에서 지금 내용을 파일로 저장"""
+        if self.memory is not None:
+            self.memory.snapshot(force=True)
+
     def close(self):
-        self.conn.close()
+        if self.memory is not None:
+            self.memory.close()
+        else:
+            self.conn.close()
 
 if __name__ == '__main__':
-    db = ProductDB()
-    # 샘플 데이터 10만개 삽입
-    for i in range(1, 100001):
-        db.insert_product(f'Product_{i}', i * 10)
+    db = ProductDB(fast=True)
+    # 샘플 데이터 10만개 삽입 (5만개씩 한 트랜잭션)
+    db.insert_many((f'Product_{i}', i * 10) for i in range(1, 100001))
     print('샘플 데이터 10만개 삽입 완료')
     # 일부 데이터 조회
     print(db.select_products(5))
+    # 가격 범위로 한 페이지씩 조회 (인덱스 사용 여부 확인)
+    page = db.page_products(page_size=5, min_price=500000, max_price=600000)
+    print(page)
+    print(db.page_products(after=page[-1], page_size=5, min_price=500000, max_price=600000))
+    print(db.explain(*db.page_query(after=page[-1], min_price=500000, max_price=600000)))
     db.close()
@@ -2,18 +2,8 @@ import sys
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import pyqtSlot, Qt
 from PyQt5 import uic 
-import sqlite3
-import os.path 
-
-#DB파일이 없으면 만들고 있다면 접속한다. 
-if os.path.exists("c:\\work\\ProductList.db"):
-    con = sqlite3.connect("c:\\work\\ProductList.db")
-    cur = con.cursor()
-else: 
-    con = sqlite3.connect("c:\\work\\ProductList.db")
-    cur = con.cursor()
-    cur.execute(
-        "create table Products (id integer primary key autoincrement, Name text, Price integer);")
+#입력/수정/삭제는 공용 제품 저장소로 (product_repository.py 참고)
+from product_repository import PRODUCT_LIST, open_repository
 
 #디자인 파일을 로딩
 form_class = uic.loadUiType("c:\\work\\ProductList.ui")[0]
@@ -26,6 +16,10 @@ class Window(QMainWindow, form_class):
         self.name = ""
         self.price = 0 
         self.setupUi(self)
+        #DB파일이 없으면 만들고 있다면 접속한다. (창이 떠 있는 동안 연결 유지)
+        self.repo = open_repository("c:\\work\\ProductList.db", PRODUCT_LIST)
+        #입력/수정/삭제되면 그 행만 고친다
+        self.repo.subscribe(self.productChanged)
         #QTableWidget의 컬럼폭 셋팅하기 
         self.tableWidget.setColumnWidth(0, 100)
         self.tableWidget.setColumnWidth(1, 200)
@@ -41,61 +35,72 @@ class Window(QMainWindow, form_class):
         #입력 파라메터 처리 
         self.name = self.prodName.toPlainText()
         self.price = self.prodPrice.toPlainText()
-        cur.execute("insert into Products (Name, Price) values(?,?);", 
-            (self.name, self.price))
-        #리프레시
-        self.getProduct() 
-        #입력,수정,삭제 작업후에는 커밋을 한다. 
-        con.commit() 
+        self.repo.add(self.name, self.price)
 
     def updateProduct(self):
         #업데이트 작업시 파라메터 처리 
-        self.id  = self.prodID.toPlainText()
+        if not self.prodID.toPlainText().strip().isdigit():
+            return
+        self.id  = int(self.prodID.toPlainText())
         self.name = self.prodName.toPlainText()
         self.price = self.prodPrice.toPlainText()
-        cur.execute("update Products set name=?, price=? where id=?;", 
-            (self.name, self.price, self.id))
-        #리프레시
-        self.getProduct() 
-        #입력,수정,삭제 작업후에는 커밋을 한다. 
-        con.commit()  
+        self.repo.update(self.id, self.name, self.price)
 
     def removeProduct(self):
         #삭제 파라메터 처리 
-        self.id  = self.prodID.toPlainText()
-        strSQL = "delete from Products where id=" + str(self.id)
-        cur.execute(strSQL)
-        #리프레시
-        self.getProduct() 
-        #입력,수정,삭제 작업후에는 커밋을 한다. 
-        con.commit()  
+        if not self.prodID.toPlainText().strip().isdigit():
+            return
+        self.id  = int(self.prodID.toPlainText())
+        self.repo.delete(self.id)
 
     def getProduct(self):
         #검색 결과를 보여주기전에 기존 컨텐트를 삭제(헤더는 제외)
-        self.tableWidget.clearContents()
-
-        cur.execute("select * from Products;") 
-        #행숫자 카운트 
-        row = 0 
-        for item in cur: 
-            int_as_strID = "{:10}".format(item[0])
-            int_as_strPrice = "{:10}".format(item[2])
-            
-            #각 열을 Item으로 생성해서 숫자를 오른쪽으로 정렬해서 출력한다. 
-            itemID = QTableWidgetItem(int_as_strID) 
-            itemID.setTextAlignment(Qt.AlignRight) 
-            self.tableWidget.setItem(row, 0, itemID)
-            
-            #제품명은 그대로 출력한다. 
-            self.tableWidget.setItem(row, 1, QTableWidgetItem(item[1]))
-            
-            #각 열을 Item으로 생성해서 숫자를 오른쪽으로 정렬해서 출력한다. 
-            itemPrice = QTableWidgetItem(int_as_strPrice) 
-            itemPrice.setTextAlignment(Qt.AlignRight) 
-            self.tableWidget.setItem(row, 2, itemPrice)
-            
-            row += 1
-            print("row: ", row)  
+        self.tableWidget.setRowCount(0)
+        rows = self.repo.conn.execute("select * from Products;").fetchall()
+        self.tableWidget.setRowCount(len(rows))
+        for row, item in enumerate(rows):
+            self.setRow(row, item)
+
+    def setRow(self, row, item):
+        int_as_strID = "{:10}".format(item[0])
+        int_as_strPrice = "{:10}".format(item[2])
+        
+        #각 열을 Item으로 생성해서 숫자를 오른쪽으로 정렬해서 출력한다. 
+        itemID = QTableWidgetItem(int_as_strID) 
+        itemID.setTextAlignment(Qt.AlignRight) 
+        self.tableWidget.setItem(row, 0, itemID)
+        
+        #제품명은 그대로 출력한다. 
+        self.tableWidget.setItem(row, 1, QTableWidgetItem(item[1]))
+        
+        #각 열을 Item으로 생성해서 숫자를 오른쪽으로 정렬해서 출력한다. 
+        itemPrice = QTableWidgetItem(int_as_strPrice) 
+        itemPrice.setTextAlignment(Qt.AlignRight) 
+        self.tableWidget.setItem(row, 2, itemPrice)
+
+    def findRow(self, id):
+        for row in range(self.tableWidget.rowCount()):
+            item = self.tableWidget.item(row, 0)
+            if item is not None and item.text().strip() == str(id):
+                return row
+        return None
+
+    def productChanged(self, action, ids):
+        #여러 행이 한꺼번에 바뀌었으면 전체를 다시 읽는다
+        if ids is None:
+            self.getProduct()
+            return
+        for id in ids:
+            row = self.findRow(id)
+            item = None if action == "delete" else self.repo.get(id)
+            if item is None:
+                if row is not None:
+                    self.tableWidget.removeRow(row)
+                continue
+            if row is None:
+                row = self.tableWidget.rowCount()
+                self.tableWidget.insertRow(row)
+            self.setRow(row, item)
 
     def doubleClick(self):
         self.prodID.setText(self.tableWidget.item(self.tableWidget.currentRow(), 0).text())
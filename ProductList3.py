@@ -2,18 +2,12 @@ import sys
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import pyqtSlot, Qt
 from PyQt5 import uic 
-import sqlite3
-import os.path 
-
-#DB파일이 없으면 만들고 있다면 접속한다. 
-if os.path.exists("ProductList.db"):
-    con = sqlite3.connect("ProductList.db")
-    cur = con.cursor()
-else: 
-    con = sqlite3.connect("ProductList.db")
-    cur = con.cursor()
-    cur.execute(
-        "create table Products (id integer primary key autoincrement, Name text, Price integer);")
+#필요한 만큼만 DB에서 읽어오는 테이블 모델 (sql_table_model.py 참고)
+from sql_table_model import SqlTableModel
+#입력/수정/삭제는 공용 제품 저장소로 (product_repository.py 참고)
+from product_repository import PRODUCT_LIST, open_repository
+#실제 쓰기는 별도 스레드에서 (db_writer.py 참고)
+from db_writer import DbWriter
 
 #디자인 파일을 로딩
 form_class = uic.loadUiType("ProductList3.ui")[0]
@@ -22,18 +16,32 @@ class Window(QMainWindow, form_class):
     def __init__(self):
         super().__init__()
         self.setupUi(self)
+        #DB파일이 없으면 만들고 있다면 접속한다. (창이 떠 있는 동안 연결 유지)
+        self.repo = open_repository("ProductList.db", PRODUCT_LIST)
+        #입력/수정/삭제는 쓰기 스레드가 처리하고, 커밋되면 저장소에 알려서 표를 고친다
+        self.writer = DbWriter("ProductList.db", PRODUCT_LIST)
+        self.writer.committed.connect(self.repo.notify)
+        self.writer.failed.connect(self.writeFailed)
+        self.writer.start()
         
         #초기값 셋팅 
         self.id = 0 
         self.name = ""
         self.price = 0 
 
-        #QTableWidget의 컬럼폭 셋팅하기 
+        #테이블 모델 연결 (헤더 포함), 스크롤하는 만큼만 DB에서 읽어온다
+        self.model = SqlTableModel(self.repo.conn, "Products", ["id", "Name", "Price"],
+            ["제품ID","제품명", "가격"], numeric_columns=["id", "Price"])
+        #입력/수정/삭제된 행만 그 자리에서 고친다 (전체를 다시 읽지 않음)
+        self.model.watch(self.repo)
+        self.tableWidget.setModel(self.model)
+        #헤더를 클릭하면 SQL로 정렬
+        self.tableWidget.setSortingEnabled(True)
+        self.tableWidget.sortByColumn(0, Qt.AscendingOrder)
+        #QTableView의 컬럼폭 셋팅하기 
         self.tableWidget.setColumnWidth(0, 100)
         self.tableWidget.setColumnWidth(1, 200)
         self.tableWidget.setColumnWidth(2, 100)
-        #QTableWidget의 헤더 셋팅하기
-        self.tableWidget.setHorizontalHeaderLabels(["제품ID","제품명", "가격"])
         #QTableWidget의 컬럼 정렬하기 
         #self.tableWidget.horizontalHeaderItem(0).setTextAlignment(Qt.AlignRight)
         #self.tableWidget.horizontalHeaderItem(2).setTextAlignment(Qt.AlignRight)
@@ -55,66 +63,45 @@ class Window(QMainWindow, form_class):
         #입력 파라메터 처리 
         self.name = self.prodName.text()
         self.price = self.prodPrice.text()
-        cur.execute("insert into Products (Name, Price) values(?,?);", 
-            (self.name, self.price))
-        #리프레시
-        self.getProduct() 
-        #입력,수정,삭제 작업후에는 커밋을 한다. 
-        con.commit() 
+        #저장(커밋)되면 새 행이 테이블에 바로 나타난다 (창은 기다리지 않음)
+        self.writer.add(self.name, self.price)
 
     def updateProduct(self):
         #업데이트 작업시 파라메터 처리 
-        self.id  = self.prodID.text()
+        if not self.prodID.text().strip().isdigit():
+            return
+        self.id  = int(self.prodID.text())
         self.name = self.prodName.text()
         self.price = self.prodPrice.text()
-        cur.execute("update Products set name=?, price=? where id=?;", 
-            (self.name, self.price, self.id))
-        #리프레시
-        self.getProduct() 
-        #입력,수정,삭제 작업후에는 커밋을 한다. 
-        con.commit()  
+        #수정한 행만 다시 읽어서 보여준다
+        self.writer.update(self.id, self.name, self.price)
 
     def removeProduct(self):
         #삭제 파라메터 처리 
-        self.id  = self.prodID.text() 
-        strSQL = "delete from Products where id=" + str(self.id)
-        cur.execute(strSQL)
-        #리프레시
-        self.getProduct() 
-        #입력,수정,삭제 작업후에는 커밋을 한다. 
-        con.commit()  
+        if not self.prodID.text().strip().isdigit():
+            return
+        self.id  = int(self.prodID.text())
+        #삭제한 행만 테이블에서 뺀다
+        self.writer.delete(self.id)
 
     def getProduct(self):
-        #검색 결과를 보여주기전에 기존 컨텐트를 삭제(헤더는 제외)
-        self.tableWidget.clearContents()
+        #처음부터 다시 읽는다 (읽어 두었던 행 수만큼, 숫자는 모델에서 오른쪽 정렬)
+        self.model.reload(keep_loaded=True)
+
+    def writeFailed(self, ticket, action, message):
+        QMessageBox.critical(self, "오류", message)
 
-        cur.execute("select * from Products;") 
-        #행숫자 카운트 
-        row = 0 
-        for item in cur: 
-            int_as_strID = "{:10}".format(item[0])
-            int_as_strPrice = "{:10}".format(item[2])
-            
-            #각 열을 Item으로 생성해서 숫자를 오른쪽으로 정렬해서 출력한다. 
-            itemID = QTableWidgetItem(int_as_strID) 
-            itemID.setTextAlignment(Qt.AlignRight) 
-            self.tableWidget.setItem(row, 0, itemID)
-            
-            #제품명은 그대로 출력한다. 
-            self.tableWidget.setItem(row, 1, QTableWidgetItem(item[1]))
-            
-            #각 열을 Item으로 생성해서 숫자를 오른쪽으로 정렬해서 출력한다. 
-            itemPrice = QTableWidgetItem(int_as_strPrice) 
-            itemPrice.setTextAlignment(Qt.AlignRight) 
-            self.tableWidget.setItem(row, 2, itemPrice)
-            
-            row += 1
-            print("row: ", row)  
+    def closeEvent(self, event):
+        #남은 쓰기를 마치고 종료
+        self.writer.stop()
+        self.writer.wait()
+        super().closeEvent(event)
 
     def doubleClick(self):
-        self.prodID.setText(self.tableWidget.item(self.tableWidget.currentRow(), 0).text())
-        self.prodName.setText(self.tableWidget.item(self.tableWidget.currentRow(), 1).text())
-        self.prodPrice.setText(self.tableWidget.item(self.tableWidget.currentRow(), 2).text())
+        id, name, price = self.model.row_values(self.tableWidget.currentIndex().row())
+        self.prodID.setText(str(id))
+        self.prodName.setText(name)
+        self.prodPrice.setText(str(price))
 
 
 #인스턴스를 생성한다. 
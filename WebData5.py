@@ -1,9 +1,49 @@
 import sys
 from PyQt5.QtWidgets import *
-import urllib.request
-from bs4 import BeautifulSoup
+from PyQt5.QtCore import QThread, pyqtSignal
 import webbrowser   #브라우저로 넘기는 경우 
-import re 
+from board_fetcher import PageFetcher
+from board_sites import clien_page_urls, parse_clien_posts
+from keyword_matcher import KeywordMatcher
+
+
+class SearchWorker(QThread):
+    """클리앙 중고장터 검색을 별도 스레드에서 실행
+    페이지가 하나 분석될 때마다 찾은 제목을 바로 보내줍니다.
+    검색어는 쉼표로 여러 개 입력할 수 있습니다. (예: 아이폰,맥북)"""
+    found = pyqtSignal(str, str)    #제목, 링크
+    error = pyqtSignal(str)
+
+    def __init__(self, keyword, pages=range(0,5), path="clien.txt"):
+        super().__init__()
+        self.keyword = keyword
+        self.pages = pages
+        self.path = path
+        self._cancelled = False
+
+    def cancel(self):
+        """검색 취소 (진행중인 페이지까지만 처리)"""
+        self._cancelled = True
+
+    def run(self):
+        matcher = KeywordMatcher(self.keyword.split(","))
+        try:
+            #파일은 한 번만 열고 검색이 끝나면(취소 포함) 닫는다
+            #주소/선택자/User-Agent 는 board_sites.py 의 'clien_sold' 설정 사용
+            with PageFetcher() as fetcher, \
+                    open(self.path, "a", encoding="utf-8") as f:
+                #5개 페이지를 동시에 요청하고 도착한 순서가 아니라 페이지 순서대로 처리
+                for _, page in fetcher.iter_pages(clien_page_urls(self.pages)):
+                    if self._cancelled:
+                        break
+                    for title, link in parse_clien_posts(page):
+                        #라인에디터에 입력된 문자열 받아서 검색
+                        if not matcher or matcher.match(title):
+                            f.write(title + "\n")
+                            f.write(link + "\n")
+                            self.found.emit(title, link)
+        except Exception as e:
+            self.error.emit("검색 실패: {}".format(e))
 
 class Form(QMainWindow):
     def __init__(self):
@@ -23,10 +63,18 @@ class Form(QMainWindow):
         self.btn.move(120, 20)
         self.btn.clicked.connect(self.setTableWidgetData)
 
+        #검색 취소 버튼
+        self.btnCancel = QPushButton("취소", self)
+        self.btnCancel.move(220, 20)
+        self.btnCancel.setEnabled(False)
+        self.btnCancel.clicked.connect(self.cancelSearch)
+        self.worker = None
+        self.cancelled = []     #취소했지만 아직 끝나지 않은 스레드 (끝날 때까지 참조를 유지)
+
         self.tableWidget = QTableWidget(self)
         self.tableWidget.move(20, 70)
         self.tableWidget.resize(800, 600)
-        self.tableWidget.setRowCount(50)  #행의 갯수 
+        self.tableWidget.setRowCount(0)  #행은 검색 결과가 도착할 때마다 추가
         self.tableWidget.setColumnCount(2)  #컬럼의 갯수 
         #컬럼의 폭을 지정한다. 0번 1번 
         self.tableWidget.setColumnWidth(0, 300)
@@ -36,42 +84,53 @@ class Form(QMainWindow):
         self.tableWidget.doubleClicked.connect(self.doubleClicked)
 
     def setTableWidgetData(self):
-        row = 0
-        #User-Agent를 조작하는 경우 
-        hdr = {'User-agent':'Mozila/5.0 (compatible; MSIE 5.5; Windows NT)'}
-        for n in range(0,5):
-            #클리앙의 중고장터 주소 
-            data ='https://www.clien.net/service/board/sold?&od=T31&po=' + str(n)
-            req = urllib.request.Request(data, 
-                headers = hdr)
-            data = urllib.request.urlopen(req).read()
-            page = data.decode('utf-8', 'ignore')
-            soup = BeautifulSoup(page, 'html.parser')
-            list = soup.find_all('a', attrs={'class':'list_subject'})
-
-            f = open("clien.txt", "a+", encoding="utf-8")
-            for item in list:
-                try:
-                    span = item.contents[3]
-                    title = item.text.strip()
-                    #라인에디터에 입력된 문자열 받아서 검색
-                    if (re.search(self.lineEdit.text(), title)):
-                        title = title.replace("\t", "")
-                        title = title.replace("\n", "")
-                        print(title)
-                        link = 'https://www.clien.net'  + item['href'] 
-                        print(link.strip())
-                        f.write(title+"\n")
-                        f.write(link + "\n")
-                        #행데이터로 출력 
-                        self.tableWidget.setItem(row, 0, QTableWidgetItem(title))
-                        self.tableWidget.setItem(row, 1, QTableWidgetItem(link))
-                        row += 1
-                        print("row: ", row) 
-                except:
-                    pass
-             
-            f.close()
+        #이전 검색이 진행중이면 취소하고 새로 시작
+        self.cancelSearch()
+        self.tableWidget.clearContents()
+        self.tableWidget.setRowCount(0)
+        self.worker = SearchWorker(self.lineEdit.text())
+        self.worker.found.connect(self.addRow)
+        self.worker.error.connect(self.searchError)
+        self.worker.finished.connect(self.searchFinished)
+        self.btnCancel.setEnabled(True)
+        self.worker.start()
+
+    def addRow(self, title, link):
+        #취소한 검색이 보낸 결과는 버림
+        if self.sender() is not self.worker:
+            return
+        #행데이터로 출력 (결과가 도착하는 대로 한 줄씩 추가)
+        row = self.tableWidget.rowCount()
+        self.tableWidget.insertRow(row)
+        self.tableWidget.setItem(row, 0, QTableWidgetItem(title))
+        self.tableWidget.setItem(row, 1, QTableWidgetItem(link))
+        print("row: ", row + 1) 
+
+    def searchError(self, msg):
+        if self.sender() is self.worker:
+            QMessageBox.warning(self, "오류", msg)
+
+    def searchFinished(self):
+        worker = self.sender()
+        if worker in self.cancelled:
+            self.cancelled.remove(worker)
+        if worker is self.worker:
+            self.btnCancel.setEnabled(False)
+
+    def cancelSearch(self):
+        #취소한 검색의 결과는 더 이상 테이블에 넣지 않는다 (화면은 기다리지 않음)
+        #addRow 가 현재 검색(self.worker)의 결과만 받으므로 현재 검색에서 떼어 내기만 하면 됨
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+            self.cancelled.append(self.worker)
+            self.worker = None
+        self.btnCancel.setEnabled(False)
+
+    def closeEvent(self, event):
+        self.cancelSearch()
+        for worker in list(self.cancelled):
+            worker.wait()
+        super().closeEvent(event)
 
     def doubleClicked(self):
         url = self.tableWidget.item(self.tableWidget.currentRow(), 1).text()
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+스크래퍼 벤치마크 (네트워크 없이 board_fixture_server.py 대역 서버 사용)
+
+사이트마다 대역 서버를 하나씩(=호스트 하나씩) 띄워 놓고 아래 방식들의
+초당 페이지 수, 초당 제목 수를 측정합니다.
+
+    serial       : 예전 web2.py 방식 (urllib 로 한 페이지씩 순서대로)
+    concurrent   : board_fetcher.PageFetcher 로 동시에 요청
+    multi_site   : board_sites.BoardCrawler 로 모든 사이트를 한 번에
+    incremental  : seen_index.crawl_new 두 번째 실행 (새 글 5개)
+    parse_only   : 네트워크 없이 파싱만
+
+사용 예)
+    python board_bench.py --latency 0.2 --pages 10
+    python board_bench.py --latency 0.1 --error-rate 0.05 --json bench.json
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import urllib.request
+
+import board_sites
+from board_fetcher import PageFetcher
+from board_fixture_server import FixtureConfig, start_server
+from board_sites import BoardCrawler, page_urls, parse_page, posts_parser
+from seen_index import SeenIndex, crawl_new, mark_seen
+
+
+def _result(name, pages, titles, elapsed):
+    return {
+        'name': name,
+        'pages': pages,
+        'titles': titles,
+        'seconds': round(elapsed, 4),
+        'pages_per_sec': round(pages / elapsed, 1) if elapsed else 0.0,
+        'titles_per_sec': round(titles / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def bench_serial(pages):
+    """예전 방식: urlopen 으로 한 페이지씩"""
+    start = time.perf_counter()
+    titles = 0
+    for url in page_urls('clien_sold', range(0, pages)):
+        html = urllib.request.urlopen(url).read().decode('utf-8', 'ignore')
+        titles += len(parse_page('clien_sold', html))
+    return _result('serial', pages, titles, time.perf_counter() - start)
+
+
+def bench_concurrent(pages):
+    start = time.perf_counter()
+    with PageFetcher() as fetcher:
+        htmls = fetcher.fetch_pages(page_urls('clien_sold', range(0, pages)))
+    titles = sum(len(parse_page('clien_sold', html)) for html in htmls)
+    return _result('concurrent', pages, titles, time.perf_counter() - start)
+
+
+def bench_multi_site(pages, min_delay):
+    sites = {'clien_sold': range(0, pages), 'todayhumor_bob': range(1, pages + 1)}
+    crawler = BoardCrawler(per_host=4, min_delay=min_delay)
+    start = time.perf_counter()
+    results = crawler.crawl(sites)
+    elapsed = time.perf_counter() - start
+    titles = sum(len(posts) for posts in results.values())
+    return _result('multi_site', pages * len(sites) - len(crawler.errors), titles, elapsed)
+
+
+def bench_incremental(pages, configs):
+    """한 번 전체를 받아 둔 뒤 새 글 5개가 올라왔을 때 두 번째 실행"""
+    fd, path = tempfile.mkstemp(suffix="_seen.txt")
+    os.close(fd)
+    os.remove(path)
+    try:
+        urls = page_urls('clien_sold', range(0, pages))
+        parse = posts_parser('clien_sold')
+        index = SeenIndex(path)
+        mark_seen(index, crawl_new(urls, parse, index))
+        configs['clien_sold'].add_posts(5)
+        before = configs['clien_sold'].requests
+        start = time.perf_counter()
+        posts = crawl_new(urls, parse, index)
+        elapsed = time.perf_counter() - start
+        fetched = configs['clien_sold'].requests - before
+        return _result('incremental', fetched, len(posts), elapsed)
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def bench_parse_only(pages):
+    with PageFetcher() as fetcher:
+        htmls = fetcher.fetch_pages(page_urls('clien_sold', range(0, pages)))
+    start = time.perf_counter()
+    titles = sum(len(parse_page('clien_sold', html)) for html in htmls)
+    return _result('parse_only', pages, titles, time.perf_counter() - start)
+
+
+def run(latency=0.2, jitter=0.0, error_rate=0.0, pages=10, min_delay=0.05):
+    """대역 서버를 띄우고 모든 방식을 측정해서 결과 목록을 반환"""
+    configs = {}
+    for name in ('clien_sold', 'todayhumor_bob'):
+        configs[name] = FixtureConfig(latency=latency, jitter=jitter,
+                                      error_rate=error_rate, pages=pages)
+        _, origin = start_server(configs[name])
+        board_sites.retarget(origin, [name])
+
+    results = []
+    #오류를 섞는 경우 재시도가 없는 serial/concurrent/incremental 은 실패할 수 있다
+    benches = [
+        ('serial', lambda: bench_serial(pages)),
+        ('concurrent', lambda: bench_concurrent(pages)),
+        ('multi_site', lambda: bench_multi_site(pages, min_delay)),
+        ('incremental', lambda: bench_incremental(pages, configs)),
+        ('parse_only', lambda: bench_parse_only(pages)),
+    ]
+    for name, bench in benches:
+        try:
+            results.append(bench())
+        except Exception as e:
+            results.append({'name': name, 'error': str(e)})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스크래퍼 벤치마크 (로컬 대역 서버)")
+    parser.add_argument("--latency", type=float, default=0.2, help="페이지 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연 흔들림(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 오류 비율")
+    parser.add_argument("--pages", type=int, default=10, help="사이트당 페이지 수")
+    parser.add_argument("--min-delay", type=float, default=0.05, help="BoardCrawler 호스트별 요청 간격")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    results = run(args.latency, args.jitter, args.error_rate, args.pages, args.min_delay)
+    print(f"{'방식':<12}{'페이지':>8}{'제목':>8}{'초':>9}{'페이지/초':>11}{'제목/초':>11}")
+    for r in results:
+        if 'error' in r:
+            print(f"{r['name']:<12} 실패: {r['error']}")
+            continue
+        print(f"{r['name']:<12}{r['pages']:>8}{r['titles']:>8}{r['seconds']:>9.3f}"
+              f"{r['pages_per_sec']:>11}{r['titles_per_sec']:>11}")
+    if args.json:
+        with open(args.json, "wt", encoding="utf-8") as f:
+            json.dump({'settings': vars(args), 'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+게시판 페이지 동시 수집기
+여러 페이지를 한꺼번에 요청하고, 결과는 항상 페이지 순서대로 돌려줍니다.
+사이트별 주소/선택자는 board_sites.py 에 있습니다.
+
+사용 예)
+    with PageFetcher() as fetcher:
+        for html in fetcher.fetch_pages(urls):
+            ...
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# User-Agent를 조작하는 경우(아이폰에서 사용하는 사파리 브라우져의 헤더)
+HEADERS = {'User-agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 10_3 like Mac OS X) AppleWebKit/603.1.23 (KHTML, like Gecko) Version/10.0 Mobile/14E5239e Safari/602.1'}
+
+
+class PageFetcher:
+    """커넥션 풀을 공유하면서 여러 페이지를 동시에 가져오는 클래스
+
+    max_workers : 동시에 요청을 보내는 스레드 수
+    per_host    : 같은 호스트에 동시에 열 수 있는 최대 연결 수
+    """
+
+    def __init__(self, max_workers=10, per_host=10, headers=None, timeout=10):
+        self.per_host = per_host
+        self.timeout = timeout
+
+        # 호스트별 커넥션을 재사용 (pool_block=True 이면 풀 크기 이상 연결을 만들지 않음)
+        self.session = requests.Session()
+        self.session.headers.update(headers or HEADERS)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=per_host, pool_block=True)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._pending = set()       #아직 끝나지 않은 요청 (close 에서 취소)
+        self._host_slots = {}
+        self._lock = threading.Lock()
+
+    def _host_slot(self, url):
+        """호스트별 동시 요청 수를 제한하는 세마포어 반환"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_host)
+                self._host_slots[host] = slot
+            return slot
+
+    def fetch(self, url, headers=None):
+        """한 페이지를 받아서 문자열(utf-8)로 반환 (headers 는 이번 요청에만 추가)"""
+        with self._host_slot(url):
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        response.raise_for_status()
+        #한글이 깨지는 경우 디코딩 utf-8로
+        return response.content.decode('utf-8', 'ignore')
+
+    def iter_pages(self, urls, headers=None):
+        """모든 페이지를 동시에 요청하고 (순번, html)을 페이지 순서대로 하나씩 돌려줍니다.
+
+        앞 페이지가 도착하는 즉시 꺼내 쓸 수 있고, 중간에 반복을 멈추면
+        아직 시작하지 않은 요청은 취소됩니다.
+        """
+        futures = [self._submit(url, headers) for url in urls]
+        try:
+            for index, future in enumerate(futures):
+                yield index, future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _submit(self, url, headers):
+        future = self.executor.submit(self.fetch, url, headers)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def fetch_pages(self, urls, headers=None):
+        """모든 페이지의 html을 페이지 순서대로 리스트로 반환"""
+        return [html for _, html in self.iter_pages(urls, headers)]
+
+    def close(self):
+        # shutdown(cancel_futures=True) 는 파이썬 3.9 부터라 시작 안 한 요청은 직접 취소
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+        self.executor.shutdown(wait=False)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+게시판 대역(stand-in) 로컬 서버
+실제 사이트에 접속하지 않고 스크래퍼를 시험/벤치마크하기 위한 HTTP 서버입니다.
+
+제공하는 주소 (실제 사이트와 같은 경로)
+    /service/board/sold?po=N                  클리앙 중고장터 목록
+    /board/list.php?table=bestofbest&page=N   오늘의 유머 베오베 목록
+    /search.naver?where=image&query=검색어     네이버 이미지 검색 결과 (썸네일 목록)
+    /img/N.jpg                                썸네일 이미지
+
+record_dir 에 저장된 페이지(clien_sold_0.html, todayhumor_bob_1.html, naver_image.html)가
+있으면 그 파일을 그대로 돌려주고, 없으면 같은 구조의 가짜 페이지를 만들어 돌려줍니다.
+
+사용 예)
+    python board_fixture_server.py --port 8000 --latency 0.2 --error-rate 0.05
+    python board_fixture_server.py --record fixtures      # 실제 페이지를 fixtures/ 에 저장
+    BOARD_FIXTURE=http://127.0.0.1:8000 python web2.py     # 스크래퍼를 로컬 서버로
+"""
+import argparse
+import io
+import os
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+# 한 페이지에 들어가는 글 수 (실제 사이트와 비슷하게)
+POSTS_PER_PAGE = {'clien_sold': 30, 'todayhumor_bob': 30}
+# 가짜 제목에 섞을 단어들
+WORDS = ['아이폰', '맥북', '에어팟', '갤럭시', '아이패드', '모니터', '키보드', '자전거',
+         '캠핑', '의자', '카메라', '렌즈', '닌텐도', '플스', '그래픽카드', '정리', '팝니다', '미개봉']
+
+
+class FixtureConfig:
+    """서버 동작 설정
+
+    latency    : 응답 지연(초), jitter 만큼 무작위로 흔들림
+    error_rate : 이 확률로 503 오류 응답
+    pages      : 목록 페이지 수 (넘어가면 빈 목록)
+    images     : 네이버 이미지 검색 결과 썸네일 수
+    distinct   : 서로 다른 이미지 종류 수 (작게 주면 중복 이미지가 섞임)
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, pages=10,
+                 images=200, distinct=None, record_dir=None, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.pages = pages
+        self.images = images
+        self.distinct = distinct or images
+        self.record_dir = record_dir
+        self.top_id = 18_000_000    #가장 최근 글 번호 (add_posts 로 새 글 추가)
+        self.random = random.Random(seed)
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def add_posts(self, count):
+        """새 글이 count 개 올라온 것처럼 만든다 (감시 데몬 시험용)"""
+        with self._lock:
+            self.top_id += count
+
+
+def _title(post_id):
+    rnd = random.Random(post_id)
+    return " ".join(rnd.sample(WORDS, 3)) + f" {post_id % 1000}"
+
+
+def clien_page(config, page):
+    """클리앙 목록과 같은 구조의 페이지"""
+    rows = []
+    if page < config.pages:
+        first = config.top_id - page * POSTS_PER_PAGE['clien_sold']
+        for post_id in range(first, first - POSTS_PER_PAGE['clien_sold'], -1):
+            rows.append(
+                '<div class="list_item symph_row">'
+                f'<a class="list_subject" href="/service/board/sold/{post_id}?od=T31&po={page}&category=0&groupCd=">'
+                f'<span class="subject_fixed" data-role="list-title-text" title="{_title(post_id)}">{_title(post_id)}</span>'
+                '</a></div>')
+    return "<html><body><div class=\"list_content\">" + "\n".join(rows) + "</div></body></html>"
+
+
+def todayhumor_page(config, page):
+    """오늘의 유머 목록과 같은 구조의 페이지"""
+    rows = []
+    if 1 <= page <= config.pages:
+        first = config.top_id - (page - 1) * POSTS_PER_PAGE['todayhumor_bob']
+        for post_id in range(first, first - POSTS_PER_PAGE['todayhumor_bob'], -1):
+            rows.append(
+                '<tr class="view list_tr_humordata">'
+                f'<td class="no">{post_id}</td>'
+                f'<td class="subject"><a href="/board/view.php?table=bestofbest&no={post_id}&s_no={post_id}&page={page}">{_title(post_id)}</a></td>'
+                '</tr>')
+    return "<html><body><table class=\"table_list\">" + "\n".join(rows) + "</table></body></html>"
+
+
+def naver_image_page(config, query, batch=50):
+    """네이버 이미지 검색 결과와 같은 클래스 이름의 썸네일 목록
+    처음에는 batch 개만 보이고, 끝까지 스크롤하면 batch 개씩 더 붙습니다."""
+    return f"""<html><head><meta charset="utf-8"><title>{query} : 네이버 이미지검색</title></head>
+<body><div id="main_pack"></div>
+<script>
+var total = {config.images}, shown = 0, batch = {batch};
+function more() {{
+  var box = document.getElementById('main_pack');
+  for (var i = 0; i < batch && shown < total; i++) {{
+    shown++;
+    var img = document.createElement('img');
+    img.className = '_fe_image_tab_content_thumbnail_image';
+    img.src = (shown % 10 == 0) ? 'data:image/gif;base64,R0lGODlhAQABAAAAACw=' : '/img/' + shown + '.jpg';
+    img.style.display = 'block'; img.style.height = '200px';
+    box.appendChild(img);
+  }}
+}}
+more();
+window.addEventListener('scroll', function() {{
+  if (window.innerHeight + window.scrollY >= document.body.offsetHeight - 10) setTimeout(more, 300);
+}});
+</script></body></html>"""
+
+
+_image_cache = {}
+
+
+def image_bytes(config, n):
+    """n 번 썸네일 (distinct 종류로 순환하므로 같은 그림이 여러 번 나올 수 있음)"""
+    key = n % config.distinct
+    if key not in _image_cache:
+        from PIL import Image, ImageDraw
+        rnd = random.Random(key)
+        img = Image.new("RGB", (320, 240), tuple(rnd.randrange(256) for _ in range(3)))
+        draw = ImageDraw.Draw(img)
+        for _ in range(8):
+            x, y = rnd.randrange(320), rnd.randrange(240)
+            draw.rectangle([x, y, x + rnd.randrange(20, 120), y + rnd.randrange(20, 90)],
+                           fill=tuple(rnd.randrange(256) for _ in range(3)))
+        buf = io.BytesIO()
+        img.save(buf, "JPEG", quality=85)
+        _image_cache[key] = buf.getvalue()
+    return _image_cache[key]
+
+
+def _recorded(config, name):
+    if not config.record_dir:
+        return None
+    path = os.path.join(config.record_dir, name)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read()
+    return None
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   #연결 재사용(keep-alive) 허용
+    config = None
+
+    def do_GET(self):
+        config = self.config
+        with config._lock:
+            config.requests += 1
+            fail = config.random.random() < config.error_rate
+            delay = max(0.0, config.latency + config.random.uniform(-config.jitter, config.jitter))
+        if delay:
+            time.sleep(delay)
+        if fail:
+            return self._send(503, b"Service Unavailable", "text/plain")
+
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        try:
+            if parts.path.startswith("/service/board/sold"):
+                page = int(query.get('po', ['0'])[0])
+                body = _recorded(config, f"clien_sold_{page}.html") or clien_page(config, page).encode("utf-8")
+            elif parts.path == "/board/list.php":
+                page = int(query.get('page', ['1'])[0])
+                body = _recorded(config, f"todayhumor_bob_{page}.html") or todayhumor_page(config, page).encode("utf-8")
+            elif parts.path == "/search.naver":
+                body = _recorded(config, "naver_image.html") or \
+                    naver_image_page(config, query.get('query', [''])[0]).encode("utf-8")
+            elif parts.path.startswith("/img/"):
+                n = int(os.path.splitext(os.path.basename(parts.path))[0])
+                return self._send(200, image_bytes(config, n), "image/jpeg")
+            else:
+                return self._send(404, b"Not Found", "text/plain")
+        except ValueError:
+            return self._send(400, b"Bad Request", "text/plain")
+        self._send(200, body, "text/html; charset=utf-8")
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(config=None, port=0):
+    """서버를 백그라운드 스레드로 시작하고 (서버, 주소) 를 반환 (port=0 이면 빈 포트 자동 선택)"""
+    config = config or FixtureConfig()
+    handler = type("Handler", (FixtureHandler,), {'config': config})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def record_pages(record_dir, pages=2):
+    """실제 사이트 목록 페이지를 record_dir 에 저장 (이후 서버가 그대로 재생)"""
+    from board_fetcher import PageFetcher
+    from board_sites import SITES, page_urls
+
+    os.makedirs(record_dir, exist_ok=True)
+    with PageFetcher() as fetcher:
+        for name, site in SITES.items():
+            numbers = list(site['pages'])[:1]
+            numbers = range(numbers[0], numbers[0] + pages)
+            for n, html in zip(numbers, fetcher.fetch_pages(page_urls(name, numbers))):
+                path = os.path.join(record_dir, f"{name}_{n}.html")
+                with open(path, "wt", encoding="utf-8") as f:
+                    f.write(html)
+                print(f"저장: {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시판 대역 로컬 서버")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연 흔들림(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 오류 비율 (0~1)")
+    parser.add_argument("--pages", type=int, default=10, help="목록 페이지 수")
+    parser.add_argument("--images", type=int, default=200, help="이미지 검색 결과 수")
+    parser.add_argument("--distinct", type=int, help="서로 다른 이미지 수 (중복 섞기)")
+    parser.add_argument("--record-dir", help="저장된 페이지 폴더 (있으면 그대로 재생)")
+    parser.add_argument("--record", metavar="DIR", help="실제 사이트 페이지를 DIR 에 저장하고 종료")
+    args = parser.parse_args()
+
+    if args.record:
+        record_pages(args.record)
+        return
+    config = FixtureConfig(args.latency, args.jitter, args.error_rate, args.pages,
+                           args.images, args.distinct, args.record_dir)
+    server, origin = start_server(config, args.port)
+    print(f"대역 서버 실행중: {origin}  (Ctrl+C 로 종료)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
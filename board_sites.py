@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+게시판 사이트 설정 + 여러 사이트 동시 크롤링 (호스트별 요청 간격 제한)
+
+사이트 하나는 아래와 같은 작은 설정(dict)입니다.
+    'url'     : 페이지 주소 ({page} 자리에 페이지 번호)
+    'pages'   : 기본 페이지 범위
+    'item'    : 글 하나를 고르는 CSS 선택자
+    'fields'  : 필드 이름 -> 추출 규칙
+                  "선택자"        선택자에 해당하는 태그의 글자
+                  "선택자@속성"   선택자에 해당하는 태그의 속성값
+                  "@속성"         글(item) 태그 자신의 속성값
+    'base'    : 상대 경로 링크 앞에 붙일 주소 (link 필드에 적용)
+    'headers' : 요청 헤더 (없으면 board_fetcher.HEADERS)
+
+사이트를 추가할 때는 SITES 에 설정만 추가하면 됩니다.
+
+사용 예)
+    crawler = BoardCrawler()
+    results = crawler.crawl(['clien_sold', 'todayhumor_bob'])
+    for post in results['clien_sold']:
+        print(post['title'], post['link'])
+"""
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup
+
+from board_fetcher import PageFetcher, HEADERS
+
+
+SITES = {
+    # 클리앙 중고장터 (po=0 부터)
+    'clien_sold': {
+        'url': "https://www.clien.net/service/board/sold?&od=T31&category=0&po={page}",
+        'pages': range(0, 10),
+        'item': "a.list_subject",
+        'fields': {
+            'title': "span[data-role=list-title-text]",
+            'link': "@href",
+        },
+        'base': "https://www.clien.net",
+    },
+    # 오늘의 유머 베스트오브베스트 (page=1 부터)
+    'todayhumor_bob': {
+        'url': "https://www.todayhumor.co.kr/board/list.php?table=bestofbest&page={page}",
+        'pages': range(1, 2),
+        'item': "td.subject",
+        'fields': {
+            'title': "a",
+            'link': "a@href",
+        },
+        'base': "https://www.todayhumor.co.kr/",
+    },
+}
+
+
+def retarget(origin, names=None):
+    """사이트 주소의 호스트 부분을 origin 으로 바꾼다 (board_fixture_server.py 시험용)
+    링크 앞에 붙이는 base 는 그대로 두므로 저장되는 링크는 실제 주소와 같습니다."""
+    for name in (names or SITES):
+        url = SITES[name]['url']
+        parts = urlsplit(url)
+        SITES[name]['url'] = origin.rstrip("/") + url[len(f"{parts.scheme}://{parts.netloc}"):]
+
+
+# 환경변수 BOARD_FIXTURE 가 있으면 모든 사이트를 로컬 대역 서버로 보낸다
+if os.environ.get("BOARD_FIXTURE"):
+    retarget(os.environ["BOARD_FIXTURE"])
+
+
+def page_urls(site, pages=None):
+    """사이트의 페이지 주소 목록"""
+    site = SITES[site] if isinstance(site, str) else site
+    return [site['url'].format(page=n) for n in (site['pages'] if pages is None else pages)]
+
+
+def _extract(item, rule):
+    selector, _, attr = rule.partition("@")
+    tag = item.select_one(selector) if selector else item
+    if tag is None:
+        return None
+    if attr:
+        return tag.get(attr)
+    return tag.text.strip().replace("\t", "").replace("\n", "")
+
+
+def parse_page(site, html):
+    """목록 페이지 html -> 글 목록 [{필드: 값}, ...] (필드가 하나라도 없는 글은 제외)"""
+    site = SITES[site] if isinstance(site, str) else site
+    soup = BeautifulSoup(html, 'html.parser')
+    records = []
+    for item in soup.select(site['item']):
+        record = {name: _extract(item, rule) for name, rule in site['fields'].items()}
+        if not all(record.values()):
+            continue
+        if 'link' in record and site.get('base'):
+            record['link'] = site['base'] + record['link']
+        records.append(record)
+    return records
+
+
+def posts_parser(site):
+    """html -> [(제목, 링크), ...] 함수 (seen_index.crawl_new 에서 사용)"""
+    return lambda html: [(r['title'], r['link']) for r in parse_page(site, html)]
+
+
+# 자주 쓰는 사이트 단축 함수
+parse_clien_posts = posts_parser('clien_sold')
+parse_todayhumor_posts = posts_parser('todayhumor_bob')
+
+
+def clien_page_urls(pages=range(0, 10)):
+    """클리앙 중고장터 페이지 주소 목록"""
+    return page_urls('clien_sold', pages)
+
+
+def todayhumor_page_urls(pages=range(1, 2)):
+    """오늘의 유머 베오베 페이지 주소 목록"""
+    return page_urls('todayhumor_bob', pages)
+
+
+def fetch_clien_titles(pages=range(0, 10), fetcher=None):
+    """클리앙 중고장터 제목을 페이지 순서대로 반환 (페이지는 동시에 요청)"""
+    own = fetcher is None
+    if own:
+        fetcher = PageFetcher()
+    try:
+        return [post['title']
+                for html in fetcher.fetch_pages(clien_page_urls(pages))
+                for post in parse_page('clien_sold', html)]
+    finally:
+        if own:
+            fetcher.close()
+
+
+# =============================================================================
+# 여러 사이트 동시 크롤링
+# =============================================================================
+
+class HostLimiter:
+    """같은 호스트에 보내는 요청 사이에 최소 간격(초)을 두는 제한기"""
+
+    def __init__(self, min_delay):
+        self.min_delay = min_delay
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.min_delay
+        if start > now:
+            time.sleep(start - now)
+
+
+class BoardCrawler:
+    """여러 사이트를 한 번에 크롤링하는 스케줄러
+
+    호스트마다 per_host 개의 작업 줄(lane)을 두고, 같은 호스트 요청 사이는
+    min_delay 초 이상 띄웁니다. 호스트끼리는 동시에 진행되므로 전체 시간은
+    가장 느린 호스트 하나의 시간 정도입니다.
+    """
+
+    def __init__(self, per_host=2, min_delay=0.2, fetcher=None):
+        self.per_host = per_host
+        self.min_delay = min_delay
+        self.fetcher = fetcher
+        self.errors = []    #(사이트, 페이지 주소, 오류)
+
+    def crawl(self, sites, on_page=None):
+        """sites : 사이트 이름 목록 또는 {이름: 페이지 범위}
+        on_page(이름, 페이지 순번, 글 목록) : 페이지 하나가 끝날 때마다 호출 (작업 스레드에서)
+            on_page 에서 난 예외도 errors 에 기록하고 나머지 페이지는 계속 받음
+
+        반환값 : {이름: 글 목록 (페이지 순서)}
+        """
+        if not isinstance(sites, dict):
+            sites = {name: None for name in sites}
+
+        pages = {}          #이름 -> 페이지별 글 목록
+        lanes = {}          #호스트 -> 작업 큐
+        for name, page_range in sites.items():
+            urls = page_urls(name, page_range)
+            pages[name] = [[] for _ in urls]
+            for n, url in enumerate(urls):
+                host = urlsplit(url).netloc
+                lanes.setdefault(host, deque()).append((name, n, url))
+
+        own = self.fetcher is None
+        fetcher = PageFetcher(per_host=self.per_host) if own else self.fetcher
+        self.errors = []
+
+        def run_lane(jobs, limiter):
+            while True:
+                try:
+                    name, n, url = jobs.popleft()
+                except IndexError:
+                    return
+                limiter.wait()
+                try:
+                    html = fetcher.fetch(url, headers=SITES[name].get('headers', HEADERS))
+                    pages[name][n] = parse_page(name, html)
+                except Exception as e:
+                    self.errors.append((name, url, e))
+                    continue
+                if on_page:
+                    #콜백 오류도 기록만 하고 이 줄의 남은 페이지는 계속 처리
+                    try:
+                        on_page(name, n, pages[name][n])
+                    except Exception as e:
+                        self.errors.append((name, url, e))
+
+        try:
+            workers = max(1, self.per_host * len(lanes))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = []
+                for jobs in lanes.values():
+                    limiter = HostLimiter(self.min_delay)
+                    for _ in range(min(self.per_host, len(jobs))):
+                        futures.append(executor.submit(run_lane, jobs, limiter))
+                #작업 줄 자체가 예외로 끝났으면 호출한 쪽으로 올림
+                for future in futures:
+                    future.result()
+        finally:
+            if own:
+                fetcher.close()
+
+        return {name: [post for page in page_list for post in page]
+                for name, page_list in pages.items()}
+
+
+if __name__ == "__main__":
+    #python board_sites.py [사이트 이름 ...]  (생략하면 모든 사이트)
+    names = sys.argv[1:] or list(SITES)
+    crawler = BoardCrawler()
+    start = time.time()
+    results = crawler.crawl(names)
+    for name, posts in results.items():
+        print(f"[{name}] {len(posts)}개")
+        for post in posts[:5]:
+            print("   ", post['title'])
+    for name, url, e in crawler.errors:
+        print(f"[{name}] 실패: {url} ({e})")
+    print(f"걸린 시간: {time.time() - start:.2f}초")
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+클리앙 중고장터 검색어 감시 데몬
+클리앙중고장터검색.py 를 반복 실행하는 대신, 첫 페이지만 주기적으로 확인하면서
+새로 올라온 글 중 검색어에 걸린 글만 알려줍니다.
+
+- 확인 간격은 실제 글이 올라오는 속도(지수 이동 평균)에 맞춰 자동으로 조절
+- 요청이 실패하면 간격을 두 배씩 늘려서 재시도 (최대 max_interval)
+- 한 번 알린 글은 clien_watch_seen.txt 에 기록해서 다시 알리지 않음
+
+사용 예)
+    python clien_watch.py 아이폰 맥북 에어팟
+    python clien_watch.py 아이폰 --out hits.txt --webhook http://127.0.0.1:8099/
+    python clien_watch.py --receiver 8099      # 웹훅 받는 쪽 (테스트용)
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+from board_fetcher import PageFetcher
+from board_sites import clien_page_urls, parse_clien_posts
+from keyword_matcher import KeywordMatcher
+from seen_index import SeenIndex, crawl_new, mark_seen
+
+
+# =============================================================================
+# 알림 출력 대상
+# =============================================================================
+
+class StdoutSink:
+    """화면에 출력"""
+    def emit(self, hit):
+        print("[{time}] {title} {keywords}\n    {link}".format(**hit), flush=True)
+
+
+class FileSink:
+    """파일 끝에 한 줄(JSON)씩 추가"""
+    def __init__(self, path):
+        self.path = path
+
+    def emit(self, hit):
+        with open(self.path, "at", encoding="utf-8") as f:
+            f.write(json.dumps(hit, ensure_ascii=False) + "\n")
+
+
+class WebhookSink:
+    """웹훅 주소로 JSON POST"""
+    def __init__(self, url, timeout=5):
+        self.url = url
+        self.timeout = timeout
+
+    def emit(self, hit):
+        try:
+            requests.post(self.url, json=hit, timeout=self.timeout)
+        except requests.RequestException as e:
+            print(f"웹훅 전송 실패: {e}", file=sys.stderr)
+
+
+# =============================================================================
+# 감시기
+# =============================================================================
+
+class ArrivalRate:
+    """글 올라오는 속도(초당 글 수)를 지수 이동 평균으로 추정"""
+
+    def __init__(self, alpha=0.3, initial=None):
+        self.alpha = alpha
+        self.rate = initial
+
+    def update(self, count, elapsed):
+        if elapsed <= 0:
+            return self.rate
+        sample = count / elapsed
+        if self.rate is None:
+            self.rate = sample
+        else:
+            self.rate = self.alpha * sample + (1 - self.alpha) * self.rate
+        return self.rate
+
+
+class ClienWatcher:
+    """첫 페이지를 적응형 간격으로 확인하는 감시기
+
+    target_new : 한 번 확인할 때 평균적으로 새 글이 이 정도 쌓이도록 간격을 맞춤
+    max_pages  : 확인 간격 사이에 한 페이지 넘게 글이 올라온 경우 몇 페이지까지 따라갈지
+    """
+
+    def __init__(self, keywords, sinks, seen_path="clien_watch_seen.txt",
+                 min_interval=15, max_interval=600, target_new=3, max_pages=3,
+                 fetcher=None):
+        self.matcher = KeywordMatcher(keywords)
+        self.sinks = sinks
+        self.index = SeenIndex(seen_path)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_new = target_new
+        self.urls = clien_page_urls(range(0, max_pages))
+        self.fetcher = fetcher or PageFetcher(max_workers=max_pages, per_host=2)
+        self.rate = ArrivalRate()
+        self.errors = 0
+        self.requests = 0
+        self.last_poll = None
+        self.interval = min_interval
+
+    def poll(self):
+        """한 번 확인하고 검색어에 걸린 새 글 목록을 반환"""
+        now = time.monotonic()
+        first = len(self.index) == 0
+        posts = crawl_new(self.urls, parse_clien_posts, self.index, self.fetcher)
+        #처음 실행이면 이미 올라와 있는 글은 기준으로만 기록하고 알리지 않는다
+        if first:
+            mark_seen(self.index, posts)
+            self.last_poll = now
+            return []
+        if self.last_poll is not None:
+            self.rate.update(len(posts), now - self.last_poll)
+        self.last_poll = now
+
+        hits = []
+        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        for title, link in posts:
+            keywords = self.matcher.match(title)
+            if keywords:
+                hits.append({"time": stamp, "title": title, "link": link, "keywords": keywords})
+        for hit in hits:
+            for sink in self.sinks:
+                sink.emit(hit)
+        mark_seen(self.index, posts)
+        return hits
+
+    def next_interval(self):
+        """다음 확인까지 기다릴 시간(초)"""
+        if self.errors:
+            #실패하면 지수 백오프 (+ 동시에 몰리지 않도록 약간의 흔들림)
+            delay = self.min_interval * (2 ** self.errors)
+            return min(self.max_interval, delay) * random.uniform(0.8, 1.2)
+        if self.rate.rate is None:
+            delay = self.min_interval
+        elif self.rate.rate > 0:
+            delay = self.target_new / self.rate.rate
+        else:
+            delay = self.max_interval
+        #조용하다가 한 번에 최대 간격으로 뛰지 않도록 두 배까지만 늘림
+        delay = min(delay, self.interval * 2)
+        self.interval = max(self.min_interval, min(self.max_interval, delay))
+        return self.interval
+
+    def run(self, stop=None):
+        """stop(threading.Event)이 설정될 때까지 계속 감시"""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                self.requests += 1
+                self.poll()
+                self.errors = 0
+            except Exception as e:
+                self.errors += 1
+                print(f"확인 실패({self.errors}회): {e}", file=sys.stderr)
+            stop.wait(self.next_interval())
+        self.fetcher.close()
+
+
+# =============================================================================
+# 웹훅 받는 쪽 (로컬 테스트용)
+# =============================================================================
+
+class _ReceiverHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        hit = json.loads(body.decode("utf-8"))
+        print("[웹훅] {title} {keywords}".format(**hit), flush=True)
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def run_receiver(port):
+    server = HTTPServer(("127.0.0.1", port), _ReceiverHandler)
+    print(f"웹훅 수신 대기: http://127.0.0.1:{port}/")
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="클리앙 중고장터 검색어 감시")
+    parser.add_argument("keywords", nargs="*", help="감시할 검색어")
+    parser.add_argument("--out", help="걸린 글을 JSON 줄로 추가할 파일")
+    parser.add_argument("--webhook", help="걸린 글을 POST 할 주소")
+    parser.add_argument("--quiet", action="store_true", help="화면 출력 끄기")
+    parser.add_argument("--min-interval", type=float, default=15, help="최소 확인 간격(초)")
+    parser.add_argument("--max-interval", type=float, default=600, help="최대 확인 간격(초)")
+    parser.add_argument("--receiver", type=int, metavar="PORT", help="웹훅 수신기만 실행")
+    args = parser.parse_args()
+
+    if args.receiver:
+        run_receiver(args.receiver)
+        return
+    if not args.keywords:
+        parser.error("검색어를 하나 이상 입력하세요.")
+
+    sinks = [] if args.quiet else [StdoutSink()]
+    if args.out:
+        sinks.append(FileSink(args.out))
+    if args.webhook:
+        sinks.append(WebhookSink(args.webhook))
+
+    watcher = ClienWatcher(args.keywords, sinks,
+                           min_interval=args.min_interval, max_interval=args.max_interval)
+    print(f"감시 시작: {', '.join(watcher.matcher.keywords)}")
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        print(f"\n감시 종료 (요청 {watcher.requests}회)")
+
+
+if __name__ == "__main__":
+    main()
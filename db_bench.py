@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+제품 DB 계층 벤치마크 (임시 폴더에 가짜 카탈로그를 만들어서 측정)
+
+크기(--sizes)마다, 저장 방식(--profiles)마다 아래 작업 시간을 잽니다.
+카탈로그는 'ChatGPT로 SQL구문 생성하기.py' 처럼 전자제품_N / 무작위 가격이며
+같은 --seed 면 항상 같은 데이터입니다.
+
+저장 방식
+    baseline : 기본 설정, 추가 인덱스 없음 (예전 코드와 같은 조건)
+    pragmas  : PERFORMANCE_PRAGMAS (WAL, synchronous=NORMAL, 캐시, mmap)
+    indexed  : pragmas + 범위 인덱스 + FTS 검색 색인 + 재고 요약 트리거 (입력 전에 만듦)
+    memory   : indexed 와 같은 구조를 메모리 DB 로 (memory_db.py, 마지막에 파일로 저장)
+
+작업 (method 가 여럿이면 같은 작업을 방식별로)
+    ProductDB (Products)
+        insert        insert_many 로 전체 입력
+        point_update  무작위 id 를 한 행씩 update_product (행마다 트랜잭션)
+        search        like : LIKE '%검색어%' / fts : search_products (indexed, memory)
+        paged_select  가격 범위를 가격 순으로 --pages 페이지 (offset : LIMIT/OFFSET, keyset : page_products)
+        export        앞쪽 --export-limit 행을 엑셀로 (excel_export.export_rows)
+        point_delete  무작위 id 를 한 행씩 delete_product
+        snapshot      memory 만, 파일로 저장
+    healthcare (MyProd)
+        insert        add_many 로 전체 입력
+        dashboard     scan : 전체 SUM (화면에서 직접 계산하던 방식) / summary : 재고 요약 테이블
+        table_open    fetch_all : SELECT * 전체 (ProductList.getProduct 방식)
+                      sql_model : SqlTableModel 첫 페이지 + 가격 순 정렬
+        point_update  무작위 id 를 한 행씩 ProductRepository.update
+
+사용 예)
+    python db_bench.py                                   # 1만/10만/100만 행, 모든 방식
+    python db_bench.py --sizes 10000,100000 --profiles baseline,indexed --json before.json
+    python db_bench.py --sizes 100000 --json after.json --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import tempfile
+import time
+
+from excel_export import export_rows
+from inventory_summary import InventorySummary
+from memory_db import MemoryDatabase
+from ProductDB import PERFORMANCE_PRAGMAS, ProductDB
+from product_repository import HEALTHCARE, ProductRepository
+from product_search import ProductSearch
+from sql_table_model import SqlTableModel
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+PROFILES = {
+    'baseline': {'pragmas': False, 'indexes': False, 'memory': False},
+    'pragmas': {'pragmas': True, 'indexes': False, 'memory': False},
+    'indexed': {'pragmas': True, 'indexes': True, 'memory': False},
+    'memory': {'pragmas': False, 'indexes': True, 'memory': True},
+}
+
+PAGE_SIZE = 100
+
+
+def _result(size, profile, op, method, count, elapsed):
+    return {
+        'size': size,
+        'profile': profile,
+        'op': op,
+        'method': method,
+        'count': count,
+        'seconds': round(elapsed, 4),
+        'per_sec': round(count / elapsed, 1) if elapsed else 0.0,
+        'ms_per_op': round(elapsed * 1000 / count, 4) if count else 0.0,
+    }
+
+
+def _catalog(rows, rng):
+    return ((f'전자제품_{i}', rng.randint(10000, 500000)) for i in range(1, rows + 1))
+
+
+def _healthcare_catalog(rows, rng):
+    return ((f'전자제품_{i}', rng.randint(10000, 500000), rng.randint(0, 100)) for i in range(1, rows + 1))
+
+
+class _Timer:
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.start
+
+
+# -----------------------------------------------------------------------------
+# ProductDB (MyProduct.db 의 Products)
+# -----------------------------------------------------------------------------
+def bench_products(folder, size, profile, samples, pages, export_limit, seed):
+    options = PROFILES[profile]
+    rng = random.Random(seed)
+    results = []
+
+    def add(op, method, count, timer):
+        results.append(_result(size, profile, op, method, count, timer.elapsed))
+
+    db = ProductDB(os.path.join(folder, f'products_{profile}_{size}.db'), fast=options['pragmas'],
+                   memory=options['memory'], snapshot_interval=None)
+    search = ProductSearch(db.conn, 'Products', 'productID', 'productName',
+                           ['productID', 'productName', 'productPrice'])
+    if options['indexes']:
+        db.ensure_index('price')
+        db.ensure_index('name')
+        search.ensure_index()
+
+    with _Timer() as t:
+        db.insert_many(_catalog(size, rng))
+    add('insert', 'insert_many', size, t)
+
+    with _Timer() as t:
+        for _ in range(samples):
+            db.update_product(rng.randint(1, size), productPrice=rng.randint(10000, 500000))
+    add('point_update', 'update_product', samples, t)
+
+    # 제품명의 숫자 부분 (세 글자 이상이라 FTS 를 탐. '_' 는 LIKE 의 와일드카드라 넣지 않음)
+    terms = [str(rng.randint(100, max(size, 100))) for _ in range(min(samples, 20))]
+    with _Timer() as t:
+        for term in terms:
+            db.conn.execute('SELECT productID, productName, productPrice FROM Products '
+                            'WHERE productName LIKE ? LIMIT 100', (f'%{term}%',)).fetchall()
+    add('search', 'like', len(terms), t)
+    if options['indexes']:
+        with _Timer() as t:
+            for term in terms:
+                search.search(term, 100)
+        add('search', 'fts', len(terms), t)
+
+    low, high = 100000, 300000
+    with _Timer() as t:
+        if options['indexes']:
+            after = None
+            for _ in range(pages):
+                page = db.page_products(after, PAGE_SIZE, min_price=low, max_price=high)
+                after = page[-1] if page else after
+        else:
+            for number in range(pages):
+                db.conn.execute('SELECT productID, productName, productPrice FROM Products '
+                                'WHERE productPrice >= ? AND productPrice <= ? '
+                                'ORDER BY productPrice, productID LIMIT ? OFFSET ?',
+                                (low, high, PAGE_SIZE, number * PAGE_SIZE)).fetchall()
+    add('paged_select', 'keyset' if options['indexes'] else 'offset', pages, t)
+
+    count = min(size, export_limit)
+    with _Timer() as t:
+        rows = db.conn.execute('SELECT productID, productName, productPrice FROM Products '
+                               'ORDER BY productID LIMIT ?', (count,))
+        export_rows(rows, os.path.join(folder, 'export.xlsx'), ['ID', '제품명', '가격'])
+    add('export', 'xlsx', count, t)
+
+    with _Timer() as t:
+        for _ in range(samples):
+            db.delete_product(rng.randint(1, size))
+    add('point_delete', 'delete_product', samples, t)
+
+    if options['memory']:
+        with _Timer() as t:
+            db.snapshot()
+        add('snapshot', 'backup', 1, t)
+    db.close()
+    return results
+
+
+# -----------------------------------------------------------------------------
+# healthcare_manager 의 MyProd
+# -----------------------------------------------------------------------------
+def bench_healthcare(folder, size, profile, samples, seed):
+    options = PROFILES[profile]
+    rng = random.Random(seed)
+    results = []
+
+    def add(op, method, count, timer):
+        results.append(_result(size, profile, op, method, count, timer.elapsed))
+
+    path = os.path.join(folder, f'healthcare_{profile}_{size}.db')
+    memory = MemoryDatabase(path) if options['memory'] else None
+    conn = memory.conn if memory else sqlite3.connect(path, isolation_level=None)
+    if options['pragmas']:
+        for name, value in PERFORMANCE_PRAGMAS.items():
+            conn.execute(f'PRAGMA {name}={value}')
+    repo = ProductRepository(conn, HEALTHCARE, lock=memory.lock if memory else None)
+    repo.create_table()
+    summary = None
+    if options['indexes']:
+        ProductSearch(conn, 'MyProd', 'id', 'name').ensure_index()
+        summary = InventorySummary(conn)
+        summary.ensure()
+
+    with _Timer() as t:
+        repo.add_many(_healthcare_catalog(size, rng))
+    add('insert', 'add_many', size, t)
+
+    repeat = 10
+    with _Timer() as t:
+        for _ in range(repeat):
+            conn.execute('SELECT COUNT(*), SUM(qty), SUM(price * qty), SUM(qty < 10) FROM MyProd').fetchone()
+    add('dashboard', 'scan', repeat, t)
+    if summary is not None:
+        with _Timer() as t:
+            for _ in range(repeat):
+                summary.totals()
+        add('dashboard', 'summary', repeat, t)
+
+    with _Timer() as t:
+        conn.execute('SELECT id, name, price, qty FROM MyProd').fetchall()
+    add('table_open', 'fetch_all', 1, t)
+    with _Timer() as t:
+        model = SqlTableModel(conn, 'MyProd', ['id', 'name', 'price', 'qty'])
+        model.sort(2)
+    add('table_open', 'sql_model', 1, t)
+
+    with _Timer() as t:
+        for _ in range(samples):
+            repo.update(rng.randint(1, size), None, None, rng.randint(0, 100))
+    add('point_update', 'repository', samples, t)
+
+    if memory is not None:
+        memory.close()
+    else:
+        conn.close()
+    return results
+
+
+def run(sizes=SIZES, profiles=tuple(PROFILES), samples=1000, pages=50, export_limit=100_000, seed=1):
+    results = []
+    for size in sizes:
+        for profile in profiles:
+            with tempfile.TemporaryDirectory() as folder:
+                results += bench_products(folder, size, profile, samples, pages, export_limit, seed)
+                results += bench_healthcare(folder, size, profile, samples, seed)
+    return results
+
+
+def _key(r):
+    return r['size'], r['profile'], r['op'], r['method']
+
+
+def compare(old_results, new_results):
+    """같은 (크기, 방식, 작업, method) 끼리 (이전 초, 지금 초, 몇 배 빨라졌는지). 횟수가 다르면 건너뜀"""
+    old = {_key(r): r for r in old_results}
+    rows = []
+    for r in new_results:
+        before = old.get(_key(r))
+        if before is not None and before['count'] == r['count'] and r['seconds']:
+            rows.append((r, before['seconds'], r['seconds'], before['seconds'] / r['seconds']))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="제품 DB 계층 벤치마크")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="행 수 (쉼표로 구분)")
+    parser.add_argument("--profiles", default=",".join(PROFILES), help="저장 방식 (쉼표로 구분)")
+    parser.add_argument("--samples", type=int, default=1000, help="한 행씩 수정/삭제하는 횟수")
+    parser.add_argument("--pages", type=int, default=50, help="paged_select 페이지 수")
+    parser.add_argument("--export-limit", type=int, default=100_000, help="엑셀로 내보낼 최대 행 수")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", help="비교할 이전 JSON 결과")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    profiles = [p for p in args.profiles.split(",") if p]
+    unknown = set(profiles) - set(PROFILES)
+    if unknown:
+        parser.error(f"알 수 없는 방식: {', '.join(sorted(unknown))}")
+    results = run(sizes, profiles, args.samples, args.pages, args.export_limit, args.seed)
+
+    print(f"{'행':>9} {'방식':<9}{'작업':<14}{'method':<16}{'횟수':>9}{'초':>10}{'ms/회':>11}")
+    for r in results:
+        print(f"{r['size']:>9} {r['profile']:<9}{r['op']:<14}{r['method']:<16}"
+              f"{r['count']:>9}{r['seconds']:>10.3f}{r['ms_per_op']:>11.4f}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)['results']
+        print(f"\n{args.compare} 과 비교 (배 = 이전 초 / 지금 초)")
+        for r, before, now, ratio in compare(previous, results):
+            print(f"{r['size']:>9} {r['profile']:<9}{r['op']:<14}{r['method']:<16}"
+                  f"{before:>10.3f}{now:>10.3f}{ratio:>8.2f}배")
+
+    if args.json:
+        report = {
+            'settings': vars(args),
+            'environment': {'python': platform.python_version(), 'sqlite': sqlite3.sqlite_version,
+                            'platform': platform.platform()},
+            'results': results,
+        }
+        with open(args.json, "wt", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+import queue
+import sqlite3
+import time
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from product_repository import ProductRepository
+
+# 다른 프로그램이 DB 를 잠그고 있을 때 (SQLITE_BUSY) 다시 시도하는 횟수와 첫 대기 시간(초, 매번 두 배)
+BUSY_RETRIES = 5
+BUSY_BACKOFF = 0.1
+
+
+def is_busy(error):
+    """DB 가 잠겨 있어서 난 오류인지 (잠시 뒤 다시 하면 되는 오류)"""
+    name = getattr(error, 'sqlite_errorname', '')   #파이썬 3.11 부터
+    return name in ('SQLITE_BUSY', 'SQLITE_LOCKED') or 'locked' in str(error) or 'busy' in str(error)
+
+
+def coalesce(commands):
+    """같은 제품에 대한 연속 수정을 하나로 합침 (나중 값이 우선, None 은 앞의 값 유지)
+
+    commands : (번호, 동작, id, 값) 목록
+    반환값   : [동작, id, 값, 번호 목록] 목록 (실행 순서대로)
+    """
+    ops, pending = [], {}
+    for ticket, action, product_id, values in commands:
+        op = pending.get(product_id) if action == 'update' else None
+        if op is not None:
+            op[2] = tuple(old if new is None else new for new, old in zip(values, op[2]))
+            op[3].append(ticket)
+            continue
+        op = [action, product_id, values, [ticket]]
+        ops.append(op)
+        if action == 'update':
+            pending[product_id] = op
+        elif action == 'delete':
+            pending.pop(product_id, None)
+    return ops
+
+
+class DbWriter(QThread):
+    """입력/수정/삭제를 별도 스레드 하나에서 차례로 실행 (창이 DB 를 기다리며 멈추지 않음)
+
+    add/update/delete 는 명령을 큐에 넣고 번호만 돌려줍니다.
+    쓰기 스레드는 첫 명령을 받은 뒤 coalesce_ms 동안 들어온 명령까지 모아
+    트랜잭션 하나로 씁니다. (같은 제품을 여러 번 고치면 한 번만 UPDATE)
+    명령마다 SAVEPOINT 를 두어 하나가 실패해도 나머지는 저장됩니다.
+    DB 가 잠겨 있으면 BUSY_RETRIES 번까지 기다렸다가 묶음 전체를 다시 씁니다.
+
+    결과는 신호로 알려 주며, 받는 쪽(창)의 스레드에서 실행됩니다.
+    committed 를 ProductRepository.notify 에 연결하면 모델이 바뀐 행만 고칩니다.
+
+    writer = DbWriter('healthcare.db', HEALTHCARE)
+    writer.committed.connect(db.products.notify)
+    writer.done.connect(lambda ticket, action, result: print(action, result))
+    writer.start()
+    writer.add('비타민 D', 12000, 30)
+    ...
+    writer.stop(); writer.wait()      # 남은 명령을 모두 쓰고 끝남
+    """
+    done = pyqtSignal(int, str, object)     #번호, 동작, 결과 (add 는 새 id)
+    failed = pyqtSignal(int, str, str)      #번호, 동작, 오류 메시지
+    committed = pyqtSignal(str, object)     #동작('insert'/'update'/'delete'), id 목록
+
+    def __init__(self, db_path, spec, coalesce_ms=30, max_batch=500, busy_timeout=1.0,
+                 retries=BUSY_RETRIES, connect=None, lock=None, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.spec = spec
+        self.connect = connect      #연결을 만드는 함수 (예: HealthcareDB.writer_connection)
+        self.lock = lock            #같은 DB 를 쓰는 저장소와 나눠 쓸 쓰기 잠금
+        self.coalesce = coalesce_ms / 1000
+        self.max_batch = max_batch
+        self.busy_timeout = busy_timeout
+        self.retries = retries
+        self._queue = queue.Queue()
+        self._tickets = 0
+
+    # -------------------------------------------------------------------------
+    # 창(GUI 스레드)에서 부르는 함수 : 바로 반환
+    # -------------------------------------------------------------------------
+    def add(self, *values):
+        return self._put('add', None, values)
+
+    def update(self, product_id, *values):
+        """columns 순서대로 새 값 (None 은 그대로 둠)"""
+        return self._put('update', product_id, values)
+
+    def delete(self, product_id):
+        return self._put('delete', product_id, ())
+
+    def stop(self):
+        """큐에 남은 명령을 모두 쓴 뒤 스레드 종료"""
+        self._queue.put(None)
+
+    def _put(self, action, product_id, values):
+        self._tickets += 1
+        self._queue.put((self._tickets, action, product_id, values))
+        return self._tickets
+
+    # -------------------------------------------------------------------------
+    # 쓰기 스레드
+    # -------------------------------------------------------------------------
+    def run(self):
+        if self.connect is not None:
+            conn = self.connect()
+        else:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=self.busy_timeout)
+        repo = ProductRepository(conn, self.spec, cache_size=0, lock=self.lock)
+        try:
+            stopping = False
+            while not stopping:
+                commands, stopping = self._collect()
+                if commands:
+                    self._write(repo, coalesce(commands))
+        finally:
+            conn.close()
+
+    def _collect(self):
+        """첫 명령을 기다린 뒤 coalesce 초 동안 (최대 max_batch 개) 더 모음. (명령 목록, 종료 여부)"""
+        first = self._queue.get()
+        if first is None:
+            return [], True
+        commands = [first]
+        deadline = time.monotonic() + self.coalesce
+        while len(commands) < self.max_batch:
+            try:
+                command = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if command is None:
+                return commands, True
+            commands.append(command)
+        return commands, False
+
+    def _write(self, repo, ops):
+        for attempt in range(self.retries + 1):
+            try:
+                results = self._apply(repo, ops)
+                break
+            except sqlite3.Error as e:
+                # COMMIT 에서 잠겨 있으면 트랜잭션이 열린 채로 남으므로 되돌리고 다시
+                if repo.conn.in_transaction:
+                    repo.conn.execute('ROLLBACK')
+                if not is_busy(e) or attempt == self.retries:
+                    for action, _, _, tickets in ops:
+                        for ticket in tickets:
+                            self.failed.emit(ticket, action, str(e))
+                    return
+                time.sleep(BUSY_BACKOFF * 2 ** attempt)
+
+        # 커밋된 뒤에 알림
+        changed = {'insert': [], 'update': [], 'delete': []}
+        for (action, product_id, _, tickets), (result, error) in zip(ops, results):
+            for ticket in tickets:
+                if error is None:
+                    self.done.emit(ticket, action, result)
+                else:
+                    self.failed.emit(ticket, action, error)
+            if error is None:
+                changed['insert' if action == 'add' else action].append(
+                    result if action == 'add' else product_id)
+        for action, ids in changed.items():
+            if ids:
+                self.committed.emit(action, ids)
+
+    def _apply(self, repo, ops):
+        """한 트랜잭션으로 실행. 명령마다 (결과, 오류 메시지)"""
+        results = []
+        with repo.transaction() as conn:
+            for action, product_id, values, _ in ops:
+                conn.execute('SAVEPOINT command')
+                try:
+                    if action == 'add':
+                        result = repo.add(*values)
+                    elif action == 'update':
+                        result = repo.update(product_id, *values)
+                    else:
+                        result = repo.delete(product_id)
+                except sqlite3.Error as e:
+                    if is_busy(e):
+                        raise
+                    conn.execute('ROLLBACK TO command')
+                    results.append((None, str(e)))
+                else:
+                    results.append((result, None))
+                conn.execute('RELEASE command')
+        return results
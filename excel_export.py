@@ -0,0 +1,95 @@
+import os
+
+from openpyxl import Workbook
+from PyQt5.QtCore import QThread, pyqtSignal
+
+# 엑셀 시트 한 장의 최대 행 수 (헤더 포함)
+EXCEL_MAX_ROWS = 1_048_576
+
+
+def export_rows(rows, path, headers, sheet_title='Products', max_rows=EXCEL_MAX_ROWS,
+                progress=None, is_cancelled=None, every=5000):
+    """행을 하나씩 받아 바로 엑셀 파일에 쓰기 (openpyxl write-only 모드)
+
+    모든 행을 메모리에 모으지 않으므로 행 수와 상관없이 메모리 사용량이 일정합니다.
+    값은 DB 에서 받은 그대로(숫자는 숫자로) 씁니다.
+    한 시트가 max_rows 행을 넘으면 Products_2, Products_3 ... 시트로 이어서 씁니다.
+
+    rows         : 행(tuple)을 내는 iterable (DB 커서 그대로 가능)
+    progress     : every 행마다 지금까지 쓴 행 수로 호출
+    is_cancelled : every 행마다 확인해서 True 면 저장하지 않고 None 반환
+    반환값       : 쓴 행 수 (취소하면 None)
+    """
+    wb = Workbook(write_only=True)
+    ws = None
+    in_sheet = max_rows     #첫 행에서 시트를 만들도록
+    count = 0
+    for row in rows:
+        if in_sheet >= max_rows:
+            number = len(wb.worksheets) + 1
+            ws = wb.create_sheet(sheet_title if number == 1 else f'{sheet_title}_{number}')
+            ws.append(headers)
+            in_sheet = 1
+        ws.append(row)
+        in_sheet += 1
+        count += 1
+        if count % every == 0:
+            if is_cancelled is not None and is_cancelled():
+                #쓰던 시트를 닫아 둠 (openpyxl 임시 파일은 프로그램 종료 시 삭제됨)
+                for sheet in wb.worksheets:
+                    sheet.close()
+                return None
+            if progress is not None:
+                progress(count)
+    if ws is None:
+        wb.create_sheet(sheet_title).append(headers)
+
+    #다 쓴 다음 바꿔치기 (저장 중에 실패해도 같은 이름의 기존 파일은 그대로)
+    tmp = path + '.part'
+    wb.save(tmp)
+    os.replace(tmp, path)
+    return count
+
+
+class ExportWorker(QThread):
+    """엑셀 내보내기를 별도 스레드에서 실행 (창이 멈추지 않음)
+
+    connect : 이 스레드에서 쓸 DB 연결을 만드는 함수 (예: HealthcareDB.reader)
+    sql, params : 내보낼 행을 읽는 SELECT (rows 를 주면 DB 대신 그 행을 씀)
+    """
+    progress = pyqtSignal(int)      #지금까지 쓴 행 수
+    done = pyqtSignal(str, int)     #파일 이름, 행 수
+    error = pyqtSignal(str)
+
+    def __init__(self, path, headers, connect=None, sql=None, params=(), rows=None):
+        super().__init__()
+        self.path = path
+        self.headers = headers
+        self.connect = connect
+        self.sql = sql
+        self.params = params
+        self.rows = rows
+        self._cancelled = False
+
+    def cancel(self):
+        """내보내기 취소 (파일은 만들지 않음)"""
+        self._cancelled = True
+
+    def run(self):
+        conn = None
+        try:
+            if self.rows is not None:
+                rows = self.rows
+            else:
+                conn = self.connect()
+                rows = conn.execute(self.sql, self.params)
+            count = export_rows(rows, self.path, self.headers,
+                                progress=self.progress.emit,
+                                is_cancelled=lambda: self._cancelled)
+            if count is not None:
+                self.done.emit(self.path, count)
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            if conn is not None:
+                conn.close()
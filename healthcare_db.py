@@ -0,0 +1,135 @@
+import sqlite3
+from pathlib import Path
+
+from inventory_summary import InventorySummary
+from memory_db import SNAPSHOT_INTERVAL, MemoryDatabase
+from product_import import import_file
+from product_repository import HEALTHCARE, ProductRepository
+from product_search import ProductSearch
+
+
+SAMPLE_DATA = [
+    ('종합영양제', 25000, 50),
+    ('비타민 C', 15000, 75),
+    ('오메가3', 35000, 30),
+    ('칼슘 보충제', 20000, 45),
+    ('유산균 프로바이오틱스', 28000, 40)
+]
+
+
+class HealthcareDB:
+    """MyProd 테이블 데이터 접근 계층
+
+    창이 떠 있는 동안 연결 하나를 유지합니다. (클릭할 때마다 연결하고 스키마를
+    다시 읽지 않음, 네트워크 드라이브에 있는 DB 에서 특히 차이가 큼)
+    - 같은 SQL 은 연결의 문장 캐시(cached_statements)에서 재사용
+    - 쓰기는 transaction() 을 통해서만, 잠금으로 한 번에 하나씩 (single writer)
+    - 행 단위 CRUD, 캐시, 변경 알림은 self.products (product_repository.py)
+    - 다른 스레드에서 읽을 때는 reader() 로 따로 연결
+    - 제품명 검색은 FTS5 trigram 색인 (product_search.py)
+    - 재고 합계 / 재고 부족 목록은 트리거로 갱신되는 요약 테이블 (inventory_summary.py)
+    - memory=True 면 파일을 메모리로 올려서 쓰고 주기적으로/닫을 때/snapshot() 으로 파일에 저장
+      (memory_db.py, 읽기가 많은 키오스크용)
+    """
+
+    def __init__(self, db_path='healthcare.db', cached_statements=256, memory=False,
+                 snapshot_interval=SNAPSHOT_INTERVAL):
+        self.db_path = db_path
+        self.cached_statements = cached_statements
+        self.memory = None
+        # isolation_level=None : 트랜잭션은 transaction() 에서 직접 시작/종료
+        if memory:
+            self.memory = MemoryDatabase(db_path, cached_statements=cached_statements)
+            self.conn = self.memory.conn
+        else:
+            self.conn = sqlite3.connect(db_path, isolation_level=None,
+                                        cached_statements=cached_statements,
+                                        check_same_thread=False)
+            # WAL 은 네트워크 드라이브에서 쓸 수 없으므로 기본 저널 그대로 사용
+            self.conn.execute('PRAGMA cache_size=-16000')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.products = ProductRepository(self.conn, HEALTHCARE,
+                                          lock=self.memory.lock if memory else None)
+        self.name_search = ProductSearch(self.conn, 'MyProd', 'id', 'name',
+                                         ['id', 'name', 'price', 'qty'])
+        self.inventory = InventorySummary(self.conn)
+        self.init_schema()
+        if memory:
+            self.products.subscribe(self.memory.mark_dirty)
+            if snapshot_interval:
+                self.memory.start_snapshots(snapshot_interval)
+
+    def init_schema(self):
+        """테이블 생성, 비어 있으면 샘플 데이터 추가, 검색 색인 / 재고 요약이 없으면 생성"""
+        with self.transaction() as conn:
+            conn.execute(HEALTHCARE.create_sql)
+            if conn.execute('SELECT COUNT(*) FROM MyProd').fetchone()[0] == 0:
+                conn.executemany('INSERT INTO MyProd (name, price, qty) VALUES (?, ?, ?)',
+                                 SAMPLE_DATA)
+            self.name_search.ensure_index()
+            self.inventory.ensure()
+
+    def transaction(self):
+        """쓰기 트랜잭션 (예외가 나면 롤백)
+
+        with db.transaction() as conn:
+            conn.execute(...)
+        """
+        return self.products.transaction()
+
+    def reader(self):
+        """다른 스레드(백그라운드 작업)에서 쓸 읽기 전용 연결"""
+        if self.memory is not None:
+            return self.memory.connect(cached_statements=self.cached_statements)
+        uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+        return sqlite3.connect(uri, uri=True,
+                               cached_statements=self.cached_statements)
+
+    def writer_connection(self, timeout=1.0):
+        """쓰기 스레드(db_writer.DbWriter)용 연결. 잠겨 있으면 timeout 초까지 기다림"""
+        if self.memory is not None:
+            return self.memory.connect(isolation_level=None, timeout=timeout)
+        return sqlite3.connect(self.db_path, isolation_level=None, timeout=timeout)
+
+    def snapshot(self):
+        """메모리 모드에서 지금 내용을 파일로 저장 (파일 모드는 할 일 없음)"""
+        if self.memory is not None:
+            self.memory.snapshot(force=True)
+
+    def search_products(self, search_term, limit=500):
+        """이름에 search_term 이 들어간 제품을 관련도 순으로 최대 limit 개"""
+        return self.name_search.search(search_term, limit)
+
+    def inventory_totals(self):
+        """InventoryTotals(제품 수, 총 수량, 총 금액, 재고 부족 제품 수, 부족 기준)"""
+        return self.inventory.totals()
+
+    def low_stock(self, limit=100):
+        """재고 부족 제품 (id, 이름, 수량) 을 수량이 적은 순으로"""
+        return self.inventory.low_stock(limit)
+
+    def set_low_stock_threshold(self, threshold):
+        with self.transaction():
+            self.inventory.set_threshold(threshold)
+        if self.memory is not None:
+            self.memory.mark_dirty()
+
+    def add_product(self, name, price, qty):
+        """추가한 제품의 id 반환"""
+        return self.products.add(name, price, qty)
+
+    def update_product(self, product_id, name, price, qty):
+        self.products.update(product_id, name, price, qty)
+
+    def delete_product(self, product_id):
+        self.products.delete(product_id)
+
+    def import_products(self, path, **kwargs):
+        """CSV / xlsx 파일에서 제품 가져오기 (product_import.import_file 참고)"""
+        return import_file(self.products, path, **kwargs)
+
+    def close(self):
+        if self.memory is not None:
+            self.memory.close()
+        else:
+            self.conn.close()
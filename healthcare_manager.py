@@ -1,61 +1,57 @@
 import sys
-import sqlite3
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
-    QMessageBox, QAbstractItemView
+    QLabel, QLineEdit, QPushButton, QTableView,
+    QMessageBox, QAbstractItemView, QProgressDialog,
+    QGroupBox, QFormLayout, QSpinBox, QListWidget
 )
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QColor, QIcon
 from datetime import datetime
-from openpyxl import Workbook
+
+from db_writer import DbWriter
+from excel_export import ExportWorker
+from healthcare_db import HealthcareDB
+from product_repository import HEALTHCARE
+from sql_table_model import SqlTableModel
+from selection_totals import SelectionTotals
+
+# 검색 결과로 보여줄 최대 행 수 (관련도 순)
+SEARCH_LIMIT = 500
+# 재고 현황 패널에 보여줄 재고 부족 제품 수
+LOW_STOCK_LIMIT = 50
 
 
 class HealthcareProductManager(QMainWindow):
-    def __init__(self):
+    def __init__(self, memory=False):
         super().__init__()
         self.db_path = 'healthcare.db'
+        # True : DB 를 메모리로 올려서 쓰고 주기적으로 파일에 저장 (키오스크용, --memory)
+        self.memory = memory
+        self.search_term = None
+        self.export_worker = None
+        self.pending_writes = {}   # 쓰기 번호 → 완료 메시지
         self.init_database()
         self.init_ui()
         self.load_data()
 
     def init_database(self):
-        """데이터베이스 및 테이블 초기화"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # MyProd 테이블 생성
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS MyProd (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                price INTEGER NOT NULL,
-                qty INTEGER NOT NULL
-            )
-        ''')
-        
-        # 초기 샘플 데이터 추가 (데이터가 없을 경우만)
-        cursor.execute('SELECT COUNT(*) FROM MyProd')
-        if cursor.fetchone()[0] == 0:
-            sample_data = [
-                ('종합영양제', 25000, 50),
-                ('비타민 C', 15000, 75),
-                ('오메가3', 35000, 30),
-                ('칼슘 보충제', 20000, 45),
-                ('유산균 프로바이오틱스', 28000, 40)
-            ]
-            cursor.executemany(
-                'INSERT INTO MyProd (name, price, qty) VALUES (?, ?, ?)',
-                sample_data
-            )
-        
-        conn.commit()
-        conn.close()
+        """데이터베이스 연결 (창을 닫을 때까지 유지) 및 테이블 초기화
+
+        입력/수정/삭제는 쓰기 스레드(DbWriter)가 처리하고, 커밋되면 저장소 알림으로 표가 갱신됨
+        """
+        self.db = HealthcareDB(self.db_path, memory=self.memory)
+        self.writer = DbWriter(self.db_path, HEALTHCARE, connect=self.db.writer_connection,
+                               lock=self.db.products.lock)
+        self.writer.committed.connect(self.db.products.notify)
+        self.writer.done.connect(self.write_done)
+        self.writer.failed.connect(self.write_failed)
+        self.writer.start()
 
     def init_ui(self):
         """UI 초기화"""
         self.setWindowTitle('헬스케어 제품 관리 프로그램')
-        self.setGeometry(100, 100, 900, 600)
+        self.setGeometry(100, 100, 1150, 600)
         
         # 파랑색 계열 스타일 적용
         self.setStyleSheet("""
@@ -93,17 +89,17 @@ class HealthcareProductManager(QMainWindow):
             QPushButton:pressed {
                 background-color: #003d7a;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #ffffff;
                 alternate-background-color: #e6f2ff;
                 gridline-color: #4da6ff;
                 border: 1px solid #4da6ff;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
                 color: #003366;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0066cc;
                 color: white;
             }
@@ -199,6 +195,12 @@ class HealthcareProductManager(QMainWindow):
         self.export_btn.clicked.connect(self.export_to_excel)
         button_layout.addWidget(self.export_btn)
 
+        # 메모리 모드에서 지금 바로 파일에 저장하는 버튼
+        if self.memory:
+            self.snapshot_btn = QPushButton('파일에 저장')
+            self.snapshot_btn.clicked.connect(self.save_snapshot)
+            button_layout.addWidget(self.snapshot_btn)
+
         main_layout.addLayout(button_layout)
         
         # 테이블 영역
@@ -207,24 +209,39 @@ class HealthcareProductManager(QMainWindow):
         table_label.setStyleSheet('color: #003366;')
         main_layout.addWidget(table_label)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(['ID', '제품명', '가격', '수량'])
+        # 행을 전부 읽지 않고 스크롤하는 만큼만 DB 에서 읽는 모델
+        self.model = SqlTableModel(self.db.conn, 'MyProd', ['id', 'name', 'price', 'qty'],
+                                   ['ID', '제품명', '가격', '수량'],
+                                   numeric_columns=['id', 'price', 'qty'])
+        # 입력/수정/삭제된 행만 그 자리에서 고침 (전체를 다시 읽지 않음)
+        self.model.watch(self.db.products)
+        # 선택 합계 (선택이 바뀐 행만 더하고 빼기)
+        self.totals = SelectionTotals(self.model, 'price', 'qty')
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.verticalHeader().hide()
+        # 헤더 클릭 시 SQL 로 정렬
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(0, Qt.AscendingOrder)
         self.table.setColumnWidth(0, 50)
         self.table.setColumnWidth(1, 300)
         self.table.setColumnWidth(2, 150)
         self.table.setColumnWidth(3, 150)
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         # 멀티 선택 허용: 드래그, Shift/Ctrl 클릭으로 여러 행 선택 가능
         self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         # 선택 변경 시 합계 업데이트
-        self.table.itemSelectionChanged.connect(self.update_totals)
+        self.table.selectionModel().selectionChanged.connect(self.update_totals)
         
         # 테이블 행 선택 이벤트
-        self.table.itemClicked.connect(self.on_table_clicked)
+        self.table.clicked.connect(self.on_table_clicked)
         
-        main_layout.addWidget(self.table)
+        # 표 오른쪽에 재고 현황 패널 (요약 테이블에서 바로 읽음)
+        table_layout = QHBoxLayout()
+        table_layout.addWidget(self.table, 1)
+        table_layout.addWidget(self.create_inventory_panel())
+        main_layout.addLayout(table_layout)
 
         # 선택 합계 영역
         totals_layout = QHBoxLayout()
@@ -238,35 +255,67 @@ class HealthcareProductManager(QMainWindow):
         self.total_price_label.setStyleSheet('color: #003366; margin-left: 20px;')
         totals_layout.addWidget(self.total_price_label)
         main_layout.addLayout(totals_layout)
+        # 모델을 다시 읽으면 선택이 신호 없이 사라지므로 합계도 초기화
+        self.model.modelReset.connect(self.reset_totals)
+        # 입력/수정/삭제가 커밋될 때마다 재고 현황 갱신
+        self.db.products.subscribe(lambda action, ids: self.refresh_inventory())
+        self.refresh_inventory()
         
         central_widget.setLayout(main_layout)
 
+    def create_inventory_panel(self):
+        """재고 현황 : 전체 제품 수 / 총 재고 수량 / 총 재고 금액 / 재고 부족 목록"""
+        panel = QGroupBox('재고 현황')
+        panel.setFixedWidth(230)
+        layout = QVBoxLayout()
+        form = QFormLayout()
+        self.inv_products_label = QLabel('0')
+        self.inv_qty_label = QLabel('0')
+        self.inv_value_label = QLabel('0')
+        self.inv_low_label = QLabel('0')
+        form.addRow('제품 수:', self.inv_products_label)
+        form.addRow('총 재고 수량:', self.inv_qty_label)
+        form.addRow('총 재고 금액:', self.inv_value_label)
+        form.addRow('재고 부족:', self.inv_low_label)
+        # 재고 부족 기준 (수량이 이 값보다 작은 제품)
+        self.threshold_spin = QSpinBox()
+        self.threshold_spin.setRange(0, 1_000_000)
+        self.threshold_spin.setValue(self.db.inventory_totals().threshold)
+        self.threshold_spin.editingFinished.connect(self.change_threshold)
+        form.addRow('부족 기준 (미만):', self.threshold_spin)
+        layout.addLayout(form)
+        self.low_stock_list = QListWidget()
+        layout.addWidget(self.low_stock_list)
+        panel.setLayout(layout)
+        return panel
+
+    def refresh_inventory(self):
+        """요약 테이블에서 읽어서 표시 (제품 수와 상관없이 한 행 + 부족 목록 일부만 읽음)"""
+        totals = self.db.inventory_totals()
+        self.inv_products_label.setText(f'{totals.products:,}')
+        self.inv_qty_label.setText(f'{totals.qty:,}')
+        self.inv_value_label.setText(f'{totals.value:,}')
+        self.inv_low_label.setText(f'{totals.low_stock:,}개')
+        self.low_stock_list.clear()
+        for product_id, name, qty in self.db.low_stock(LOW_STOCK_LIMIT):
+            self.low_stock_list.addItem(f'{name} ({qty:,})')
+
+    def change_threshold(self):
+        threshold = self.threshold_spin.value()
+        if threshold != self.db.inventory_totals().threshold:
+            self.db.set_low_stock_threshold(threshold)
+            self.refresh_inventory()
+
     def load_data(self, search_term=None):
         """데이터 로드"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        if search_term:
-            cursor.execute(
-                'SELECT * FROM MyProd WHERE name LIKE ?',
-                (f'%{search_term}%',)
-            )
+        self.search_term = search_term or None
+        if self.search_term:
+            self.model.set_rows(self.db.search_products(self.search_term, SEARCH_LIMIT))
         else:
-            cursor.execute('SELECT * FROM MyProd')
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        self.table.setRowCount(len(rows))
-        
-        for row_idx, row in enumerate(rows):
-            for col_idx, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # 직접 편집 방지
-                self.table.setItem(row_idx, col_idx, item)
+            self.model.set_filter()
         # 로드 후 선택 초기화 및 합계 업데이트
         self.table.clearSelection()
-        self.update_totals()
+        self.show_totals()
 
     def add_product(self):
         """제품 추가"""
@@ -285,27 +334,18 @@ class HealthcareProductManager(QMainWindow):
             QMessageBox.warning(self, '경고', '가격과 수량은 숫자여야 합니다.')
             return
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            'INSERT INTO MyProd (name, price, qty) VALUES (?, ?, ?)',
-            (name, price, qty)
-        )
-        conn.commit()
-        conn.close()
-        
-        QMessageBox.information(self, '성공', '제품이 추가되었습니다.')
+        ticket = self.writer.add(name, price, qty)
+        self.pending_writes[ticket] = '제품이 추가되었습니다.'
         self.clear_inputs()
-        self.load_data()
 
     def update_product(self):
         """제품 수정"""
-        selected_row = self.table.currentRow()
+        selected_row = self.table.currentIndex().row()
         if selected_row < 0:
             QMessageBox.warning(self, '경고', '수정할 제품을 선택하세요.')
             return
         
-        product_id = int(self.table.item(selected_row, 0).text())
+        product_id = self.model.row_id(selected_row)
         name = self.name_input.text().strip()
         price_text = self.price_input.text().strip()
         qty_text = self.qty_input.text().strip()
@@ -321,27 +361,20 @@ class HealthcareProductManager(QMainWindow):
             QMessageBox.warning(self, '경고', '가격과 수량은 숫자여야 합니다.')
             return
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            'UPDATE MyProd SET name = ?, price = ?, qty = ? WHERE id = ?',
-            (name, price, qty, product_id)
-        )
-        conn.commit()
-        conn.close()
-        
-        QMessageBox.information(self, '성공', '제품이 수정되었습니다.')
+        # 바뀌기 전 값으로 선택 합계에서 빼 두고 수정 (수정된 행은 모델이 알아서 고침)
+        self.table.clearSelection()
+        ticket = self.writer.update(product_id, name, price, qty)
+        self.pending_writes[ticket] = '제품이 수정되었습니다.'
         self.clear_inputs()
-        self.load_data()
 
     def delete_product(self):
         """제품 삭제"""
-        selected_row = self.table.currentRow()
+        selected_row = self.table.currentIndex().row()
         if selected_row < 0:
             QMessageBox.warning(self, '경고', '삭제할 제품을 선택하세요.')
             return
         
-        product_id = int(self.table.item(selected_row, 0).text())
+        product_id = self.model.row_id(selected_row)
         
         reply = QMessageBox.question(
             self, '확인', '정말 삭제하시겠습니까?',
@@ -349,15 +382,23 @@ class HealthcareProductManager(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM MyProd WHERE id = ?', (product_id,))
-            conn.commit()
-            conn.close()
-            
-            QMessageBox.information(self, '성공', '제품이 삭제되었습니다.')
+            self.table.clearSelection()
+            ticket = self.writer.delete(product_id)
+            self.pending_writes[ticket] = '제품이 삭제되었습니다.'
             self.clear_inputs()
-            self.load_data()
+
+    def write_done(self, ticket, action, result):
+        """쓰기 스레드에서 커밋이 끝난 뒤 (표는 저장소 알림으로 이미 갱신됨)"""
+        message = self.pending_writes.pop(ticket, None)
+        # 검색 결과를 보고 있으면 새 제품이 결과에 들어가는지 다시 검색
+        if action == 'add' and self.search_term:
+            self.load_data(self.search_term)
+        if message:
+            QMessageBox.information(self, '성공', message)
+
+    def write_failed(self, ticket, action, message):
+        self.pending_writes.pop(ticket, None)
+        QMessageBox.critical(self, '오류', f'저장하지 못했습니다:\n{message}')
 
     def search_product(self):
         """제품 검색"""
@@ -377,69 +418,101 @@ class HealthcareProductManager(QMainWindow):
 
     def on_table_clicked(self):
         """테이블 행 클릭 시 입력 필드에 값 표시"""
-        selected_row = self.table.currentRow()
+        selected_row = self.table.currentIndex().row()
         if selected_row >= 0:
-            self.name_input.setText(self.table.item(selected_row, 1).text())
-            self.price_input.setText(self.table.item(selected_row, 2).text())
-            self.qty_input.setText(self.table.item(selected_row, 3).text())
-
-    def update_totals(self):
-        """선택된 행들의 총 수량과 총 금액을 계산하여 하단 라벨에 표시"""
-        selected = self.table.selectionModel().selectedRows()
-        total_qty = 0
-        total_price = 0
-        for idx in selected:
-            row = idx.row()
-            try:
-                price_item = self.table.item(row, 2)
-                qty_item = self.table.item(row, 3)
-                if price_item is None or qty_item is None:
-                    continue
-                price = int(price_item.text())
-                qty = int(qty_item.text())
-            except Exception:
-                continue
-            total_qty += qty
-            total_price += price * qty
+            _, name, price, qty = self.model.row_values(selected_row)
+            self.name_input.setText(name)
+            self.price_input.setText(str(price))
+            self.qty_input.setText(str(qty))
 
+    def update_totals(self, selected, deselected):
+        """선택이 바뀐 행만으로 총 수량과 총 금액을 갱신 (전체 선택은 SQL 합계)"""
+        self.totals.update(self.table.selectionModel(), selected, deselected)
+        self.show_totals()
+
+    def reset_totals(self):
+        self.totals.reset()
+        self.show_totals()
+
+    def show_totals(self):
+        """합계를 하단 라벨에 표시"""
         # 천 단위 구분 쉼표 적용
-        self.total_qty_label.setText(f'총 수량: {total_qty:,}')
-        self.total_price_label.setText(f'총 금액: {total_price:,}')
+        self.total_qty_label.setText(f'총 수량: {self.totals.qty:,}')
+        self.total_price_label.setText(f'총 금액: {self.totals.amount:,}')
 
     def export_to_excel(self):
-        """현재 테이블 내용을 openpyxl로 엑셀 파일로 저장"""
-        # 테이블에 있는 모든 행을 대상으로 저장 (필터링된 상태면 필터된 행)
-        row_count = self.table.rowCount()
-        if row_count == 0:
+        """검색 조건에 맞는 모든 행을 화면과 같은 순서로 엑셀 파일로 저장
+
+        화면에 읽어 둔 행이 아니라 DB 에서 바로 읽어서 백그라운드 스레드로 씁니다.
+        (숫자는 숫자로, 100만 행을 넘으면 시트를 나눔)
+        """
+        if self.export_worker is not None:
+            return  # 이미 저장 중
+        total = self.model.count_all()
+        if total == 0:
             QMessageBox.information(self, '알림', '저장할 제품이 없습니다.')
             return
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = 'Products'
-
-        # 헤더
+        filename = f"products_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         headers = ['ID', '제품명', '가격', '수량']
-        ws.append(headers)
+        if self.model.fixed:
+            # 검색 결과는 화면에 있는 행 그대로
+            worker = ExportWorker(filename, headers, rows=list(self.model.iter_all()))
+        else:
+            sql, params = self.model.query_all()
+            worker = ExportWorker(filename, headers, self.db.reader, sql, params)
 
-        for r in range(row_count):
-            row_values = []
-            for c in range(self.table.columnCount()):
-                item = self.table.item(r, c)
-                row_values.append(item.text() if item is not None else '')
-            ws.append(row_values)
+        self.export_progress = QProgressDialog('엑셀로 저장하는 중...', '취소', 0, total, self)
+        self.export_progress.setWindowTitle('엑셀로 저장')
+        self.export_progress.setWindowModality(Qt.WindowModal)
+        self.export_progress.setMinimumDuration(300)
+        self.export_progress.canceled.connect(worker.cancel)
+        worker.progress.connect(self.export_progress.setValue)
+        worker.done.connect(self.export_done)
+        worker.error.connect(self.export_failed)
+        worker.finished.connect(self.export_finished)
+        self.export_worker = worker
+        self.export_btn.setEnabled(False)
+        worker.start()
 
-        filename = f"products_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    def export_done(self, filename, count):
+        self.export_progress.reset()
+        QMessageBox.information(self, '완료', f'엑셀 파일로 저장되었습니다 ({count:,}행):\n{filename}')
+
+    def export_failed(self, message):
+        self.export_progress.reset()
+        QMessageBox.critical(self, '오류', f'엑셀 저장 중 오류가 발생했습니다:\n{message}')
+
+    def export_finished(self):
+        """저장이 끝나거나 취소된 뒤 정리"""
+        self.export_progress.reset()
+        self.export_worker = None
+        self.export_btn.setEnabled(True)
+
+    def save_snapshot(self):
+        """메모리 모드 : 지금까지의 내용을 DB 파일에 저장"""
         try:
-            wb.save(filename)
-            QMessageBox.information(self, '완료', f'엑셀 파일로 저장되었습니다:\n{filename}')
+            self.db.snapshot()
         except Exception as e:
-            QMessageBox.critical(self, '오류', f'엑셀 저장 중 오류가 발생했습니다:\n{e}')
+            QMessageBox.critical(self, '오류', f'파일에 저장하지 못했습니다:\n{e}')
+            return
+        QMessageBox.information(self, '완료', f'{self.db_path} 에 저장되었습니다.')
+
+    def closeEvent(self, event):
+        """창을 닫을 때 저장 중인 엑셀을 취소하고, 남은 쓰기를 마친 뒤 DB 연결 종료
+        (메모리 모드는 닫으면서 파일에 저장)"""
+        if self.export_worker is not None:
+            self.export_worker.cancel()
+            self.export_worker.wait()
+        self.writer.stop()
+        self.writer.wait()
+        self.db.close()
+        super().closeEvent(event)
 
 
 def main():
     app = QApplication(sys.argv)
-    window = HealthcareProductManager()
+    window = HealthcareProductManager(memory='--memory' in sys.argv)
     window.show()
     sys.exit(app.exec_())
 
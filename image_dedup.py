@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+이미지 중복 제거 (내용 해시 + 지각 해시)
+네이버 이미지 검색 결과에는 같은 그림이나 거의 같은 그림이 여러 번 섞여 있습니다.
+
+- 내용 해시(sha256) 가 같으면 완전히 같은 파일 → 저장하지 않음
+- 지각 해시(dHash 64비트) 의 해밍 거리가 threshold 이하이면 거의 같은 그림 → 저장하고 표시만
+- 폴더마다 .dedup.db (SQLite) 에 해시를 보관하므로 기존 폴더(예: 장원영/)에도 이어서 사용 가능
+
+사용 예)
+    python image_dedup.py 장원영              # 폴더를 색인하고 중복/유사 목록 출력
+    python image_dedup.py 장원영 --remove     # 완전히 같은 파일은 삭제
+
+    downloader = ImageDownloader('장원영', dedup=DedupIndex('장원영'))
+"""
+import argparse
+import hashlib
+import io
+import os
+import sqlite3
+import sys
+import threading
+
+from PIL import Image
+
+INDEX_NAME = ".dedup.db"
+IMAGE_EXTS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp')
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def perceptual_hash(data):
+    """dHash: 9x8 흑백으로 줄인 뒤 가로로 이웃한 픽셀의 밝기 비교 (64비트 정수)
+    그림이 아니면 None"""
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            small = img.convert("L").resize((9, 8), Image.LANCZOS)
+            pixels = small.tobytes()
+    except Exception:
+        return None
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+class DedupIndex:
+    """폴더 하나의 해시 색인
+
+    check(data) -> ('duplicate', 기존 파일명) | ('near', [비슷한 파일명...]) | ('new', None)
+    """
+
+    def __init__(self, folder, threshold=6):
+        self.folder = folder
+        self.threshold = threshold
+        os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(folder, INDEX_NAME), check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS images (
+                filename TEXT PRIMARY KEY,
+                sha256 TEXT NOT NULL,
+                phash INTEGER,
+                size INTEGER,
+                mtime REAL,
+                near_of TEXT
+            )''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_images_sha ON images(sha256)')
+        self.conn.commit()
+        self._lock = threading.Lock()
+        #지각 해시는 메모리에 두고 비교 (SQLite INTEGER 는 부호 있는 64비트라 저장할 때 변환)
+        self._phashes = {name: _unsigned(p) for name, p in
+                         self.conn.execute('SELECT filename, phash FROM images WHERE phash IS NOT NULL')}
+
+    def _similar(self, phash, exclude=None):
+        if phash is None:
+            return []
+        return [name for name, other in self._phashes.items()
+                if name != exclude and hamming(phash, other) <= self.threshold]
+
+    def check(self, data):
+        sha = content_hash(data)
+        row = self.conn.execute('SELECT filename FROM images WHERE sha256=? LIMIT 1', (sha,)).fetchone()
+        if row:
+            return 'duplicate', row[0]
+        near = self._similar(perceptual_hash(data))
+        return ('near', near) if near else ('new', None)
+
+    def admit(self, filename, data, mtime=None):
+        """저장해도 되는지 판단하고 색인에 등록 (여러 스레드에서 호출해도 안전)
+
+        반환값 : check() 와 같음. 'duplicate' 이면 색인에 등록하지 않으므로 저장하지 말 것
+        """
+        sha = content_hash(data)
+        phash = perceptual_hash(data)
+        with self._lock:
+            row = self.conn.execute('SELECT filename FROM images WHERE sha256=? LIMIT 1', (sha,)).fetchone()
+            if row and row[0] != filename:
+                return 'duplicate', row[0]
+            near = self._similar(phash, exclude=filename)
+            self._record(filename, sha, phash, len(data), mtime, near[0] if near else None)
+        return ('near', near) if near else ('new', None)
+
+    def _record(self, filename, sha, phash, size, mtime, near_of):
+        self.conn.execute(
+            'INSERT OR REPLACE INTO images (filename, sha256, phash, size, mtime, near_of) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (filename, sha, _signed(phash), size, mtime, near_of))
+        self.conn.commit()
+        if phash is not None:
+            self._phashes[filename] = phash
+
+    def scan_folder(self):
+        """폴더에 있는 이미지 중 색인에 없거나 바뀐 파일만 색인 (증분)
+        반환값 : (새로 색인한 수, [(중복 파일, 원본 파일)...])"""
+        known = {name: (size, mtime) for name, size, mtime in
+                 self.conn.execute('SELECT filename, size, mtime FROM images')}
+        names = sorted(name for name in os.listdir(self.folder)
+                       if name.lower().endswith(IMAGE_EXTS))
+        #폴더에서 지워진 파일은 색인에서도 제거
+        for name in set(known) - set(names):
+            self.forget(name)
+
+        added = 0
+        duplicates = []
+        for name in names:
+            path = os.path.join(self.folder, name)
+            stat = os.stat(path)
+            if known.get(name) == (stat.st_size, stat.st_mtime):
+                continue
+            with open(path, "rb") as f:
+                data = f.read()
+            status, match = self.admit(name, data, stat.st_mtime)
+            if status == 'duplicate':
+                duplicates.append((name, match))
+                continue
+            added += 1
+        return added, duplicates
+
+    def near_pairs(self):
+        """거의 같은 그림으로 표시된 (파일, 비슷한 파일) 목록"""
+        return self.conn.execute(
+            'SELECT filename, near_of FROM images WHERE near_of IS NOT NULL ORDER BY filename').fetchall()
+
+    def forget(self, filename):
+        with self._lock:
+            self.conn.execute('DELETE FROM images WHERE filename=?', (filename,))
+            self.conn.commit()
+            self._phashes.pop(filename, None)
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM images').fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+def _signed(value):
+    if value is None:
+        return None
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _unsigned(value):
+    return value + (1 << 64) if value < 0 else value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이미지 폴더 중복 검사")
+    parser.add_argument("folder", help="검사할 폴더")
+    parser.add_argument("--threshold", type=int, default=6, help="유사 판정 해밍 거리 (기본 6)")
+    parser.add_argument("--remove", action="store_true", help="완전히 같은 파일 삭제")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.folder):
+        print(f"폴더가 없습니다: {args.folder}", file=sys.stderr)
+        sys.exit(2)
+    index = DedupIndex(args.folder, args.threshold)
+    added, duplicates = index.scan_folder()
+    print(f"색인 {len(index)}개 (이번에 추가 {added}개)")
+    for name, original in duplicates:
+        print(f"[중복] {name} = {original}")
+        if args.remove:
+            os.remove(os.path.join(args.folder, name))
+    for name, near_of in index.near_pairs():
+        print(f"[유사] {name} ~ {near_of}")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+이미지 병렬 다운로드 엔진 (이어받기 지원)
+셀리니움을사용한_네이버검색이미지저장.py 에서 urlretrieve 로 한 장씩 받던 부분을 대신합니다.
+
+- 스레드 풀로 여러 장을 동시에 받고, 호스트별 연결은 재사용 (requests 세션 풀)
+- 실패하면 지수 백오프로 재시도 (연결 오류, 5xx, 429)
+- 임시 파일(.part)에 받은 다음 os.replace 로 바꿔치기 → 중간에 끊겨도 깨진 파일이 남지 않음
+- 폴더마다 manifest(.manifest.json)에 완료된 파일을 기록 → 다시 실행하면 받은 파일은 건너뜀
+- dedup(image_dedup.DedupIndex)을 주면 같은 그림은 저장하지 않고, 비슷한 그림은 표시만 함
+- on_saved(경로) 를 주면 파일이 저장될 때마다 호출 (image_pipeline.ImagePipeline.submit 연결용)
+
+사용 예)
+    downloader = ImageDownloader('장원영')
+    stats = downloader.download_all([(url, '장원영_1.jpg'), ...])
+    print(stats)
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+MANIFEST_NAME = ".manifest.json"
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+}
+
+# 다시 시도해 볼 만한 응답 코드
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class DownloadError(Exception):
+    """재시도 후에도 받지 못한 경우"""
+
+
+class ImageDownloader:
+    """폴더 하나에 이미지를 병렬로 받는 클래스
+
+    max_workers : 동시에 받는 스레드 수
+    retries     : 실패 시 다시 시도하는 횟수
+    backoff     : 첫 재시도 대기(초), 다음부터 두 배씩
+    dedup       : image_dedup.DedupIndex (없으면 중복 검사 안 함)
+    on_saved    : 새 파일이 저장될 때마다 호출할 함수 (경로를 인자로 받음)
+    """
+
+    def __init__(self, folder, max_workers=8, retries=3, backoff=0.5, timeout=15,
+                 dedup=None, on_saved=None):
+        self.folder = folder
+        self.dedup = dedup
+        self.on_saved = on_saved
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        os.makedirs(folder, exist_ok=True)
+
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max_workers, pool_block=True)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self.manifest_path = os.path.join(folder, MANIFEST_NAME)
+        self.manifest = self._load_manifest()
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # manifest
+    # -------------------------------------------------------------------------
+    def _load_manifest(self):
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, "rt", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass    #깨진 manifest 는 무시하고 새로 만든다
+        return {}
+
+    def save_manifest(self):
+        with self._lock:
+            data = json.dumps(self.manifest, ensure_ascii=False, indent=1)
+        _atomic_write(self.manifest_path, data.encode("utf-8"))
+
+    def is_complete(self, url, filename):
+        """manifest 에 같은 주소로 기록되어 있고 파일 크기도 같으면 완료로 본다"""
+        entry = self.manifest.get(filename)
+        if not entry or entry.get('url') != url:
+            return False
+        if entry.get('duplicate_of'):
+            return True     #중복이라 저장하지 않은 파일
+        path = os.path.join(self.folder, filename)
+        return os.path.exists(path) and os.path.getsize(path) == entry.get('size')
+
+    # -------------------------------------------------------------------------
+    # 다운로드
+    # -------------------------------------------------------------------------
+    def fetch(self, url):
+        """이미지 한 장을 bytes 로 받기 (재시도 포함)"""
+        delay = self.backoff
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+                if response.status_code in RETRY_STATUS:
+                    raise requests.HTTPError(f"{response.status_code} 응답", response=response)
+                response.raise_for_status()
+                return response.content
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                status = getattr(e.response, 'status_code', None)
+                if status is not None and status not in RETRY_STATUS:
+                    raise DownloadError(f"{url}: {e}") from e
+                if attempt == self.retries:
+                    raise DownloadError(f"{url}: {e}") from e
+                time.sleep(delay)
+                delay *= 2
+
+    def download(self, url, filename):
+        """한 장 받아서 저장
+
+        반환값 : 'skipped'(이미 받음), 'duplicate'(같은 그림이 있어 저장 안 함),
+                 'near'(비슷한 그림이 있지만 저장함), 'downloaded'
+        """
+        if self.is_complete(url, filename):
+            return 'skipped'
+        data = self.fetch(url)
+        status = 'downloaded'
+        entry = {'url': url, 'size': len(data)}
+        if self.dedup is not None:
+            result, match = self.dedup.admit(filename, data)
+            if result == 'duplicate':
+                with self._lock:
+                    self.manifest[filename] = {'url': url, 'duplicate_of': match}
+                return 'duplicate'
+            if result == 'near':
+                status = 'near'
+                entry['near'] = match
+        path = os.path.join(self.folder, filename)
+        try:
+            _atomic_write(path, data)
+        except OSError:
+            if self.dedup is not None:
+                self.dedup.forget(filename)
+            raise
+        with self._lock:
+            self.manifest[filename] = entry
+        if self.on_saved is not None:
+            self.on_saved(path)
+        return status
+
+    def download_all(self, items, save_every=50):
+        """items : (주소, 파일명) 목록. 결과 통계 dict 반환
+
+        manifest 는 save_every 장마다, 그리고 마지막에 저장합니다.
+        """
+        stats = {'downloaded': 0, 'skipped': 0, 'duplicate': 0, 'near': 0,
+                 'failed': 0, 'errors': [], 'seconds': 0.0}
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self.download, url, filename): url
+                           for url, filename in items}
+                for n, future in enumerate(as_completed(futures), 1):
+                    try:
+                        status = future.result()
+                        stats[status] += 1
+                        if status == 'near':
+                            stats['downloaded'] += 1
+                    except Exception as e:
+                        stats['failed'] += 1
+                        stats['errors'].append(str(e))
+                    if n % save_every == 0:
+                        self.save_manifest()
+        finally:
+            self.save_manifest()
+        stats['seconds'] = round(time.perf_counter() - start, 3)
+        return stats
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _atomic_write(path, data):
+    """같은 폴더의 임시 파일에 쓰고 바꿔치기 (중간에 끊겨도 원래 파일은 그대로)"""
+    tmp = f"{path}.{threading.get_ident()}.part"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+이미지 크기 변환 파이프라인 (멀티 프로세스)
+다운로드가 끝난 파일을 바로 받아서 디코딩 → 크기 변환 → 재인코딩(JPEG/WebP) 합니다.
+메타데이터(EXIF 등)는 저장하지 않고, 방향 정보만 픽셀에 반영합니다.
+
+- 프로세스 풀에서 처리하므로 CPU 코어를 모두 사용
+- ImageDownloader(on_saved=pipeline.submit) 로 연결하면 다운로드와 동시에 진행
+- 단계별(디코딩/크기 변환/인코딩) 처리량을 보고
+
+사용 예)
+    python image_pipeline.py 장원영 --sizes thumb=256,medium=1024 --format webp
+
+    with ImagePipeline('장원영') as pipeline:
+        with ImageDownloader('장원영', on_saved=pipeline.submit) as downloader:
+            downloader.download_all(items)
+    print(pipeline.report())
+"""
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageOps
+
+# 이름 -> 긴 변의 최대 길이(픽셀)
+SIZES = {'thumb': 256, 'medium': 1024}
+FORMATS = {'jpeg': ('JPEG', '.jpg'), 'webp': ('WEBP', '.webp')}
+IMAGE_EXTS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp')
+STAGES = ('decode', 'resize', 'encode')
+
+
+def process_image(path, out_dir, sizes, fmt, quality):
+    """이미지 한 장 변환 (프로세스 풀에서 실행). 단계별 걸린 시간과 크기를 반환"""
+    pil_format, ext = FORMATS[fmt]
+    base = os.path.splitext(os.path.basename(path))[0]
+    targets = {name: os.path.join(out_dir, name, base + ext) for name in sizes}
+    mtime = os.path.getmtime(path)
+    #이미 변환된 파일이 원본보다 새것이면 건너뜀
+    if all(os.path.exists(t) and os.path.getmtime(t) >= mtime for t in targets.values()):
+        return {'skipped': True}
+
+    timing = dict.fromkeys(STAGES, 0.0)
+    t = time.perf_counter()
+    with Image.open(path) as img:
+        img = ImageOps.exif_transpose(img)     #방향 정보는 반영하고 EXIF 자체는 버림
+        img = img.convert("RGB")
+    timing['decode'] = time.perf_counter() - t
+
+    bytes_out = 0
+    for name, max_side in sizes.items():
+        t = time.perf_counter()
+        resized = img.copy()
+        resized.thumbnail((max_side, max_side), Image.LANCZOS)
+        timing['resize'] += time.perf_counter() - t
+
+        t = time.perf_counter()
+        os.makedirs(os.path.dirname(targets[name]), exist_ok=True)
+        tmp = targets[name] + ".part"
+        #exif/icc 를 넘기지 않으므로 메타데이터 없이 저장됨
+        resized.save(tmp, pil_format, quality=quality, optimize=(pil_format == 'JPEG'))
+        os.replace(tmp, targets[name])
+        bytes_out += os.path.getsize(targets[name])
+        timing['encode'] += time.perf_counter() - t
+
+    return {'skipped': False, 'timing': timing,
+            'bytes_in': os.path.getsize(path), 'bytes_out': bytes_out}
+
+
+class ImagePipeline:
+    """파일이 도착하는 대로 프로세스 풀에서 변환하는 파이프라인
+
+    out_dir : 결과 폴더 (크기 이름별 하위 폴더가 생김, 기본은 원본 폴더)
+
+    프로세스 풀을 쓰므로 윈도우(spawn)에서는 작업 프로세스가 실행한 스크립트를 다시 import 합니다.
+    파이프라인을 만드는 스크립트는 실행 코드를 if __name__ == '__main__': 아래에 두어야 합니다.
+    (그렇지 않으면 input() 이나 브라우저 실행이 작업 프로세스마다 다시 실행되어 변환이 모두 실패)
+    """
+
+    def __init__(self, out_dir, sizes=None, fmt='jpeg', quality=85, workers=None):
+        self.out_dir = out_dir
+        self.sizes = dict(sizes or SIZES)
+        self.fmt = fmt
+        self.quality = quality
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.futures = []
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def submit(self, path):
+        """변환할 파일 추가 (다운로더 스레드에서 불러도 됨)"""
+        future = self.executor.submit(process_image, path, self.out_dir,
+                                      self.sizes, self.fmt, self.quality)
+        with self._lock:
+            self.futures.append((path, future))
+        return future
+
+    def close(self):
+        """남은 작업을 모두 끝내고 풀을 닫는다"""
+        self.executor.shutdown(wait=True)
+        self.finished = time.perf_counter()
+
+    def report(self):
+        """단계별 처리량 통계 dict"""
+        stats = {'files': 0, 'skipped': 0, 'failed': 0, 'errors': [],
+                 'bytes_in': 0, 'bytes_out': 0,
+                 'stage_seconds': dict.fromkeys(STAGES, 0.0)}
+        with self._lock:
+            futures = list(self.futures)
+        for path, future in futures:
+            try:
+                result = future.result()
+            except Exception as e:
+                stats['failed'] += 1
+                stats['errors'].append(f"{path}: {e}")
+                continue
+            if result['skipped']:
+                stats['skipped'] += 1
+                continue
+            stats['files'] += 1
+            stats['bytes_in'] += result['bytes_in']
+            stats['bytes_out'] += result['bytes_out']
+            for stage in STAGES:
+                stats['stage_seconds'][stage] += result['timing'][stage]
+
+        wall = (self.finished or time.perf_counter()) - self.started
+        stats['wall_seconds'] = round(wall, 3)
+        stats['files_per_sec'] = round(stats['files'] / wall, 1) if wall else 0.0
+        #단계별: 프로세스 하나가 그 단계만 한다면 초당 몇 장인지
+        stats['stage_files_per_sec'] = {
+            stage: round(stats['files'] / sec, 1) if sec else 0.0
+            for stage, sec in stats['stage_seconds'].items()}
+        return stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def format_report(stats, download=None):
+    """report() 결과를 사람이 읽기 좋은 문자열로"""
+    lines = []
+    if download:
+        sec = download['seconds'] or 1e-9
+        lines.append(f"download : {download['downloaded']}장, {download['downloaded'] / sec:.1f}장/초")
+    for stage in STAGES:
+        lines.append(f"{stage:<9}: {stats['stage_files_per_sec'][stage]}장/초 "
+                     f"(누적 {stats['stage_seconds'][stage]:.2f}초)")
+    lines.append(f"전체     : {stats['files']}장 {stats['wall_seconds']}초, "
+                 f"{stats['files_per_sec']}장/초, 건너뜀 {stats['skipped']}, 실패 {stats['failed']}, "
+                 f"{stats['bytes_in'] / 1e6:.1f}MB -> {stats['bytes_out'] / 1e6:.1f}MB")
+    return "\n".join(lines)
+
+
+def parse_sizes(text):
+    """'thumb=256,medium=1024' -> {'thumb': 256, 'medium': 1024}"""
+    sizes = {}
+    for part in text.split(","):
+        name, _, value = part.partition("=")
+        sizes[name.strip()] = int(value)
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이미지 폴더 크기 변환 (멀티 프로세스)")
+    parser.add_argument("folder", help="원본 이미지 폴더")
+    parser.add_argument("--out", help="결과 폴더 (기본: 원본 폴더)")
+    parser.add_argument("--sizes", type=parse_sizes, default=SIZES, help="예: thumb=256,medium=1024")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="jpeg")
+    parser.add_argument("--quality", type=int, default=85)
+    parser.add_argument("--workers", type=int, help="프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args()
+
+    with ImagePipeline(args.out or args.folder, args.sizes, args.format,
+                       args.quality, args.workers) as pipeline:
+        for name in sorted(os.listdir(args.folder)):
+            if name.lower().endswith(IMAGE_EXTS):
+                pipeline.submit(os.path.join(args.folder, name))
+    print(format_report(pipeline.report()))
+
+
+if __name__ == "__main__":
+    main()
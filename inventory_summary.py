@@ -0,0 +1,121 @@
+from collections import namedtuple
+
+from product_repository import transaction
+
+# 재고 부족 기준 (수량이 이 값보다 작으면 재고 부족)
+LOW_STOCK_THRESHOLD = 10
+
+InventoryTotals = namedtuple('InventoryTotals', 'products qty value low_stock threshold')
+
+
+class InventorySummary:
+    """재고 합계 / 재고 부족 목록을 미리 계산해 두는 요약 테이블 (트리거로 자동 갱신)
+
+    - {table}_summary : 한 행짜리 표 (제품 수, 총 수량, 총 금액, 재고 부족 제품 수, 부족 기준)
+    - {table}_low_stock : 수량이 기준보다 작은 제품만 (id, 이름, 수량)
+    - 입력/수정/삭제 트리거가 바뀐 행만큼만 더하고 빼므로 제품이 아무리 많아도
+      totals() 는 한 행만 읽음
+    - 금액 순 상위 제품은 (price * qty) 식 인덱스로 읽음
+    - 요약이 없던 기존 DB 는 ensure() 를 처음 부를 때 한 번 전체를 읽어 채움
+
+    summary = InventorySummary(conn)
+    summary.ensure()
+    print(summary.totals())          # InventoryTotals(products=..., qty=..., value=..., ...)
+    """
+
+    def __init__(self, conn, table='MyProd', key='id', name='name', price='price', qty='qty'):
+        self.conn = conn
+        self.table = table
+        self.key = key
+        self.name = name
+        self.price = price
+        self.qty = qty
+        self.summary = f'{table}_summary'
+        self.low = f'{table}_low_stock'
+
+    def has_tables(self):
+        return self.conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+                                 (self.summary,)).fetchone() is not None
+
+    def ensure(self, threshold=LOW_STOCK_THRESHOLD):
+        """요약 테이블과 트리거를 만들고, 새로 만든 경우 기존 행으로 채움. 새로 만들었으면 True"""
+        if self.has_tables():
+            return False
+        t, s, low = self.table, self.summary, self.low
+        k, n, p, q = self.key, self.name, self.price, self.qty
+        limit = f'(SELECT threshold FROM {s} WHERE id = 1)'
+
+        def add(row, sign):
+            # row('new'/'old') 한 행을 요약에 더하거나(+) 빼기(-)
+            return (f'UPDATE {s} SET products = products {sign} 1, qty = qty {sign} {row}.{q}, '
+                    f'value = value {sign} {row}.{p} * {row}.{q}, '
+                    f'low_stock = low_stock {sign} ({row}.{q} < threshold) WHERE id = 1; ')
+        add_low = (f'INSERT INTO {low} (id, name, qty) SELECT new.{k}, new.{n}, new.{q} '
+                   f'WHERE new.{q} < {limit}; ')
+        remove_low = f'DELETE FROM {low} WHERE id = old.{k}; '
+
+        statements = [
+            f'CREATE TABLE {s} (id INTEGER PRIMARY KEY CHECK (id = 1), products INTEGER NOT NULL, '
+            f'qty INTEGER NOT NULL, value INTEGER NOT NULL, low_stock INTEGER NOT NULL, '
+            f'threshold INTEGER NOT NULL)',
+            f'INSERT INTO {s} VALUES (1, 0, 0, 0, 0, {int(threshold)})',
+            f'CREATE TABLE {low} (id INTEGER PRIMARY KEY, name TEXT, qty INTEGER)',
+            f'CREATE INDEX IF NOT EXISTS idx_{low}_qty ON {low} (qty)',
+            f'CREATE INDEX IF NOT EXISTS idx_{t}_value ON {t} ({p} * {q})',
+            f'CREATE TRIGGER IF NOT EXISTS {t}_summary_ai AFTER INSERT ON {t} BEGIN '
+            f'{add("new", "+")}{add_low}END',
+            f'CREATE TRIGGER IF NOT EXISTS {t}_summary_ad AFTER DELETE ON {t} BEGIN '
+            f'{add("old", "-")}{remove_low}END',
+            f'CREATE TRIGGER IF NOT EXISTS {t}_summary_au AFTER UPDATE OF {n}, {p}, {q} ON {t} BEGIN '
+            f'{add("old", "-")}{add("new", "+")}{remove_low}{add_low}END',
+        ]
+        with transaction(self.conn):
+            for sql in statements:
+                self.conn.execute(sql)
+            self._rebuild()
+        return True
+
+    def rebuild(self):
+        """요약을 원본 테이블에서 다시 계산 (전체를 한 번 읽음)"""
+        with transaction(self.conn):
+            self._rebuild()
+
+    def set_threshold(self, threshold):
+        """재고 부족 기준을 바꾸고 부족 목록을 다시 만듦"""
+        with transaction(self.conn):
+            self.conn.execute(f'UPDATE {self.summary} SET threshold = ? WHERE id = 1', (int(threshold),))
+            self._rebuild()
+
+    def _rebuild(self):
+        t, s, low, q = self.table, self.summary, self.low, self.qty
+        self.conn.execute(
+            f'UPDATE {s} SET (products, qty, value) = '
+            f'(SELECT COUNT(*), COALESCE(SUM({q}), 0), COALESCE(SUM({self.price} * {q}), 0) FROM {t}) '
+            f'WHERE id = 1')
+        self.conn.execute(f'DELETE FROM {low}')
+        self.conn.execute(
+            f'INSERT INTO {low} (id, name, qty) SELECT {self.key}, {self.name}, {q} FROM {t} '
+            f'WHERE {q} < (SELECT threshold FROM {s} WHERE id = 1)')
+        self.conn.execute(f'UPDATE {s} SET low_stock = (SELECT COUNT(*) FROM {low}) WHERE id = 1')
+
+    # -------------------------------------------------------------------------
+    # 읽기 (제품 수와 상관없이 바로)
+    # -------------------------------------------------------------------------
+    def totals(self):
+        row = self.conn.execute(
+            f'SELECT products, qty, value, low_stock, threshold FROM {self.summary} WHERE id = 1'
+        ).fetchone()
+        return InventoryTotals(*row)
+
+    def low_stock(self, limit=100):
+        """재고 부족 제품 (id, 이름, 수량) 을 수량이 적은 순으로 최대 limit 개"""
+        return self.conn.execute(
+            f'SELECT id, name, qty FROM {self.low} ORDER BY qty, id LIMIT ?', (limit,)).fetchall()
+
+    def top_value(self, limit=10):
+        """재고 금액(가격 * 수량)이 큰 제품 (id, 이름, 금액) 최대 limit 개"""
+        p, q = self.price, self.qty
+        return self.conn.execute(
+            f'SELECT {self.key}, {self.name}, {p} * {q} FROM {self.table} '
+            f'ORDER BY {p} * {q} DESC LIMIT ?', (limit,)).fetchall()
+
@@ -8,17 +8,21 @@ separated by patterns like '<number>'. Example cell content:
 This script will keep only "3>마지막 내용" for that cell.
 
 Usage:
-  python keep_last_segment_infrom_note.py [infrom_note.xlsx] [--inplace]
+  python keep_last_segment_infrom_note.py [infrom_note.xlsx] [--inplace] [--stream]
 
 By default it reads `infrom_note.xlsx`, makes a timestamped backup, and writes the
 modified workbook back to the same filename. Use --inplace to overwrite without creating
 an additional backup (not recommended).
+
+Use --stream for large exports: rows are read and written one at a time in constant
+memory (cell values only; styles, merged cells and row heights are not kept).
 """
 import argparse
 import os
 import re
 import shutil
 import sys
+import zipfile
 from datetime import datetime
 import unicodedata
 from openpyxl.utils import get_column_letter
@@ -135,16 +139,26 @@ def display_length(s: str) -> int:
 
 
 
-def process_workbook(path: str, sheet_name: str | None = None, inplace: bool = False) -> str:
+def column_width(max_display_len: int) -> int:
+    """Column width with small padding and sensible caps."""
+    return max(8, min(max_display_len + 2, 120))
+
+
+def make_backup(path: str, inplace: bool) -> str | None:
+    """Copy the original to a timestamped backup unless inplace is requested."""
     if not os.path.exists(path):
         raise FileNotFoundError(f"File not found: {path}")
+    if inplace:
+        return None
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = f"{os.path.splitext(path)[0]}_backup_{timestamp}.xlsx"
+    shutil.copy2(path, backup_path)
+    return backup_path
+
 
+def process_workbook(path: str, sheet_name: str | None = None, inplace: bool = False) -> str:
     # Backup original unless user explicitly asks not to
-    backup_path = None
-    if not inplace:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = f"{os.path.splitext(path)[0]}_backup_{timestamp}.xlsx"
-        shutil.copy2(path, backup_path)
+    backup_path = make_backup(path, inplace)
 
     wb = openpyxl.load_workbook(path)
     if sheet_name:
@@ -183,8 +197,7 @@ def process_workbook(path: str, sheet_name: str | None = None, inplace: bool = F
 
             # Set column width with small padding and sensible caps
             col_letter = get_column_letter(col)
-            col_width = max(8, min(max_display_len + 2, 120))
-            ws.column_dimensions[col_letter].width = col_width
+            ws.column_dimensions[col_letter].width = column_width(max_display_len)
     except Exception:
         # Ignore width-setting errors and proceed to save
         pass
@@ -194,15 +207,112 @@ def process_workbook(path: str, sheet_name: str | None = None, inplace: bool = F
     return backup_path if backup_path else path
 
 
+def process_workbook_streaming(path: str, sheet_name: str | None = None, inplace: bool = False) -> str:
+    """Constant-memory, single-pass variant of process_workbook.
+
+    Reads with a read-only workbook, transforms column A while the row is in hand,
+    tracks the widest display length per column in the same pass and writes through a
+    write-only workbook. Other sheets are copied value by value.
+
+    A write-only sheet emits its <cols> element before the first row, so the widths
+    (known only at the end) are inserted into the saved sheet XML while the package is
+    copied entry by entry. The result replaces the original only after it is complete.
+    """
+    backup_path = make_backup(path, inplace)
+
+    src = openpyxl.load_workbook(path, read_only=True)
+    tmp = f"{path}.part"
+    try:
+        if sheet_name:
+            if sheet_name not in src.sheetnames:
+                raise ValueError(f"Sheet '{sheet_name}' not found in workbook. Available: {src.sheetnames}")
+            target = sheet_name
+        else:
+            target = src.active.title
+
+        out = openpyxl.Workbook(write_only=True)
+        widths: dict[int, int] = {}
+        target_index = 0
+        for index, ws in enumerate(src.worksheets):
+            ws_out = out.create_sheet(ws.title)
+            if ws.title != target:
+                for row in ws.iter_rows(values_only=True):
+                    ws_out.append(row)
+                continue
+
+            target_index = index
+            for row in ws.iter_rows(values_only=True):
+                if row and row[0] is not None:
+                    new = process_cell_value(row[0])
+                    if new != row[0]:
+                        row = (new,) + row[1:]
+                for col, val in enumerate(row, 1):
+                    if val is None:
+                        continue
+                    disp_len = display_length(str(val))
+                    if disp_len > widths.get(col, 0):
+                        widths[col] = disp_len
+                ws_out.append(row)
+        out.active = target_index  # keep the processed sheet selected, as process_workbook does
+        out.save(tmp)
+    finally:
+        src.close()
+
+    try:
+        cols = "".join(
+            f'<col min="{col}" max="{col}" width="{column_width(widths.get(col, 0))}" customWidth="1"/>'
+            for col in range(1, max(widths, default=0) + 1)
+        )
+        insert_sheet_cols(tmp, path, f"xl/worksheets/sheet{target_index + 1}.xml", cols)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+    return backup_path if backup_path else path
+
+
+def insert_sheet_cols(src_path: str, dst_path: str, sheet_member: str, cols: str,
+                      chunk_size: int = 1024 * 1024) -> None:
+    """Copy an .xlsx package, inserting <cols>...</cols> before <sheetData in one sheet.
+
+    Entries are streamed in chunks, so memory does not depend on sheet size. The copy is
+    written next to dst_path and moved over it once complete.
+    """
+    part = f"{dst_path}.cols.part"
+    marker = b"<sheetData"
+    with zipfile.ZipFile(src_path) as zin, \
+            zipfile.ZipFile(part, "w", zipfile.ZIP_DEFLATED) as zout:
+        for info in zin.infolist():
+            # zip64 only where it can be needed (Excel is happiest with plain entries)
+            large = info.file_size + len(cols) > zipfile.ZIP64_LIMIT // 2
+            with zin.open(info) as fin, zout.open(info.filename, "w", force_zip64=large) as fout:
+                if info.filename == sheet_member and cols:
+                    head = b""
+                    while marker not in head:
+                        chunk = fin.read(chunk_size)
+                        if not chunk:
+                            break
+                        head += chunk
+                    at = head.find(marker)
+                    if at >= 0:
+                        head = head[:at] + f"<cols>{cols}</cols>".encode("utf-8") + head[at:]
+                    fout.write(head)
+                shutil.copyfileobj(fin, fout, chunk_size)
+    os.replace(part, dst_path)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Keep only the last '\\d+>' segment in column A of an Excel file.")
     parser.add_argument("file", nargs="?", default="infrom_note.xlsx", help="Excel file to process (default: infrom_note.xlsx)")
     parser.add_argument("--sheet", help="Sheet name to process (default: active sheet)")
     parser.add_argument("--inplace", action="store_true", help="Overwrite without making a backup")
+    parser.add_argument("--stream", action="store_true",
+                        help="Constant-memory single pass (cell values only) for very large files")
     args = parser.parse_args() 
 
+    process = process_workbook_streaming if args.stream else process_workbook
     try:
-        backup = process_workbook(args.file, sheet_name=args.sheet, inplace=args.inplace)
+        backup = process(args.file, sheet_name=args.sheet, inplace=args.inplace)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         #sys.exit()                                                          
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+여러 검색어 동시 매칭 + 저장된 제목 검색 인덱스
+
+KeywordMatcher : 관심 검색어 여러 개를 하나의 Aho-Corasick 오토마톤으로 만들어서
+                 제목을 한 번만 훑고 걸린 검색어를 모두 찾아줍니다.
+TitleIndex     : clien.txt, todayhumor.txt 처럼 저장해 둔 제목 파일에 대한 역색인
+                 (글자 1~2개 조각 -> 제목 번호) 으로 다시 크롤링하지 않고 바로 검색합니다.
+
+사용 예)
+    matcher = KeywordMatcher(['아이폰', '맥북', '에어팟'])
+    matcher.match('아이폰 15 + 에어팟 프로 팝니다')   # ['아이폰', '에어팟']
+
+    python keyword_matcher.py 에어팟              # 저장된 파일에서 검색
+"""
+import os
+import sys
+from collections import deque
+
+# 검색 대상 기본 파일
+HISTORY_FILES = ["clien.txt", "todayhumor.txt", "todayhumor r1.txt"]
+
+
+class KeywordMatcher:
+    """Aho-Corasick 다중 검색어 매칭기"""
+
+    def __init__(self, keywords, ignore_case=True):
+        self.ignore_case = ignore_case
+        #중복/빈 검색어 제거 (입력 순서 유지)
+        self.keywords = [k for k in dict.fromkeys(k.strip() for k in keywords) if k]
+
+        # 상태 0이 루트. goto[상태] = {글자: 다음 상태}
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]    #상태에서 끝나는 검색어 번호들
+
+        for n, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in self._norm(keyword):
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] = self._out[state] + (n,)
+        self._build_fail()
+
+    def _norm(self, text):
+        return text.lower() if self.ignore_case else text
+
+    def _build_fail(self):
+        """실패 링크 계산 (너비 우선 탐색)"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def match(self, title):
+        """제목에 들어 있는 검색어 목록 (검색어 등록 순서, 중복 없음)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = set()
+        state = 0
+        for ch in self._norm(title):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                hits.update(out[state])
+        return [self.keywords[n] for n in sorted(hits)]
+
+    def tag(self, titles):
+        """(제목, 걸린 검색어 목록) 을 하나라도 걸린 제목만 돌려줍니다."""
+        for title in titles:
+            hits = self.match(title)
+            if hits:
+                yield title, hits
+
+    def __bool__(self):
+        return bool(self.keywords)
+
+
+def _grams(text):
+    """글자 1개, 2개 조각 (한글은 띄어쓰기 없이 붙여 쓰는 경우가 많아 단어 대신 글자 조각 사용)"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+class TitleIndex:
+    """저장된 제목 파일 역색인
+
+    entries[번호] = (제목, 링크 또는 None, 파일명)
+    """
+
+    def __init__(self):
+        self.entries = []
+        self.postings = {}
+
+    @classmethod
+    def from_files(cls, paths=HISTORY_FILES):
+        index = cls()
+        for path in paths:
+            if os.path.exists(path):
+                index.add_file(path)
+        return index
+
+    def add_file(self, path):
+        """제목 파일 읽기. http로 시작하는 줄은 바로 앞 제목의 링크로 붙입니다."""
+        with open(path, "rt", encoding="utf-8") as f:
+            pending = None
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                if line.startswith("http"):
+                    if pending is not None:
+                        self.add(pending, line, path)
+                        pending = None
+                    continue
+                if pending is not None:
+                    self.add(pending, None, path)
+                pending = line
+            if pending is not None:
+                self.add(pending, None, path)
+
+    def add(self, title, link=None, source=None):
+        n = len(self.entries)
+        self.entries.append((title, link, source))
+        for gram in _grams(title.lower()):
+            self.postings.setdefault(gram, []).append(n)
+
+    def search(self, query, limit=None):
+        """query 가 들어 있는 (제목, 링크, 파일명) 목록 (저장된 순서)"""
+        query = query.strip().lower()
+        if not query:
+            return []
+        grams = [query] if len(query) == 1 else \
+            [query[i:i + 2] for i in range(len(query) - 1)]
+        lists = []
+        for gram in set(grams):
+            ids = self.postings.get(gram)
+            if not ids:
+                return []
+            lists.append(ids)
+        #가장 짧은 목록부터 교집합을 구하고 마지막에 실제 포함 여부 확인
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        for ids in lists[1:]:
+            candidates.intersection_update(ids)
+            if not candidates:
+                return []
+        results = [self.entries[n] for n in sorted(candidates)
+                   if query in self.entries[n][0].lower()]
+        return results[:limit] if limit else results
+
+    def __len__(self):
+        return len(self.entries)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python keyword_matcher.py 검색어 [검색어 ...]")
+        sys.exit(1)
+    index = TitleIndex.from_files()
+    print(f"저장된 제목 {len(index)}개")
+    for query in sys.argv[1:]:
+        for title, link, source in index.search(query):
+            print(f"[{source}] {title}")
+            if link:
+                print("    " + link)
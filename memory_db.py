@@ -0,0 +1,113 @@
+import itertools
+import os
+import sqlite3
+import threading
+
+# 메모리 모드에서 파일로 저장하는 기본 간격(초)
+SNAPSHOT_INTERVAL = 60.0
+
+_names = itertools.count(1)
+
+
+class MemoryDatabase:
+    """디스크 DB 파일을 메모리로 올려서 쓰는 모드 (읽기/쓰기는 모두 RAM 에서)
+
+    - 처음에 파일 내용을 backup API 로 메모리 DB 에 복사
+    - snapshot() 은 메모리 DB 를 같은 폴더의 임시 파일에 backup 한 뒤 os.replace 로 바꿔치기
+      (저장 도중에 꺼져도 원래 파일은 그대로 남음)
+    - start_snapshots() 를 부르면 백그라운드 스레드가 interval 초마다 바뀐 내용이 있을 때만 저장
+    - close() 는 마지막으로 한 번 저장하고 연결을 닫음
+    - 같은 프로세스의 다른 스레드(쓰기 스레드, 엑셀 내보내기)는 connect() 로 같은 메모리 DB 에 연결
+      (shared cache 라 다른 연결이 쓰는 중에도 읽기가 막히지 않도록 read_uncommitted 를 켬)
+
+    lock 은 쓰기 트랜잭션과 같은 잠금(ProductRepository.lock)이어야 저장 중에 쓰기가 끼어들지 않습니다.
+
+    memory = MemoryDatabase('healthcare.db')
+    repo = ProductRepository(memory.conn, HEALTHCARE, lock=memory.lock)
+    repo.subscribe(memory.mark_dirty)
+    memory.start_snapshots(60)
+    ...
+    memory.close()
+    """
+
+    def __init__(self, path, lock=None, **connect_kwargs):
+        self.path = path
+        self.lock = lock or threading.RLock()
+        self.uri = f'file:memdb_{os.getpid()}_{next(_names)}?mode=memory&cache=shared'
+        self.dirty = False
+        self.last_error = None
+        self._stop = threading.Event()
+        self._thread = None
+        connect_kwargs.setdefault('isolation_level', None)
+        connect_kwargs.setdefault('check_same_thread', False)
+        self.conn = self.connect(**connect_kwargs)
+        if os.path.exists(path):
+            disk = sqlite3.connect(path)
+            try:
+                disk.backup(self.conn)
+            finally:
+                disk.close()
+
+    def connect(self, **kwargs):
+        """같은 메모리 DB 에 새 연결"""
+        conn = sqlite3.connect(self.uri, uri=True, **kwargs)
+        conn.execute('PRAGMA read_uncommitted=1')
+        return conn
+
+    def mark_dirty(self, *args):
+        """저장할 내용이 생김 (ProductRepository.subscribe 에 바로 넘길 수 있도록 인자는 무시)"""
+        self.dirty = True
+
+    def snapshot(self, force=False):
+        """메모리 DB 를 파일로 저장. 저장했으면 True (바뀐 것이 없으면 force 일 때만 저장)"""
+        if not (force or self.dirty):
+            return False
+        tmp = self.path + '.snapshot'
+        with self.lock:
+            self.dirty = False
+            try:
+                source = self.connect()
+                target = sqlite3.connect(tmp)
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+                    source.close()
+            except BaseException:
+                self.dirty = True
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                raise
+        # 임시 파일이 다 써진 뒤에 바꿔치기 (같은 폴더라 한 번에 바뀜)
+        os.replace(tmp, self.path)
+        return True
+
+    def start_snapshots(self, interval=SNAPSHOT_INTERVAL):
+        """interval 초마다 snapshot() (오류는 last_error 에 남기고 다음 주기에 다시 시도)"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True)
+        self._thread.start()
+
+    def stop_snapshots(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, interval):
+        while not self._stop.wait(interval):
+            try:
+                self.snapshot()
+                self.last_error = None
+            except (sqlite3.Error, OSError) as e:
+                self.last_error = e
+
+    def close(self):
+        """주기 저장을 멈추고 마지막으로 저장한 뒤 연결 종료 (메모리 DB 는 없어짐)"""
+        self.stop_snapshots()
+        try:
+            self.snapshot(force=True)
+        finally:
+            self.conn.close()
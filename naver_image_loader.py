@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+네이버 이미지 검색 결과를 끝까지(또는 원하는 수만큼) 불러오는 셀레니움 도우미
+
+예전에는 END 키를 두 번 누르고 2초씩 기다린 뒤, 썸네일마다 get_attribute('src') 를
+불러서(썸네일 수만큼 WebDriver 왕복) 주소를 모았습니다.
+
+- 고정 시간 대기 대신 썸네일 수가 늘어났는지 짧게 확인하며 기다림
+- 실제 주소(자리표시자 제외, 중복 제거)가 목표 수에 도달하거나,
+  스크롤해도 새 썸네일/주소가 더 나오지 않으면 멈춤
+- 주소는 execute_script 한 번으로 모두 가져옴 (data:image 자리표시자는 제외, 중복 제거)
+
+사용 예)
+    driver.get(f"https://search.naver.com/search.naver?where=image&query={name}")
+    srclst = load_image_sources(driver, target=300)
+"""
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+THUMBNAIL_SELECTOR = "._fe_image_tab_content_thumbnail_image"
+
+_JS_COUNT = "return document.querySelectorAll(arguments[0]).length;"
+_JS_SCROLL = "window.scrollTo(0, document.body.scrollHeight);"
+_JS_SOURCES = """
+return Array.from(document.querySelectorAll(arguments[0]), e => e.src || '')
+            .filter(s => s && !s.startsWith('data:image'));
+"""
+_JS_SOURCE_COUNT = """
+return new Set(Array.from(document.querySelectorAll(arguments[0]), e => e.src || '')
+            .filter(s => s && !s.startsWith('data:image'))).size;
+"""
+
+
+def thumbnail_count(driver, selector=THUMBNAIL_SELECTOR):
+    return driver.execute_script(_JS_COUNT, selector)
+
+
+def source_count(driver, selector=THUMBNAIL_SELECTOR):
+    """자리표시자를 빼고 중복을 없앤 실제 주소 수 (collect_sources 의 길이와 같음)"""
+    return driver.execute_script(_JS_SOURCE_COUNT, selector)
+
+
+def collect_sources(driver, selector=THUMBNAIL_SELECTOR, limit=None):
+    """페이지에 있는 썸네일 주소를 한 번에 가져오기 (순서 유지, 중복 제거)"""
+    sources = list(dict.fromkeys(driver.execute_script(_JS_SOURCES, selector)))
+    return sources[:limit] if limit else sources
+
+
+def load_image_sources(driver, target=None, selector=THUMBNAIL_SELECTOR, timeout=4.0, poll=0.2):
+    """더 나오지 않을 때까지(또는 target 개까지) 스크롤한 뒤 썸네일 주소 목록을 반환
+
+    target  : 모을 주소 수 (None 이면 끝까지, 자리표시자와 중복은 세지 않음)
+    timeout : 스크롤 후 새 썸네일(또는 새 주소)이 나오기를 기다리는 최대 시간(초)
+    poll    : 썸네일 수를 확인하는 간격(초)
+    """
+    wait = WebDriverWait(driver, timeout, poll_frequency=poll)
+    try:
+        wait.until(lambda d: thumbnail_count(d, selector) > 0)
+    except TimeoutException:
+        return []   #검색 결과가 없음
+
+    #썸네일 수에는 아직 주소가 없는 자리표시자(data:image)도 들어 있으므로
+    #목표 수는 실제 주소 수로 비교하고, 둘 중 하나라도 늘면 계속 스크롤
+    count = thumbnail_count(driver, selector)
+    found = source_count(driver, selector)
+    while target is None or found < target:
+        driver.execute_script(_JS_SCROLL)
+        try:
+            wait.until(lambda d: thumbnail_count(d, selector) > count
+                       or source_count(d, selector) > found)
+        except TimeoutException:
+            break   #스크롤해도 더 나오지 않음 = 끝
+        count = thumbnail_count(driver, selector)
+        found = source_count(driver, selector)
+    return collect_sources(driver, selector, target)
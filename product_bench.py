@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+ProductDB 대량 입력 벤치마크 (임시 폴더의 DB 파일 사용)
+
+    per_row      : insert_product 를 한 행씩 (행마다 커밋 = 행마다 fsync)
+                   너무 느려서 --per-row-sample 행만 재고 전체 시간은 비례로 추정
+    insert_many  : executemany + chunk 단위 트랜잭션, 기본 PRAGMA
+    fast         : insert_many + PERFORMANCE_PRAGMAS (WAL, synchronous=NORMAL, 캐시, mmap)
+    update_many  : fast DB 에서 전체 행 가격 수정
+    delete_many  : fast DB 에서 전체 행 삭제
+
+사용 예)
+    python product_bench.py                 # 100만 행
+    python product_bench.py --rows 100000 --per-row-sample 500
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from ProductDB import ProductDB
+
+
+def _products(count):
+    return ((f'Product_{i}', i * 10) for i in range(1, count + 1))
+
+
+def _result(name, rows, elapsed, estimated=False):
+    return {'name': name, 'rows': rows, 'seconds': round(elapsed, 3),
+            'rows_per_sec': round(rows / elapsed) if elapsed else 0, 'estimated': estimated}
+
+
+def bench_per_row(folder, rows, sample):
+    db = ProductDB(os.path.join(folder, 'per_row.db'))
+    start = time.perf_counter()
+    for name, price in _products(sample):
+        db.insert_product(name, price)
+    elapsed = time.perf_counter() - start
+    db.close()
+    return _result('per_row', rows, elapsed * rows / sample, estimated=sample < rows)
+
+
+def bench_insert_many(folder, rows, fast):
+    name = 'fast' if fast else 'insert_many'
+    db = ProductDB(os.path.join(folder, f'{name}.db'), fast=fast)
+    start = time.perf_counter()
+    count = db.insert_many(_products(rows))
+    elapsed = time.perf_counter() - start
+    db.close()
+    return _result(name, count, elapsed)
+
+
+def bench_update_delete(folder, rows):
+    db = ProductDB(os.path.join(folder, 'fast.db'), fast=True)
+    start = time.perf_counter()
+    count = db.update_many((i, None, i * 11) for i in range(1, rows + 1))
+    results = [_result('update_many', count, time.perf_counter() - start)]
+    start = time.perf_counter()
+    count = db.delete_many(range(1, rows + 1))
+    results.append(_result('delete_many', count, time.perf_counter() - start))
+    db.close()
+    return results
+
+
+def run(rows=1_000_000, per_row_sample=1000):
+    with tempfile.TemporaryDirectory() as folder:
+        results = [bench_per_row(folder, rows, min(rows, per_row_sample)),
+                   bench_insert_many(folder, rows, fast=False),
+                   bench_insert_many(folder, rows, fast=True)]
+        results.extend(bench_update_delete(folder, rows))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ProductDB 대량 입력 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="행 수")
+    parser.add_argument("--per-row-sample", type=int, default=1000, help="per_row 방식으로 실제 재는 행 수")
+    args = parser.parse_args()
+
+    print(f"{'방식':<13}{'행':>10}{'초':>10}{'행/초':>12}")
+    for r in run(args.rows, args.per_row_sample):
+        note = "  (추정)" if r['estimated'] else ""
+        print(f"{r['name']:<13}{r['rows']:>10}{r['seconds']:>10.2f}{r['rows_per_sec']:>12}{note}")
+
+
+if __name__ == "__main__":
+    main()
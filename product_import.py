@@ -0,0 +1,275 @@
+import argparse
+import csv
+import sqlite3
+import time
+from itertools import islice
+
+from openpyxl import load_workbook
+
+from product_repository import CHUNK_SIZE, HEALTHCARE, PRODUCT_DB, PRODUCT_LIST, open_repository
+
+# 파일 머리글 → 컬럼 (대소문자 무시). 테이블마다 컬럼 이름이 달라 역할별로 모아 둠
+HEADER_ALIASES = {
+    'id': ('id', 'productid', '번호', '제품번호'),
+    'name': ('name', 'productname', '제품명', '이름'),
+    'price': ('price', 'productprice', '가격', '단가'),
+    'qty': ('qty', 'quantity', '수량'),
+}
+
+# 이 행 수만큼 모아서 열 단위로 변환 (잘못된 값이 있는 배치만 행 단위로 다시 검사)
+VALIDATE_BATCH = 1000
+
+SPECS = {'healthcare': HEALTHCARE, 'productlist': PRODUCT_LIST, 'productdb': PRODUCT_DB}
+
+
+class ImportReport:
+    """가져오기 결과. rejected : (파일 줄 번호, 이유, 원래 값) 목록"""
+
+    def __init__(self, path):
+        self.path = path
+        self.read = 0
+        self.inserted = 0
+        self.updated = 0
+        self.rejected = []
+        self.seconds = 0.0
+
+    def __str__(self):
+        return (f'{self.path}: {self.read:,}행 읽음, 추가 {self.inserted:,}, 수정 {self.updated:,}, '
+                f'거부 {len(self.rejected):,} ({self.seconds:.2f}초)')
+
+    def save_rejected(self, path):
+        """거부된 행을 CSV 로 저장 (엑셀에서 바로 열리도록 utf-8-sig)"""
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(['줄', '이유', '값'])
+            for line, reason, values in self.rejected:
+                writer.writerow([line, reason, *values])
+
+
+# -----------------------------------------------------------------------------
+# 파일 읽기 (한 행씩, 파일 전체를 메모리에 올리지 않음)
+# -----------------------------------------------------------------------------
+def read_rows(path, sheet=None, encoding='utf-8-sig'):
+    """(줄 번호, 값 목록) 을 하나씩. 첫 행은 머리글, 빈 행은 건너뜀"""
+    if str(path).lower().endswith(('.xlsx', '.xlsm')):
+        rows = _read_xlsx(path, sheet)
+    else:
+        rows = _read_csv(path, encoding)
+    for line, values in enumerate(rows, start=1):
+        if any(v is not None and str(v).strip() for v in values):
+            yield line, values
+
+
+def _read_csv(path, encoding):
+    with open(path, newline='', encoding=encoding) as f:
+        # ex1.csv 처럼 쉼표 뒤에 공백이 있는 파일도 읽음
+        yield from csv.reader(f, skipinitialspace=True)
+
+
+def _read_xlsx(path, sheet):
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.active
+        yield from ws.iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+# -----------------------------------------------------------------------------
+# 값 변환
+# -----------------------------------------------------------------------------
+def _to_text(value):
+    text = '' if value is None else str(value).strip()
+    if not text:
+        raise ValueError('값 없음')
+    return text
+
+
+def _to_int(value):
+    """12000 / 12000.0 / '12,000' → 12000 (음수, 소수는 거부)"""
+    if value is None or isinstance(value, bool):
+        raise ValueError('값 없음' if value is None else f'숫자가 아님: {value}')
+    if isinstance(value, int):
+        number = value
+    else:
+        text = str(value).strip().replace(',', '')
+        if not text:
+            raise ValueError('값 없음')
+        try:
+            number = int(text)
+        except ValueError:
+            try:
+                real = float(text)
+            except ValueError:
+                raise ValueError(f'숫자가 아님: {value}') from None
+            if not real.is_integer():
+                raise ValueError(f'정수가 아님: {value}')
+            number = int(real)
+    if number < 0:
+        raise ValueError(f'음수: {value}')
+    return number
+
+
+def _to_key(value):
+    """키는 비어 있어도 됨 (새 제품)"""
+    if value is None or not str(value).strip():
+        return None
+    return _to_int(value)
+
+
+# 배치 단위 변환 : 열 하나를 한 번에 바꾸고, 하나라도 이상하면 예외 → 그 배치만 행 단위로 다시 검사
+def _texts(values):
+    texts = [v.strip() for v in values]
+    if not all(texts):
+        raise ValueError
+    return texts
+
+
+def _ints(values):
+    types = set(map(type, values))
+    # int(1.5) 는 1 이 되므로 엑셀의 실수 값은 행 단위 검사로 보냄
+    if float in types or bool in types:
+        raise ValueError
+    if str in types:
+        values = [v.replace(',', '') for v in values]
+    numbers = [int(v) for v in values]
+    if numbers and min(numbers) < 0:
+        raise ValueError
+    return numbers
+
+
+def _keys(values):
+    numbers = iter(_ints([v for v in values if v not in ('', None)]))
+    return [None if v in ('', None) else next(numbers) for v in values]
+
+
+def _role(column):
+    lowered = column.lower()
+    for role, aliases in HEADER_ALIASES.items():
+        if lowered in aliases:
+            return role
+    return lowered
+
+
+def match_columns(header, spec, mapping=None):
+    """머리글에서 각 컬럼의 위치 {컬럼: 위치}. mapping 으로 {머리글: 컬럼} 을 직접 지정 가능"""
+    mapping = {k.strip().lower(): v for k, v in (mapping or {}).items()}
+    by_role = {_role(c): c for c in spec.all_columns}
+    positions = {}
+    for position, title in enumerate(header):
+        title = '' if title is None else str(title).strip().lower()
+        column = mapping.get(title) or by_role.get(_role(title))
+        if column is not None and column not in positions:
+            positions[column] = position
+    return positions
+
+
+# -----------------------------------------------------------------------------
+# 가져오기
+# -----------------------------------------------------------------------------
+def import_file(repo, path, by=None, sheet=None, mapping=None, encoding='utf-8-sig',
+                chunk_size=CHUNK_SIZE):
+    """CSV / xlsx 파일의 제품을 repo 테이블에 넣기 (있으면 수정, 없으면 추가)
+
+    by      : 'id' 또는 'name' (실제 컬럼 이름도 가능). 기본은 파일에 id 열이 있으면 id, 없으면 name
+    잘못된 행은 건너뛰고 report.rejected 에 모음 (가져오기를 멈추지 않음)
+    chunk_size 행마다 한 트랜잭션 (ProductRepository.upsert_many)
+
+    report = import_file(db.products, 'catalog.xlsx', by='name')
+    print(report)
+    """
+    spec = repo.spec
+    report = ImportReport(path)
+    start = time.perf_counter()
+    rows = read_rows(path, sheet, encoding)
+    first = next(rows, None)
+    if first is None:
+        return report
+    positions = match_columns(first[1], spec, mapping)
+
+    if by is None:
+        by = spec.key if spec.key in positions else 'name'
+    by = by if by in spec.all_columns else next(
+        (c for c in spec.all_columns if _role(c) == _role(by)), by)
+    if by not in spec.all_columns:
+        raise ValueError(f'{by} 컬럼이 {spec.table} 테이블에 없습니다')
+    required = [by] + spec.columns if by == spec.key else spec.columns
+    missing = [c for c in required if c not in positions]
+    if missing:
+        raise ValueError(f'파일에 없는 컬럼: {", ".join(missing)}')
+
+    # (파일 위치, 한 값 변환, 한 열 변환)
+    converters = [(positions.get(c),) + ((_to_key, _keys) if c == spec.key else
+                   (_to_text, _texts) if spec.types.get(c, int) is str else (_to_int, _ints))
+                  for c in spec.all_columns]
+    if by != spec.key:
+        converters[0] = (None, _to_key, None)     #이름으로 찾을 때는 파일의 id 를 쓰지 않음
+
+    def convert_batch(batch):
+        try:
+            columns = [[None] * len(batch) if p is None else convert([values[p] for _, values in batch])
+                       for p, _, convert in converters]
+            return list(zip(*columns))
+        except (ValueError, TypeError, AttributeError, IndexError):
+            pass
+        valid = []
+        for line, values in batch:
+            try:
+                valid.append(tuple(convert(values[p] if p is not None and p < len(values) else None)
+                                   for p, convert, _ in converters))
+            except ValueError as e:
+                report.rejected.append((line, str(e), list(values)))
+        return valid
+
+    def valid_rows():
+        while True:
+            batch = list(islice(rows, VALIDATE_BATCH))
+            if not batch:
+                return
+            report.read += len(batch)
+            yield from convert_batch(batch)
+
+    report.inserted, report.updated = repo.upsert_many(valid_rows(), by, chunk_size)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def detect_spec(conn):
+    """DB 에 있는 테이블로 TableSpec 고르기"""
+    tables = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    if 'MyProd' in tables:
+        return HEALTHCARE
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(Products)')}
+    return PRODUCT_DB if 'productID' in columns else PRODUCT_LIST
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV / 엑셀 파일에서 제품 가져오기")
+    parser.add_argument("file", help="CSV 또는 xlsx 파일")
+    parser.add_argument("db", help="DB 파일 (healthcare.db, ProductList.db, MyProduct.db)")
+    parser.add_argument("--table", choices=sorted(SPECS), help="테이블 종류 (기본: DB 에서 자동 판단)")
+    parser.add_argument("--by", help="같은 제품을 찾는 기준 (id 또는 name)")
+    parser.add_argument("--sheet", help="엑셀 시트 이름 (기본: 첫 시트)")
+    parser.add_argument("--encoding", default="utf-8-sig", help="CSV 인코딩 (한글 윈도우 파일은 cp949)")
+    parser.add_argument("--rejected", help="거부된 행을 저장할 CSV 파일")
+    args = parser.parse_args()
+
+    if args.table:
+        spec = SPECS[args.table]
+    else:
+        conn = sqlite3.connect(args.db)
+        spec = detect_spec(conn)
+        conn.close()
+    repo = open_repository(args.db, spec)
+    report = import_file(repo, args.file, args.by, args.sheet, encoding=args.encoding)
+    print(report)
+    for line, reason, values in report.rejected[:10]:
+        print(f"  {line}줄: {reason} {values}")
+    if args.rejected and report.rejected:
+        report.save_rejected(args.rejected)
+        print(f"거부된 행 저장: {args.rejected}")
+    repo.conn.close()
+
+
+if __name__ == "__main__":
+    main()
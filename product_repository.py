@@ -0,0 +1,286 @@
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+
+
+# 한 트랜잭션에 넣을 행 수
+CHUNK_SIZE = 50_000
+
+# 성능 설정 (ProductDB(fast=True) 등에서 적용)
+# WAL 저널 + synchronous=NORMAL 이면 커밋마다 fsync 하지 않음, 64MB 페이지 캐시, 256MB mmap
+PERFORMANCE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -64000,
+    'mmap_size': 256 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+
+class TableSpec:
+    """제품 테이블 모양 (DB 파일마다 테이블/컬럼 이름이 다름)
+
+    key     : 정수 기본 키 컬럼
+    columns : 키를 뺀 나머지 컬럼 (add/update 인자 순서)
+    types   : 컬럼별 값 종류 (str / int), 가져오기(product_import.py)에서 값 변환에 사용
+    """
+
+    def __init__(self, table, key, columns, create_sql, types=None):
+        self.table = table
+        self.key = key
+        self.columns = list(columns)
+        self.create_sql = create_sql
+        self.types = types or {}
+
+    @property
+    def all_columns(self):
+        return [self.key] + self.columns
+
+
+# healthcare.db (healthcare_manager.py)
+HEALTHCARE = TableSpec('MyProd', 'id', ['name', 'price', 'qty'], '''
+    CREATE TABLE IF NOT EXISTS MyProd (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        price INTEGER NOT NULL,
+        qty INTEGER NOT NULL
+    )''', {'name': str, 'price': int, 'qty': int})
+
+# ProductList.db (ProductList.py, ProductList3.py)
+PRODUCT_LIST = TableSpec('Products', 'id', ['Name', 'Price'], '''
+    CREATE TABLE IF NOT EXISTS Products (
+        id integer primary key autoincrement, Name text, Price integer)''',
+    {'Name': str, 'Price': int})
+
+# MyProduct.db (ProductDB.py)
+PRODUCT_DB = TableSpec('Products', 'productID', ['productName', 'productPrice'], '''
+    CREATE TABLE IF NOT EXISTS Products (
+        productID INTEGER PRIMARY KEY AUTOINCREMENT,
+        productName TEXT NOT NULL,
+        productPrice INTEGER NOT NULL
+    )''', {'productName': str, 'productPrice': int})
+
+
+def chunks(iterable, size):
+    """iterable 을 size 개씩 잘라서 list 로 돌려줌 (전체를 메모리에 올리지 않음)"""
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+@contextmanager
+def transaction(conn, lock=None):
+    """쓰기 트랜잭션 (BEGIN IMMEDIATE ~ COMMIT, 예외가 나면 롤백)
+    이미 트랜잭션 안이면 그대로 이어서 사용. lock 을 주면 잠근 상태로 실행"""
+    with lock or nullcontext():
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+
+class ProductRepository:
+    """제품 테이블 CRUD 를 한 곳에서 처리 (여러 GUI/스크립트가 같이 사용)
+
+    - get() 은 읽은 행을 메모리 캐시(최근 cache_size 개)에 두고 다시 읽지 않음
+    - 쓰기를 하면 그 id 의 캐시만 지우고, 구독자에게 (동작, id 목록) 을 알림
+      동작 : 'insert' / 'update' / 'delete', id 목록이 None 이면 여러 행이 바뀜 (전체 다시 읽기)
+    - 쓰기는 잠금으로 한 번에 하나씩, transaction() 으로 묶을 수 있음
+
+    repo = ProductRepository(sqlite3.connect('healthcare.db'), HEALTHCARE)
+    repo.subscribe(lambda action, ids: print(action, ids))
+    new_id = repo.add('비타민 D', 12000, 30)
+    """
+
+    def __init__(self, conn, spec, cache_size=5000, lock=None):
+        self.conn = conn
+        self.spec = spec
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._listeners = []
+        self._lock = lock or threading.RLock()
+        cols = spec.all_columns
+        self._select_sql = f'SELECT {", ".join(cols)} FROM {spec.table} WHERE {spec.key} = ?'
+        self._insert_sql = (f'INSERT INTO {spec.table} ({", ".join(spec.columns)}) '
+                            f'VALUES ({", ".join("?" * len(spec.columns))})')
+        # None 인 값은 바꾸지 않음
+        assignments = ', '.join(f'{c} = COALESCE(?, {c})' for c in spec.columns)
+        self._update_sql = f'UPDATE {spec.table} SET {assignments} WHERE {spec.key} = ?'
+        self._delete_sql = f'DELETE FROM {spec.table} WHERE {spec.key} = ?'
+
+    @property
+    def lock(self):
+        """쓰기 잠금 (같은 DB 를 쓰는 다른 연결, 메모리 DB 저장과 나눠 씀)"""
+        return self._lock
+
+    def create_table(self):
+        with self.transaction() as conn:
+            conn.execute(self.spec.create_sql)
+
+    # -------------------------------------------------------------------------
+    # 트랜잭션 / 알림
+    # -------------------------------------------------------------------------
+    def transaction(self):
+        """쓰기 트랜잭션 (예외가 나면 롤백). 이미 트랜잭션 안이면 그대로 이어서 사용"""
+        return transaction(self.conn, self._lock)
+
+    def subscribe(self, callback):
+        """callback(action, ids) : 쓰기가 커밋된 뒤 호출"""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _changed(self, action, ids):
+        self.invalidate(ids)
+        for callback in list(self._listeners):
+            callback(action, ids)
+
+    def notify(self, action, ids):
+        """다른 연결(백그라운드 쓰기 스레드 등)이 커밋한 변경을 캐시와 구독자에 반영"""
+        self._changed(action, ids)
+
+    def invalidate(self, ids=None):
+        """캐시 지우기 (ids 가 None 이면 전부)"""
+        if ids is None:
+            self._cache.clear()
+            return
+        for product_id in ids:
+            self._cache.pop(product_id, None)
+
+    # -------------------------------------------------------------------------
+    # 읽기
+    # -------------------------------------------------------------------------
+    def get(self, product_id):
+        """(키, 컬럼...) 행, 없으면 None"""
+        if product_id in self._cache:
+            self._cache.move_to_end(product_id)
+            return self._cache[product_id]
+        row = self.conn.execute(self._select_sql, (product_id,)).fetchone()
+        if row is not None:
+            self._cache[product_id] = row
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return row
+
+    # -------------------------------------------------------------------------
+    # 한 행씩 쓰기
+    # -------------------------------------------------------------------------
+    def add(self, *values):
+        """columns 순서대로 값을 받아 추가하고 새 id 반환"""
+        with self.transaction() as conn:
+            product_id = conn.execute(self._insert_sql, values).lastrowid
+        self._changed('insert', [product_id])
+        return product_id
+
+    def update(self, product_id, *values):
+        """columns 순서대로 새 값 (None 은 그대로 둠)"""
+        with self.transaction() as conn:
+            conn.execute(self._update_sql, (*values, product_id))
+        self._changed('update', [product_id])
+
+    def delete(self, product_id):
+        with self.transaction() as conn:
+            conn.execute(self._delete_sql, (product_id,))
+        self._changed('delete', [product_id])
+
+    # -------------------------------------------------------------------------
+    # 여러 행 쓰기 (chunk_size 개씩 executemany, chunk 하나가 트랜잭션 하나)
+    # -------------------------------------------------------------------------
+    def _execute_chunked(self, sql, rows, chunk_size):
+        count = 0
+        for chunk in chunks(rows, chunk_size):
+            with self.transaction() as conn:
+                count += conn.executemany(sql, chunk).rowcount
+        return count
+
+    def add_many(self, rows, chunk_size=CHUNK_SIZE):
+        """rows : columns 순서의 값 tuple 을 내는 iterable. 추가한 행 수 반환"""
+        count = self._execute_chunked(self._insert_sql, rows, chunk_size)
+        self._changed('insert', None)
+        return count
+
+    def update_many(self, rows, chunk_size=CHUNK_SIZE):
+        """rows : (id, 값...) tuple 을 내는 iterable (None 은 그대로 둠)"""
+        count = self._execute_chunked(self._update_sql, ((*r[1:], r[0]) for r in rows), chunk_size)
+        self._changed('update', None)
+        return count
+
+    def delete_many(self, ids, chunk_size=CHUNK_SIZE):
+        count = self._execute_chunked(self._delete_sql, ((i,) for i in ids), chunk_size)
+        self._changed('delete', None)
+        return count
+
+    def upsert_many(self, rows, by=None, chunk_size=CHUNK_SIZE):
+        """있으면 고치고 없으면 추가 (rows : (id, 값...) tuple, id 는 None 가능)
+
+        by : 같은 제품을 찾는 컬럼 (기본은 키). 이름 컬럼을 주면 id 는 무시하고 이름으로 찾음
+        chunk 마다 임시 테이블에 executemany 로 넣은 뒤 UPDATE ... FROM / INSERT ... SELECT
+        두 문장으로 반영합니다. chunk 안에서 같은 제품이 여러 번 나오면 마지막 행을 씀
+        반환값 : (추가한 행 수, 값이 바뀐 행 수)
+        """
+        spec = self.spec
+        by = by or spec.key
+        t, key = spec.table, spec.key
+        cols = spec.all_columns
+        position = cols.index(by)
+        if by != key:
+            self._ensure_lookup_index(by)
+        staging = 'temp.upsert_rows'
+        # 값이 그대로인 행은 건드리지 않음 (검색 색인 트리거도 돌지 않음)
+        changing = [c for c in spec.columns if c != by]
+        assignments = ', '.join(f'{c} = s.{c}' for c in changing)
+        differs = ' OR '.join(f'{t}.{c} IS NOT s.{c}' for c in changing)
+        update_sql = (f'UPDATE {t} SET {assignments} FROM {staging} s '
+                      f'WHERE {t}.{by} = s.{by} AND ({differs})')
+        insert_cols = ', '.join(cols if by == key else spec.columns)
+        insert_sql = (f'INSERT INTO {t} ({insert_cols}) SELECT {insert_cols} FROM {staging} s '
+                      f'WHERE NOT EXISTS (SELECT 1 FROM {t} WHERE {t}.{by} = s.{by})')
+        inserted = updated = 0
+        for chunk in chunks(rows, chunk_size):
+            # 키가 없는 행(새 제품)은 그대로, 나머지는 같은 값끼리 마지막 행만
+            latest, new_rows = {}, []
+            for row in chunk:
+                if row[position] is None:
+                    new_rows.append(row)
+                else:
+                    latest[row[position]] = row
+            with self.transaction() as conn:
+                conn.execute(f'CREATE TEMP TABLE upsert_rows ({", ".join(cols)})')
+                conn.executemany(f'INSERT INTO {staging} VALUES ({", ".join("?" * len(cols))})',
+                                 list(latest.values()))
+                updated += conn.execute(update_sql).rowcount
+                inserted += conn.execute(insert_sql).rowcount
+                inserted += conn.executemany(self._insert_sql, (r[1:] for r in new_rows)).rowcount
+                conn.execute(f'DROP TABLE {staging}')
+        self._changed('update', None)
+        return inserted, updated
+
+    def _ensure_lookup_index(self, column):
+        """column 으로 시작하는 인덱스가 없으면 만듦 (이름으로 찾을 때 전체 검색을 피함)"""
+        t = self.spec.table
+        for index in self.conn.execute(f'PRAGMA index_list({t})').fetchall():
+            first = self.conn.execute(f'PRAGMA index_info({index[1]})').fetchone()
+            if first is not None and first[2] == column:
+                return
+        with self.transaction() as conn:
+            conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{t}_{column} ON {t} ({column})')
+
+
+def open_repository(path, spec, **kwargs):
+    """DB 파일을 열고 (없으면 테이블을 만들고) 저장소를 반환"""
+    repo = ProductRepository(sqlite3.connect(path, isolation_level=None), spec, **kwargs)
+    repo.create_table()
+    return repo
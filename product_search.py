@@ -0,0 +1,102 @@
+import argparse
+import sqlite3
+import time
+
+from product_repository import transaction
+
+# trigram 토크나이저는 세 글자 단위로 색인하므로 세 글자보다 짧은 검색어는 LIKE 로 찾음
+MIN_MATCH_LENGTH = 3
+
+
+class ProductSearch:
+    """제품명 부분 문자열 검색 (FTS5 trigram 색인)
+
+    LIKE '%검색어%' 는 검색할 때마다 테이블 전체를 읽지만, trigram 색인은 한국어
+    제품명도 부분 문자열로 바로 찾습니다. ('비타민' → '종합 비타민 C')
+    - {table}_fts 가상 테이블은 원본 테이블을 가리키기만 함 (external content)
+    - 입력/수정/삭제 트리거로 색인을 자동으로 맞춤
+    - 색인이 없던 기존 DB 는 ensure_index() 를 처음 부를 때 한 번 채움
+
+    search = ProductSearch(conn, 'MyProd', 'id', 'name', ['id', 'name', 'price', 'qty'])
+    search.ensure_index()
+    rows = search.search('비타민', limit=100)    # 관련도 순
+    """
+
+    def __init__(self, conn, table, key, column, columns=None):
+        self.conn = conn
+        self.table = table
+        self.key = key
+        self.column = column
+        self.columns = list(columns or [key, column])
+        self.fts = f'{table}_fts'
+
+    def has_index(self):
+        return self.conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+                                 (self.fts,)).fetchone() is not None
+
+    def ensure_index(self):
+        """색인 테이블과 트리거를 만들고, 새로 만든 경우 기존 행으로 채움. 새로 만들었으면 True"""
+        if self.has_index():
+            return False
+        t, fts, key, col = self.table, self.fts, self.key, self.column
+        statements = [
+            f"CREATE VIRTUAL TABLE {fts} USING fts5("
+            f"{col}, content='{t}', content_rowid='{key}', tokenize='trigram')",
+            f"CREATE TRIGGER IF NOT EXISTS {t}_fts_ai AFTER INSERT ON {t} BEGIN "
+            f"INSERT INTO {fts}(rowid, {col}) VALUES (new.{key}, new.{col}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {t}_fts_ad AFTER DELETE ON {t} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {col}) VALUES ('delete', old.{key}, old.{col}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {t}_fts_au AFTER UPDATE OF {col} ON {t} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {col}) VALUES ('delete', old.{key}, old.{col}); "
+            f"INSERT INTO {fts}(rowid, {col}) VALUES (new.{key}, new.{col}); END",
+            # 기존 행으로 색인 채우기 (한 번만)
+            f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        ]
+        with transaction(self.conn):
+            for sql in statements:
+                self.conn.execute(sql)
+        return True
+
+    def search(self, term, limit=200):
+        """term 이 이름에 들어 있는 행을 관련도 순으로 최대 limit 개"""
+        term = term.strip()
+        cols = ', '.join(f'p.{c}' for c in self.columns)
+        if len(term) < MIN_MATCH_LENGTH:
+            return self.conn.execute(
+                f'SELECT {cols} FROM {self.table} p WHERE p.{self.column} LIKE ? '
+                f'ORDER BY p.{self.key} LIMIT ?', (f'%{term}%', limit)).fetchall()
+        # 큰따옴표로 감싸서 구(phrase)로 검색 → 띄어쓰기까지 포함한 부분 문자열 검색
+        phrase = '"' + term.replace('"', '""') + '"'
+        return self.conn.execute(
+            f'SELECT {cols} FROM {self.fts} f JOIN {self.table} p ON p.{self.key} = f.rowid '
+            f'WHERE {self.fts} MATCH ? ORDER BY f.rank LIMIT ?', (phrase, limit)).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="제품명 검색 색인 만들기 / 검색")
+    parser.add_argument("db", help="DB 파일 (healthcare.db 또는 MyProduct.db)")
+    parser.add_argument("query", nargs="?", help="검색어 (없으면 색인만 만듦)")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db, isolation_level=None)
+    tables = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    if 'MyProd' in tables:
+        search = ProductSearch(conn, 'MyProd', 'id', 'name', ['id', 'name', 'price', 'qty'])
+    else:
+        search = ProductSearch(conn, 'Products', 'productID', 'productName',
+                               ['productID', 'productName', 'productPrice'])
+    start = time.perf_counter()
+    if search.ensure_index():
+        print(f"색인 생성 완료 ({time.perf_counter() - start:.2f}초)")
+    if args.query:
+        start = time.perf_counter()
+        rows = search.search(args.query, args.limit)
+        for row in rows:
+            print(row)
+        print(f"{len(rows)}건 ({(time.perf_counter() - start) * 1000:.1f}ms)")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
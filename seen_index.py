@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+이미 본 게시글 번호 목록(seen index)과 증분 크롤링
+게시글 링크(href)에서 글 번호를 뽑아 파일에 한 줄씩 저장해 두고,
+다음 실행 때는 이미 본 글이 나오는 페이지에서 페이지 넘기기를 멈춥니다.
+
+사용 예)
+    index = SeenIndex("clien_seen.txt")
+    for title, link in crawl_new(clien_page_urls(range(0, 10)), parse_clien_posts, index):
+        print(title)
+"""
+import os
+import re
+from urllib.parse import urlsplit, parse_qs
+
+from board_fetcher import PageFetcher
+
+# 링크 경로 끝의 숫자 (클리앙: /service/board/sold/18812345)
+_PATH_ID = re.compile(r"/(\d+)/?$")
+
+
+def post_id(href):
+    """게시글 링크에서 글 번호를 추출 (찾지 못하면 링크 자체를 사용)
+
+    오늘의 유머처럼 ?table=bestofbest&no=123 형식이면 'bestofbest/123',
+    클리앙처럼 /service/board/sold/123 형식이면 'sold/123' 을 돌려줍니다.
+    """
+    parts = urlsplit(href)
+    query = parse_qs(parts.query)
+    if 'no' in query:
+        return "{}/{}".format(query.get('table', [''])[0], query['no'][0])
+    m = _PATH_ID.search(parts.path)
+    if m:
+        board = parts.path[:m.start()].rsplit('/', 1)[-1]
+        return "{}/{}".format(board, m.group(1))
+    return href
+
+
+class SeenIndex:
+    """이미 본 글 번호를 파일에 보관하는 집합
+
+    파일은 한 줄에 글 번호 하나이며, 새 번호는 끝에 덧붙이기만 합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.ids = set()
+        if os.path.exists(path):
+            with open(path, "rt", encoding="utf-8") as f:
+                self.ids = {line.strip() for line in f if line.strip()}
+
+    def __contains__(self, post):
+        return post in self.ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, ids):
+        """새 글 번호를 파일에 추가 (이미 있는 번호는 무시)"""
+        new = [i for i in dict.fromkeys(ids) if i not in self.ids]
+        if not new:
+            return
+        with open(self.path, "at", encoding="utf-8") as f:
+            f.writelines(i + "\n" for i in new)
+        self.ids.update(new)
+
+
+def crawl_new(urls, parse, index, fetcher=None):
+    """새 글 (제목, 링크) 목록을 페이지 순서대로 반환
+
+    urls  : 최신 글이 앞에 오는 순서의 페이지 주소 목록 (최대 범위)
+    parse : html -> [(제목, 링크), ...] 함수
+    index : SeenIndex (반환 후 호출한 쪽에서 저장이 끝나면 mark_seen 으로 기록)
+
+    처음 실행(인덱스가 비어 있음)이면 모든 페이지를 동시에 받고,
+    그 다음부터는 한 페이지씩 받다가 페이지 마지막 글을 이미 본 적이 있으면 멈춥니다.
+    """
+    own = fetcher is None
+    if own:
+        fetcher = PageFetcher()
+    try:
+        if len(index) == 0:
+            pages = [parse(html) for html in fetcher.fetch_pages(urls)]
+        else:
+            pages = _iter_until_seen(fetcher, urls, parse, index)
+
+        posts = []
+        found = set()
+        for page in pages:
+            for title, link in page:
+                pid = post_id(link)
+                #같은 글이 페이지 사이에 밀려서 두 번 나오는 경우도 한 번만
+                if pid not in index and pid not in found:
+                    found.add(pid)
+                    posts.append((title, link))
+        return posts
+    finally:
+        if own:
+            fetcher.close()
+
+
+def _iter_until_seen(fetcher, urls, parse, index):
+    """이미 본 글에 닿을 때까지 한 페이지씩 가져오기"""
+    for url in urls:
+        posts = parse(fetcher.fetch(url))
+        yield posts
+        if not posts or post_id(posts[-1][1]) in index:
+            break
+
+
+def mark_seen(index, posts):
+    """저장이 끝난 글들을 인덱스에 기록"""
+    index.add(post_id(link) for _, link in posts)
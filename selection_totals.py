@@ -0,0 +1,54 @@
+class SelectionTotals:
+    """선택된 행들의 총 수량 / 총 금액을 선택이 바뀐 행만으로 계산
+
+    selectionChanged(selected, deselected) 로 받은 변경분만 더하고 빼므로
+    선택이 아무리 커도 바뀐 행 수만큼만 일합니다.
+    전체 선택(Ctrl+A, 모서리 버튼)이면 행을 돌지 않고 SQL SUM 한 번으로 구합니다.
+    값은 화면 글자가 아니라 모델이 가진 숫자를 그대로 사용합니다.
+
+    model : sql_table_model.SqlTableModel
+    """
+
+    def __init__(self, model, price_column='price', qty_column='qty'):
+        self.model = model
+        self.price_column = price_column
+        self.qty_column = qty_column
+        self.price_index = model.columns.index(price_column)
+        self.qty_index = model.columns.index(qty_column)
+        self.reset()
+
+    def reset(self):
+        """선택이 없어졌을 때 (모델을 다시 읽은 경우 등)"""
+        self.qty = 0
+        self.amount = 0
+
+    def update(self, selection_model, selected, deselected):
+        """selectionChanged 신호의 인자를 그대로 넘김"""
+        if self._all_selected(selection_model):
+            self.qty, self.amount = self.model.aggregate(
+                f'SUM({self.qty_column})', f'SUM({self.price_column} * {self.qty_column})')
+            return
+        for row in _rows(deselected):
+            self._add(row, -1)
+        for row in _rows(selected):
+            self._add(row, 1)
+
+    def _add(self, row, sign):
+        values = self.model.row_values(row)
+        price = values[self.price_index] or 0
+        qty = values[self.qty_index] or 0
+        self.qty += sign * qty
+        self.amount += sign * price * qty
+
+    def _all_selected(self, selection_model):
+        """선택 범위가 0행부터 마지막 행까지 하나로 이어져 있는지 (범위 수만큼만 확인)"""
+        selection = selection_model.selection()
+        row_count = self.model.rowCount()
+        return (row_count > 0 and len(selection) == 1
+                and selection[0].top() == 0 and selection[0].bottom() == row_count - 1)
+
+
+def _rows(selection):
+    """QItemSelection 의 행 번호 (행 단위 선택이므로 범위마다 위에서 아래로)"""
+    for selection_range in selection:
+        yield from range(selection_range.top(), selection_range.bottom() + 1)
@@ -0,0 +1,287 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
+
+
+class SqlTableModel(QAbstractTableModel):
+    """SQLite 테이블을 필요한 만큼만 읽어 보여주는 모델 (QTableView 용)
+
+    fetchall() 로 전부 읽고 셀마다 QTableWidgetItem 을 만드는 대신,
+    처음에 page_size 행만 읽고 스크롤이 끝에 닿으면 다음 페이지를 읽습니다.
+    - 다음 페이지는 OFFSET 이 아니라 마지막 행의 (정렬 값, 키) 다음부터 읽음 (keyset)
+      → 몇 번째 페이지든 읽는 속도가 같음
+    - 헤더를 클릭하면 SQL ORDER BY 로 정렬
+    - set_rows() 로 SQL 대신 정해진 행(예: 관련도 순 검색 결과)을 보여줄 수도 있음
+    - watch(repository) 하면 입력/수정/삭제된 행만 그 자리에서 고침 (전체를 다시 읽지 않음)
+
+    conn    : sqlite3 연결
+    table   : 테이블 이름
+    columns : 보여줄 컬럼 이름 목록 (key 가 포함되어 있어야 함)
+    headers : 헤더에 표시할 이름 (없으면 컬럼 이름)
+    key     : 유일한 정수 키 컬럼 (같은 정렬 값끼리의 순서를 정함)
+    """
+
+    def __init__(self, conn, table, columns, headers=None, key='id', page_size=256,
+                 numeric_columns=(), parent=None):
+        super().__init__(parent)
+        self.conn = conn
+        self.table = table
+        self.columns = list(columns)
+        self.headers = list(headers or columns)
+        self.key = key
+        self.key_column = self.columns.index(key)
+        self.page_size = page_size
+        self.numeric_columns = {self.columns.index(c) for c in numeric_columns}
+        self.sort_column = self.key_column
+        self.sort_order = Qt.AscendingOrder
+        self.where = ''
+        self.params = ()
+        self.repository = None
+        self.rows = []
+        self.fixed = False      #set_rows() 로 받은 행을 보여주는 중
+        self.exhausted = False
+        self.rows.extend(self._read_page())
+
+    # -------------------------------------------------------------------------
+    # SQL
+    # -------------------------------------------------------------------------
+    def _order_sql(self):
+        direction = 'DESC' if self.sort_order == Qt.DescendingOrder else 'ASC'
+        sort = self.columns[self.sort_column]
+        if sort == self.key:
+            return f'ORDER BY {self.key} {direction}'
+        return f'ORDER BY {sort} {direction}, {self.key} {direction}'
+
+    def _keyset_condition(self, row, op):
+        """정렬 순서에서 row 앞/뒤를 고르는 조건. op 는 오름차순 기준 ('>' 는 row 다음)"""
+        if self.sort_order == Qt.DescendingOrder:
+            op = op.replace('>', '<') if '>' in op else op.replace('<', '>')
+        sort = self.columns[self.sort_column]
+        if sort == self.key:
+            return f'{self.key} {op} ?', [row[self.key_column]]
+        return f'({sort}, {self.key}) {op} (?, ?)', [row[self.sort_column], row[self.key_column]]
+
+    def _where_sql(self, after=None, upto=None):
+        """after : 이 행 다음부터, upto : 이 행까지 (둘 다 없으면 전체)"""
+        conditions = [f'({self.where})'] if self.where else []
+        params = list(self.params)
+        for row, op in ((after, '>'), (upto, '<=')):
+            if row is not None:
+                condition, values = self._keyset_condition(row, op)
+                conditions.append(condition)
+                params.extend(values)
+        return (' WHERE ' + ' AND '.join(conditions) if conditions else ''), params
+
+    def _select_sql(self, after=None):
+        """after : 마지막으로 읽은 행 (없으면 처음부터)"""
+        where, params = self._where_sql(after)
+        sql = f'SELECT {", ".join(self.columns)} FROM {self.table}{where}'
+        return f'{sql} {self._order_sql()}', params
+
+    def _read_page(self, limit=None):
+        """self.rows 의 마지막 행 다음 페이지를 읽어서 반환 (rows 에 붙이는 것은 부르는 쪽에서)"""
+        sql, params = self._select_sql(self.rows[-1] if self.rows else None)
+        limit = limit or self.page_size
+        page = self.conn.execute(f'{sql} LIMIT ?', params + [limit]).fetchall()
+        self.exhausted = len(page) < limit
+        return page
+
+    def query_all(self):
+        """현재 검색 조건과 정렬 순서로 모든 행을 읽는 (SQL, 인자) - 다른 연결에서 실행할 때"""
+        return self._select_sql()
+
+    def iter_all(self):
+        """현재 검색 조건과 정렬 순서로 모든 행 (읽어 둔 행과 상관없이 DB 에서 직접)"""
+        if self.fixed:
+            return iter(self.rows)
+        sql, params = self.query_all()
+        return self.conn.execute(sql, params)
+
+    def count_all(self):
+        """현재 검색 조건에 맞는 전체 행 수"""
+        if self.fixed:
+            return len(self.rows)
+        where, params = self._where_sql()
+        return self.conn.execute(f'SELECT COUNT(*) FROM {self.table}{where}', params).fetchone()[0]
+
+    def aggregate(self, *expressions):
+        """읽어 둔 행 전체에 대한 SQL 집계 (전체 선택 합계 등)
+
+        aggregate('SUM(qty)', 'SUM(price * qty)') -> (합계, 합계), 행이 없으면 0
+        """
+        select = ', '.join(f'COALESCE({e}, 0)' for e in expressions)
+        if not self.rows:
+            return (0,) * len(expressions)
+        if self.fixed:
+            ids = [row[self.key_column] for row in self.rows]
+            where = f' WHERE {self.key} IN ({", ".join("?" * len(ids))})'
+            params = ids
+        else:
+            where, params = self._where_sql(upto=self.rows[-1])
+        return tuple(self.conn.execute(f'SELECT {select} FROM {self.table}{where}', params).fetchone())
+
+    # -------------------------------------------------------------------------
+    # 조건 / 다시 읽기
+    # -------------------------------------------------------------------------
+    def set_filter(self, where='', params=()):
+        """WHERE 조건 바꾸기 (예: set_filter('name LIKE ?', ['%비타민%']))"""
+        self.where = where
+        self.params = tuple(params)
+        self.fixed = False
+        self.reload()
+
+    def set_rows(self, rows):
+        """SQL 로 읽지 않고 주어진 행을 그 순서대로 보여줌 (더 읽어 올 행 없음)"""
+        self.beginResetModel()
+        self.fixed = True
+        self.rows = list(rows)
+        self.exhausted = True
+        self.endResetModel()
+
+    def reload(self, keep_loaded=False):
+        """처음부터 다시 읽기. keep_loaded=True 면 지금까지 읽은 만큼 다시 읽음 (스크롤 유지용)"""
+        limit = max(len(self.rows), self.page_size) if keep_loaded else None
+        self.beginResetModel()
+        self.rows = []
+        self.rows.extend(self._read_page(limit))
+        self.endResetModel()
+
+    def row_values(self, row):
+        return self.rows[row]
+
+    def row_id(self, row):
+        return self.rows[row][self.key_column]
+
+    # -------------------------------------------------------------------------
+    # 바뀐 행만 반영
+    # -------------------------------------------------------------------------
+    def watch(self, repository):
+        """product_repository.ProductRepository 의 변경 알림을 받아 해당 행만 고침"""
+        self.repository = repository
+        self._repo_columns = [repository.spec.all_columns.index(c) for c in self.columns]
+        repository.subscribe(self.apply_change)
+
+    def apply_change(self, action, ids):
+        if ids is None:
+            #여러 행이 한꺼번에 바뀜 → 읽어 둔 만큼 다시 읽기
+            if not self.fixed:
+                self.reload(keep_loaded=True)
+            return
+        for product_id in ids:
+            row = None if action == 'delete' else self._current_row(product_id)
+            self._replace_row(product_id, row)
+
+    def _current_row(self, product_id):
+        """저장소에서 읽은 행을 모델 컬럼 순서로 (검색 조건에 맞지 않으면 None)"""
+        values = self.repository.get(product_id)
+        if values is None:
+            return None
+        if self.where and not self.fixed:
+            matched = self.conn.execute(f'SELECT 1 FROM {self.table} WHERE {self.key} = ? AND ({self.where})',
+                                        (product_id, *self.params)).fetchone()
+            if not matched:
+                return None
+        return tuple(values[i] for i in self._repo_columns)
+
+    def _position(self, product_id):
+        for i, row in enumerate(self.rows):
+            if row[self.key_column] == product_id:
+                return i
+        return None
+
+    def _replace_row(self, product_id, row):
+        """product_id 행을 row 로 바꾸기 (row 가 None 이면 삭제, 정렬 위치가 바뀌면 옮김)"""
+        pos = self._position(product_id)
+        if pos is not None and row is not None and (
+                self.fixed or self._sort_key(row) == self._sort_key(self.rows[pos])):
+            self.rows[pos] = row
+            self.dataChanged.emit(self.index(pos, 0), self.index(pos, len(self.columns) - 1))
+            return
+        if pos is not None:
+            self.beginRemoveRows(QModelIndex(), pos, pos)
+            del self.rows[pos]
+            self.endRemoveRows()
+        if row is None or self.fixed:
+            return  #검색 결과에는 새 행을 끼워 넣지 않음
+        pos = self._insert_position(row)
+        if pos == len(self.rows) and not self.exhausted:
+            return  #아직 읽지 않은 범위 → 스크롤하면 읽힘
+        self.beginInsertRows(QModelIndex(), pos, pos)
+        self.rows.insert(pos, row)
+        self.endInsertRows()
+
+    def _sort_key(self, row):
+        """SQLite 정렬 순서와 같게 (NULL < 숫자 < 문자열 < BLOB), 같으면 키 순"""
+        value = row[self.sort_column]
+        if value is None:
+            rank = 0
+        elif isinstance(value, (int, float)):
+            rank = 1
+        elif isinstance(value, str):
+            rank = 2
+        else:
+            rank = 3
+        return (rank, value if value is not None else 0), row[self.key_column]
+
+    def _insert_position(self, row):
+        key = self._sort_key(row)
+        descending = self.sort_order == Qt.DescendingOrder
+        lo, hi = 0, len(self.rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            other = self._sort_key(self.rows[mid])
+            if (other > key) if descending else (other < key):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    # -------------------------------------------------------------------------
+    # QAbstractTableModel
+    # -------------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        value = self.rows[index.row()][index.column()]
+        if role == Qt.DisplayRole:
+            return '' if value is None else str(value)
+        if role == Qt.UserRole:
+            return value
+        if role == Qt.TextAlignmentRole and index.column() in self.numeric_columns:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return QVariant()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.exhausted:
+            return
+        page = self._read_page()
+        if not page:
+            return
+        start = len(self.rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+        self.rows.extend(page)
+        self.endInsertRows()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sort_column = column
+        self.sort_order = order
+        if self.fixed:
+            #정해진 행은 개수가 적으므로 메모리에서 정렬
+            self.layoutAboutToBeChanged.emit()
+            self.rows.sort(key=lambda r: (r[column] is None, r[column], r[self.key_column]),
+                           reverse=order == Qt.DescendingOrder)
+            self.layoutChanged.emit()
+            return
+        self.reload()
@@ -1,29 +1,27 @@
 #web2.py
-from bs4 import BeautifulSoup
-#웹서버 요청
-import urllib.request
+#10개 페이지를 동시에 요청 (사이트 설정은 board_sites.py 참고)
+from board_sites import clien_page_urls, parse_clien_posts
+#이미 본 글은 건너뛰기 (seen_index.py 참고)
+from seen_index import SeenIndex, crawl_new, mark_seen
 
-#파일로 저장
-f = open("clien.txt", "wt", encoding="utf-8")
+#이미 저장한 글 번호 목록
+index = SeenIndex("clien_seen.txt")
 
-#10개 페이지 처리:페이지 처리
-for i in range(0,10):
-    url = "https://www.clien.net/service/board/sold?&od=T31&category=0&po=" + str(i) #i는 정수값
-    print(url)
-    page = urllib.request.urlopen(url)
-    soup = BeautifulSoup(page, "html.parser")
+#10개 페이지 처리:페이지 처리 (결과는 페이지 순서대로)
+#두 번째 실행부터는 이미 저장한 글이 나오는 페이지에서 멈춘다
+posts = crawl_new(clien_page_urls(range(0,10)), parse_clien_posts, index)
 
-    #검색
-    list = soup.find_all("span", attrs={"data-role":"list-title-text"})
-    for tag in list:
-        title = tag.text.strip()
-        print(title)
-        f.write(title + "\n")
+#파일로 저장 (새 글만 뒤에 추가)
+f = open("clien.txt", "at", encoding="utf-8")
+for title, link in posts:
+    print(title)
+    f.write(title + "\n")
 
     #원하는 데이터 추출
 
         
 f.close()
+mark_seen(index, posts)
 
     #<span class="subject">아이폰 12 미니 팝니다
     # </span>
\ No newline at end of file
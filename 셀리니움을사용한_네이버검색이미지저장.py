@@ -1,10 +1,16 @@
 from selenium import webdriver as wb
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-import time
 import os
-#이미지를 저장하기 위한 라이브러리 
-from urllib.request import urlretrieve
+#더 나오지 않을 때까지 스크롤하고 주소를 한 번에 모으기 (naver_image_loader.py 참고)
+from naver_image_loader import load_image_sources
+#이미지를 저장하기 위한 라이브러리 (병렬 다운로드 + 이어받기, image_downloader.py 참고)
+from image_downloader import ImageDownloader
+#같은 그림은 저장하지 않기 (image_dedup.py 참고)
+from image_dedup import DedupIndex
+#받는 즉시 썸네일 만들기 (image_pipeline.py 참고, 필요 없으면 None)
+from image_pipeline import ImagePipeline, format_report
+THUMB_SIZES = {'thumb': 256}
+#모을 이미지 수 (None 이면 끝까지)
+MAX_IMAGES = 500
 
 def createFolder (name) :
     if os.path.isdir(f'./{name}') == False :
@@ -14,28 +20,35 @@ def createFolder (name) :
         print('이미 존재하는 폴더입니다.')
 
 
-input_name = input("검색할 이름:")
-driver = wb.Chrome()
-driver.get(f"https://search.naver.com/search.naver?where=image&sm=tab_jum&query={input_name}")
-#약간의 대기 시간 주기 
-time.sleep(2) 
-for i in range(2) : 
-    driver.find_element(By.CSS_SELECTOR, "body").send_keys(Keys.END)
-    time.sleep(2) 
-print("스크롤 다운 완료")
-img = driver.find_elements(By.CSS_SELECTOR, "._fe_image_tab_content_thumbnail_image") 
+#썸네일 변환은 프로세스 풀을 쓰므로 (윈도우에서는 자식 프로세스가 이 파일을 다시 import 함)
+#실행 코드는 main() 안에 두고 __main__ 일 때만 실행
+def main():
+    input_name = input("검색할 이름:")
+    driver = wb.Chrome()
+    driver.get(f"https://search.naver.com/search.naver?where=image&sm=tab_jum&query={input_name}")
+    #썸네일이 더 나오지 않을 때까지(또는 MAX_IMAGES 개까지) 스크롤
+    #잘못된 주소(data:image)는 빼고 src 목록을 한 번에 가져온다
+    srclst = load_image_sources(driver, target=MAX_IMAGES)
+    print(f"스크롤 다운 완료, 이미지 주소 {len(srclst)}개")
+    #먼저 폴더를 생성 
+    createFolder(input_name) 
+    driver.close() # 브라우저 닫기
+    #.jpg 이미지 파일로 저장 (이미 받은 파일은 건너뜀)
+    items = [(srclst[i], f'{input_name}_{i+1}.jpg') for i in range(len(srclst))]
+    dedup = DedupIndex(f'./{input_name}')
+    dedup.scan_folder()     #이미 폴더에 있는 그림도 비교 대상으로 등록
+    pipeline = ImagePipeline(f'./{input_name}', THUMB_SIZES) if THUMB_SIZES else None
+    with ImageDownloader(f'./{input_name}', dedup=dedup,
+                         on_saved=pipeline.submit if pipeline else None) as downloader:
+        stats = downloader.download_all(items)
+    dedup.close()
+    print(f"받음 {stats['downloaded']} (유사 {stats['near']}), 중복 {stats['duplicate']}, "
+          f"건너뜀 {stats['skipped']}, 실패 {stats['failed']} ({stats['seconds']}초)")
+    if pipeline:
+        pipeline.close()
+        print(format_report(pipeline.report(), stats))
+    print(f'{input_name} 이미지 수집, 저장 작업 완료')
 
-#이미지의 src속성값 가져오기 
-src = [i.get_attribute('src') for i in img] 
-srclst = []
-#잘못된 주소를 가져온 src 데이터를 빼고 src_lst에 담기
-for i in src : 
-    if 'data:image' not in i :
-            srclst.append(i)
-#먼저 폴더를 생성 
-createFolder(input_name) 
-#.jpg 이미지 파일로 저장
-for i in range(len(srclst)) : 
-    urlretrieve(srclst[i], f'./{input_name}/{input_name}_{i+1}.jpg')
-driver.close() # 브라우저 닫기
-print(f'{input_name} 이미지 수집, 저장 작업 완료')
\ No newline at end of file
+
+if __name__ == '__main__':
+    main()
@@ -1,30 +1,25 @@
 # coding:utf-8
-from bs4 import BeautifulSoup
-import urllib.request
-import re 
+from board_sites import clien_page_urls, parse_clien_posts
+from seen_index import SeenIndex, crawl_new, mark_seen
+#여러 검색어를 한 번에 검색 (keyword_matcher.py 참고)
+from keyword_matcher import KeywordMatcher
 
-#User-Agent를 조작하는 경우(아이폰에서 사용하는 사파리 브라우져의 헤더) 
-hdr = {'User-agent':'Mozilla/5.0 (iPhone; CPU iPhone OS 10_3 like Mac OS X) AppleWebKit/603.1.23 (KHTML, like Gecko) Version/10.0 Mobile/14E5239e Safari/602.1'}
+#관심 검색어 목록 (필요한 만큼 추가)
+WATCH_KEYWORDS = ['아이폰']
+matcher = KeywordMatcher(WATCH_KEYWORDS)
 
-for n in range(0,10):
-        #클리앙의 중고장터 주소 
-        data ='https://www.clien.net/service/board/sold?&od=T31&po=' + str(n)
-        #웹브라우져 헤더 추가 
-        req = urllib.request.Request(data, \
-                                    headers = hdr)
-        data = urllib.request.urlopen(req).read()
-        #한글이 깨지는 경우 디코딩 utf-8로
-        page = data.decode('utf-8', 'ignore')
-        soup = BeautifulSoup(page, 'html.parser')
-        list = soup.find_all('span', attrs={'data-role':'list-title-text'})
+#이미 확인한 글 번호 목록 (다음 실행부터는 새 글만 검색)
+index = SeenIndex("clien_keyword_seen.txt")
 
-        for item in list:
-                try:
-                        title = item.text.strip()
-                        if (re.search('아이폰', title)):
-                                print(title.strip())
-                                #print('https://www.clien.net'  + item['href'])
-                except:
-                        pass
-        
- 
+#10개 페이지를 동시에 요청하고 제목은 페이지 순서대로 받음 (board_fetcher.py 참고)
+#두 번째 실행부터는 이미 확인한 글이 나오는 페이지에서 멈춤
+list = crawl_new(clien_page_urls(range(0,10)), parse_clien_posts, index)
+
+for title, link in list:
+        #제목 한 번 훑어서 걸린 검색어 모두 표시
+        hits = matcher.match(title)
+        if hits:
+                print(title.strip(), hits)
+                #print(link)
+
+mark_seen(index, list)